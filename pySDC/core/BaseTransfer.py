@@ -1,11 +1,15 @@
 import logging
 
+import numpy as np
 import scipy.sparse as sp
 
 from pySDC.core.Errors import UnlockError
 from pySDC.helpers.pysdc_helper import FrozenClass
 from pySDC.core import LagrangeApproximation
 
+# read-only transfer matrices between sets of collocation nodes computed in this process
+_transfer_matrix_Q_cache = {}
+
 
 # short helper class to add params as attributes
 class _Pars(FrozenClass):
@@ -73,10 +77,51 @@ class base_transfer(object):
             c_nodes: coarse nodes (size nC)
 
         Returns:
-            matrix containing the interpolation weights (shape (nF, nC))
+            matrix containing the interpolation weights (shape (nF, nC)), read-only since it is shared
+        """
+        f_nodes = np.asarray(f_nodes, dtype=float)
+        c_nodes = np.asarray(c_nodes, dtype=float)
+        key = (f_nodes.tobytes(), c_nodes.tobytes())
+
+        if key not in _transfer_matrix_Q_cache:
+            approx = LagrangeApproximation(c_nodes)
+            matrix = approx.getInterpolationMatrix(f_nodes)
+            matrix.setflags(write=False)
+            _transfer_matrix_Q_cache[key] = matrix
+
+        return _transfer_matrix_Q_cache[key]
+
+    @staticmethod
+    def combine_nodes(matrix, values, dtype, init):
         """
-        approx = LagrangeApproximation(c_nodes)
-        return approx.getInterpolationMatrix(f_nodes)
+        Helper routine to combine values at a set of nodes with a collocation transfer matrix
+
+        Values based on numpy arrays are stacked and combined with a single matrix product, others term by term.
+
+        Args:
+            matrix (numpy.ndarray): the transfer matrix (shape (nTarget, nSource))
+            values (list): the values at the source nodes
+            dtype: data type of the results
+            init: initialization for the data type
+
+        Returns:
+            list: the values at the target nodes
+        """
+        if all(type(me) is type(values[0]) and isinstance(me, np.ndarray) for me in values):
+            stacked = np.stack([me.view(np.ndarray) for me in values]).reshape(len(values), -1)
+            result = []
+            for row in matrix.dot(stacked):
+                me = dtype(init)
+                me[:] = row.reshape(me.shape)
+                result.append(me)
+            return result
+
+        result = []
+        for n in range(matrix.shape[0]):
+            result.append(matrix[n, 0] * values[0])
+            for m in range(1, len(values)):
+                result[-1] += matrix[n, m] * values[m]
+        return result
 
     def restrict(self):
         """
@@ -102,16 +147,11 @@ class base_transfer(object):
             raise UnlockError('fine level is still locked, cannot use data from there')
 
         # restrict fine values in space
-        tmp_u = []
-        for m in range(1, SF.coll.num_nodes + 1):
-            tmp_u.append(self.space_transfer.restrict(F.u[m]))
+        tmp_u = self.space_transfer.restrict_nodes(F.u)
 
         # restrict collocation values
-        G.u[0] = self.space_transfer.restrict(F.u[0])
-        for n in range(1, SG.coll.num_nodes + 1):
-            G.u[n] = self.Rcoll[n - 1, 0] * tmp_u[0]
-            for m in range(1, SF.coll.num_nodes):
-                G.u[n] += self.Rcoll[n - 1, m] * tmp_u[m]
+        G.u[0] = tmp_u[0]
+        G.u[1:] = self.combine_nodes(self.Rcoll, tmp_u[1:], PG.dtype_u, PG.init)
 
         # re-evaluate f on coarse level
         G.f[0] = PG.eval_f(G.u[0], G.time)
@@ -124,35 +164,17 @@ class base_transfer(object):
         # build fine level tau correction part
         tauF = F.sweep.integrate()
 
-        # restrict fine level tau correction part in space
-        tmp_tau = []
-        for m in range(SF.coll.num_nodes):
-            tmp_tau.append(self.space_transfer.restrict(tauF[m]))
+        # add possible tau correction from fine, restriction is linear so we can restrict both at once
+        if F.tau[0] is not None:
+            tauF = [tauF[m] + F.tau[m] for m in range(SF.coll.num_nodes)]
 
-        # restrict fine level tau correction part in collocation
-        tauFG = []
-        for n in range(1, SG.coll.num_nodes + 1):
-            tauFG.append(self.Rcoll[n - 1, 0] * tmp_tau[0])
-            for m in range(1, SF.coll.num_nodes):
-                tauFG[-1] += self.Rcoll[n - 1, m] * tmp_tau[m]
+        # restrict fine level tau correction part in space and in collocation
+        tauFG = self.combine_nodes(self.Rcoll, self.space_transfer.restrict_nodes(tauF), PG.dtype_u, PG.init)
 
         # build tau correction
         for m in range(SG.coll.num_nodes):
             G.tau[m] = tauFG[m] - tauG[m]
 
-        if F.tau[0] is not None:
-            # restrict possible tau correction from fine in space
-            tmp_tau = []
-            for m in range(SF.coll.num_nodes):
-                tmp_tau.append(self.space_transfer.restrict(F.tau[m]))
-
-            # restrict possible tau correction from fine in collocation
-            for n in range(SG.coll.num_nodes):
-                for m in range(SF.coll.num_nodes):
-                    G.tau[n] += self.Rcoll[n, m] * tmp_tau[m]
-        else:
-            pass
-
         # save u and rhs evaluations for interpolation
         for m in range(1, SG.coll.num_nodes + 1):
             G.uold[m] = PG.dtype_u(G.u[m])
@@ -187,14 +209,12 @@ class base_transfer(object):
         # build coarse correction
 
         # interpolate values in space first
-        tmp_u = []
-        for m in range(1, SG.coll.num_nodes + 1):
-            tmp_u.append(self.space_transfer.prolong(G.u[m] - G.uold[m]))
+        tmp_u = self.space_transfer.prolong_nodes([G.u[m] - G.uold[m] for m in range(1, SG.coll.num_nodes + 1)])
 
         # interpolate values in collocation
+        corr_u = self.combine_nodes(self.Pcoll, tmp_u, PF.dtype_u, PF.init)
         for n in range(1, SF.coll.num_nodes + 1):
-            for m in range(SG.coll.num_nodes):
-                F.u[n] += self.Pcoll[n - 1, m] * tmp_u[m]
+            F.u[n] += corr_u[n - 1]
 
         # re-evaluate f on fine level
         for m in range(1, SF.coll.num_nodes + 1):
@@ -214,6 +234,8 @@ class base_transfer(object):
         F = self.fine
         G = self.coarse
 
+        PF = F.prob
+
         SF = F.sweep
         SG = G.sweep
 
@@ -224,16 +246,14 @@ class base_transfer(object):
         # build coarse correction
 
         # interpolate values in space first
-        tmp_u = []
-        tmp_f = []
-        for m in range(1, SG.coll.num_nodes + 1):
-            tmp_u.append(self.space_transfer.prolong(G.u[m] - G.uold[m]))
-            tmp_f.append(self.space_transfer.prolong(G.f[m] - G.fold[m]))
+        tmp_u = self.space_transfer.prolong_nodes([G.u[m] - G.uold[m] for m in range(1, SG.coll.num_nodes + 1)])
+        tmp_f = self.space_transfer.prolong_nodes([G.f[m] - G.fold[m] for m in range(1, SG.coll.num_nodes + 1)])
 
         # interpolate values in collocation
+        corr_u = self.combine_nodes(self.Pcoll, tmp_u, PF.dtype_u, PF.init)
+        corr_f = self.combine_nodes(self.Pcoll, tmp_f, PF.dtype_f, PF.init)
         for n in range(1, SF.coll.num_nodes + 1):
-            for m in range(SG.coll.num_nodes):
-                F.u[n] += self.Pcoll[n - 1, m] * tmp_u[m]
-                F.f[n] += self.Pcoll[n - 1, m] * tmp_f[m]
+            F.u[n] += corr_u[n - 1]
+            F.f[n] += corr_f[n - 1]
 
         return None
@@ -7,6 +7,9 @@ from pySDC.core.Nodes import NodesGenerator
 from pySDC.core.Errors import CollocationError
 from pySDC.core import LagrangeApproximation
 
+# read-only nodes, weights and matrices of the collocation objects created in this process
+_collocation_cache = {}
+
 
 class CollBase(object):
     """
@@ -57,6 +60,9 @@ class CollBase(object):
     | CollGaussRadau_Right    | LEGENDRE  | RADAU-RIGHT | False     |
     +-------------------------+-----------+-------------+-----------+
 
+    Nodes, weights and matrices are computed only once per process for each set of parameters and are shared
+    read-only by all collocation objects with these parameters.
+
     Attributes:
         num_nodes (int): number of collocation nodes
         tleft (float): left interval point
@@ -109,11 +115,21 @@ class CollBase(object):
             elif quad_type == 'LOBATTO':
                 self.order = 2 * num_nodes - 2
 
-        self.nodes = self._getNodes
-        self.weights = self._getWeights(tleft, tright)
-        self.Qmat = self._gen_Qmatrix_spline if useSpline else self._gen_Qmatrix
-        self.Smat = self._gen_Smatrix
-        self.delta_m = self._gen_deltas
+        # nodes, weights and matrices depend only on these parameters, so we compute them once and share them
+        key = (type(self), num_nodes, float(np.ravel(tleft)[0]), float(np.ravel(tright)[0]), node_type, quad_type,
+               useSpline)
+        if key not in _collocation_cache:
+            self.nodes = self._getNodes
+            self.weights = self._getWeights(tleft, tright)
+            self.Qmat = self._gen_Qmatrix_spline if useSpline else self._gen_Qmatrix
+            self.Smat = self._gen_Smatrix
+            self.delta_m = self._gen_deltas
+
+            for array in [self.nodes, self.weights, self.Qmat, self.Smat, self.delta_m]:
+                array.setflags(write=False)
+            _collocation_cache[key] = (self.nodes, self.weights, self.Qmat, self.Smat, self.delta_m)
+
+        self.nodes, self.weights, self.Qmat, self.Smat, self.delta_m = _collocation_cache[key]
         self.left_is_node = quad_type in ['LOBATTO', 'RADAU-LEFT']
         self.right_is_node = quad_type in ['LOBATTO', 'RADAU-RIGHT']
 
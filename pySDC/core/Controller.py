@@ -20,6 +20,10 @@ class _Pars(FrozenClass):
         self.dump_setup = True
         self.fname = 'run_pid' + str(os.getpid()) + '.log'
         self.use_iteration_estimator = False
+        self.share_operators = False
+        self.stats_file = None
+        self.stats_chunk_size = 100000
+        self.stats_background_writer = False
 
         for k, v in params.items():
             setattr(self, k, v)
@@ -51,6 +55,11 @@ class controller(object):
         self.__setup_custom_logger(self.params.logger_level, self.params.log_to_file, self.params.fname)
         self.logger = logging.getLogger('controller')
 
+        # stream the statistics to a file for long runs
+        if self.params.stats_file is not None:
+            self.hooks.stream_stats(fname=self.params.stats_file, chunk_size=self.params.stats_chunk_size,
+                                    background=self.params.stats_background_writer)
+
         if self.params.use_iteration_estimator and self.params.all_to_done:
             self.logger.warning('all_to_done and use_iteration_estimator set, will ignore all_to_done')
 
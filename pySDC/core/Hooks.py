@@ -1,6 +1,8 @@
 import logging
 import time
-from collections import namedtuple
+
+from pySDC.helpers.stats_helper import StatsStore
+from pySDC.helpers.stats_stream import StatsWriter
 
 
 # noinspection PyUnusedLocal,PyShadowingBuiltins,PyShadowingNames
@@ -24,8 +26,8 @@ class hooks(object):
         __t1_setup (float): private variable to get end time of setup
         __t1_comm (list): private variable to hold timing of the communication (!)
         logger: logger instance for output
-        __stats (dict): dictionary for gathering the statistics of a run
-        __entry (namedtuple): statistics entry containign all information to identify the value
+        __stats (StatsStore): store for gathering the statistics of a run
+        __stream_params (dict): parameters for streaming the statistics to a file, None to keep them in memory
     """
 
     def __init__(self):
@@ -49,13 +51,13 @@ class hooks(object):
 
         self.logger = logging.getLogger('hooks')
 
-        # create statistics and entry elements
-        self.__stats = {}
-        self.__entry = namedtuple('Entry', ['process', 'time', 'level', 'iter', 'sweep', 'type'])
+        # create statistics store
+        self.__stream_params = None
+        self.__stats = StatsStore()
 
     def add_to_stats(self, process, time, level, iter, sweep, type, value):
         """
-        Routine to add data to the statistics dict
+        Routine to add data to the statistics
 
         Args:
             process: the current process recording this data
@@ -66,8 +68,7 @@ class hooks(object):
             type (str): string to describe the type of value
             value: the actual data
         """
-        # create named tuple for the key and add to dict
-        self.__stats[self.__entry(process=process, time=time, level=level, iter=iter, sweep=sweep, type=type)] = value
+        self.__stats.append(process=process, time=time, level=level, iter=iter, sweep=sweep, type=type, value=value)
 
     def increment_stats(self, process, time, level, iter, sweep, type, value, initialize=None):
         """
@@ -84,28 +85,49 @@ class hooks(object):
             value: the actual data
             initialize: if supplied and data does not exist already, this will be used over value
         """
-        key = self.__entry(process=process, time=time, level=level, iter=iter, sweep=sweep, type=type)
-        if key in self.__stats.keys():
-            self.__stats[key] += value
-        elif initialize is not None:
-            self.__stats[key] = initialize
-        else:
-            self.__stats[key] = value
+        self.__stats.increment(process=process, time=time, level=level, iter=iter, sweep=sweep, type=type,
+                               value=value, initialize=initialize)
 
     def return_stats(self):
         """
         Getter for the stats
 
         Returns:
-            dict: stats
+            StatsStore: stats, can be used like a dictionary
         """
+        if isinstance(self.__stats, StatsWriter):
+            # entries can be written again after they have been flushed, e.g. after restarts
+            return self.__stats.read(unique=True)
         return self.__stats
 
+    def close_stats(self):
+        """
+        Write the remaining statistics and close the file at the end of a run, if they are streamed to a file
+        """
+        if isinstance(self.__stats, StatsWriter):
+            self.__stats.close()
+
     def reset_stats(self):
         """
         Function to reset the stats for multiple runs
         """
-        self.__stats = {}
+        self.close_stats()
+
+        if self.__stream_params is None:
+            self.__stats = StatsStore()
+        else:
+            self.__stats = StatsWriter(**self.__stream_params)
+
+    def stream_stats(self, fname, chunk_size=100000, background=False):
+        """
+        Write the statistics of the following runs in chunks to a file instead of keeping them in memory
+
+        Args:
+            fname (str): name of the file, will be overwritten with each run
+            chunk_size (int): number of entries to keep in memory before writing them
+            background (bool): write the chunks in a background thread
+        """
+        self.__stream_params = {'fname': fname, 'chunk_size': chunk_size, 'background': background}
 
     def pre_setup(self, step, level_number):
         """
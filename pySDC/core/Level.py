@@ -1,4 +1,5 @@
 from pySDC.helpers.pysdc_helper import FrozenClass
+from pySDC.implementations.datatype_classes.mesh_stack import mesh_stack
 
 
 # short helper class to add params as attributes
@@ -9,6 +10,7 @@ class _Pars(FrozenClass):
         self.restol = -1.0
         self.nsweeps = 1
         self.residual_type = 'full_abs'
+        self.stack_nodes = False
         for k, v in params.items():
             setattr(self, k, v)
         # freeze class, no further attributes allowed from this point
@@ -21,6 +23,7 @@ class _Pars(FrozenClass):
 class _Status(FrozenClass):
     def __init__(self):
         self.residual = None
+        self.residual_members = None
         self.unlocked = False
         self.updated = False
         self.time = None
@@ -49,6 +52,9 @@ class level(FrozenClass):
         f (list of dtype_f): RHS values at the nodes
         fold (list of dtype_f): copy of RHS values for saving data during restriction
         tau (list of dtype_u): FAS correction, allocated via step class if necessary
+
+    If the level parameter stack_nodes is set, u, uold, f, fold and tau are mesh_stack objects instead of lists, i.e.
+    all nodes share one contiguous array while the entries can still be accessed like list items.
     """
 
     def __init__(self, problem_class, problem_params, sweeper_class, sweeper_params, level_params, level_index):
@@ -77,12 +83,12 @@ class level(FrozenClass):
 
         # empty data at the nodes, the right end point and tau
         self.uend = None
-        self.u = [None] * (self.sweep.coll.num_nodes + 1)
-        self.uold = [None] * (self.sweep.coll.num_nodes + 1)
-        self.f = [None] * (self.sweep.coll.num_nodes + 1)
-        self.fold = [None] * (self.sweep.coll.num_nodes + 1)
+        self.u = self.__get_node_storage(self.prob.dtype_u, self.sweep.coll.num_nodes + 1)
+        self.uold = self.__get_node_storage(self.prob.dtype_u, self.sweep.coll.num_nodes + 1)
+        self.f = self.__get_node_storage(self.prob.dtype_f, self.sweep.coll.num_nodes + 1)
+        self.fold = self.__get_node_storage(self.prob.dtype_f, self.sweep.coll.num_nodes + 1)
 
-        self.tau = [None] * self.sweep.coll.num_nodes
+        self.tau = self.__get_node_storage(self.prob.dtype_u, self.sweep.coll.num_nodes)
 
         # pass this level to the sweeper for easy access
         self.sweep.level = self
@@ -102,11 +108,32 @@ class level(FrozenClass):
 
         # all data back to None
         self.uend = None
-        self.u = [None] * (self.sweep.coll.num_nodes + 1)
-        self.uold = [None] * (self.sweep.coll.num_nodes + 1)
-        self.f = [None] * (self.sweep.coll.num_nodes + 1)
-        self.fold = [None] * (self.sweep.coll.num_nodes + 1)
-        self.tau = [None] * self.sweep.coll.num_nodes
+        if self.params.stack_nodes:
+            # keep the storage, just mark all entries as empty
+            for data in [self.u, self.uold, self.f, self.fold, self.tau]:
+                data.reset()
+        else:
+            self.u = [None] * (self.sweep.coll.num_nodes + 1)
+            self.uold = [None] * (self.sweep.coll.num_nodes + 1)
+            self.f = [None] * (self.sweep.coll.num_nodes + 1)
+            self.fold = [None] * (self.sweep.coll.num_nodes + 1)
+            self.tau = [None] * self.sweep.coll.num_nodes
+
+    def __get_node_storage(self, dtype, num_entries):
+        """
+        Helper routine to allocate empty storage for values at the nodes
+
+        Args:
+            dtype: data type of the values
+            num_entries (int): number of values
+
+        Returns:
+            list or mesh_stack: empty storage, depending on the level parameter stack_nodes
+        """
+        if self.params.stack_nodes:
+            return mesh_stack(self.prob.init, dtype, num_entries)
+        else:
+            return [None] * num_entries
 
     @property
     def sweep(self):
@@ -1,5 +1,10 @@
 import logging
+import threading
+from collections import OrderedDict
+
 import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator
 from scipy.special import factorial
 
 from pySDC.helpers.pysdc_helper import FrozenClass
@@ -15,6 +20,82 @@ class _Pars(FrozenClass):
         self._freeze()
 
 
+class FactorizationCache(object):
+    """
+    Bounded least-recently-used cache for factorizations of linear systems like (I - factor * A)
+
+    Within a run only a few distinct factors occur per level (one per diagonal entry of QI), so factorizing these
+    systems once and reusing them saves most of the work in linear solve_system routines.
+
+    Attributes:
+        maxsize (int): maximal number of factorizations kept
+        hits (int): number of lookups served from the cache
+        misses (int): number of lookups which required a new factorization
+    """
+
+    def __init__(self, maxsize):
+        """
+        Initialization routine
+
+        Args:
+            maxsize (int): maximal number of factorizations kept
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__data = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__data)
+
+    def __getstate__(self):
+        """
+        Factorizations (e.g. SuperLU objects) and locks cannot be pickled, so copies start with an empty cache
+        """
+        return {'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
+
+    def __setstate__(self, state):
+        self.__init__(state['maxsize'])
+        self.hits = state['hits']
+        self.misses = state['misses']
+
+    def get(self, key, factorize):
+        """
+        Get the factorization for the key, compute and store it if it is not available
+
+        Args:
+            key: hashable key identifying the system, e.g. the factor
+            factorize: function without arguments returning the factorization
+
+        Returns:
+            the factorization
+        """
+        with self.__lock:
+            if key in self.__data:
+                self.hits += 1
+                self.__data.move_to_end(key)
+                return self.__data[key]
+            self.misses += 1
+
+        value = factorize()
+
+        with self.__lock:
+            self.__data[key] = value
+            self.__data.move_to_end(key)
+            while len(self.__data) > self.maxsize:
+                self.__data.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        """
+        Remove all factorizations, keeping the counters
+        """
+        with self.__lock:
+            self.__data.clear()
+
+
 class ptype(object):
     """
     Prototype class for problems, just defines the attributes essential to get started
@@ -25,6 +106,7 @@ class ptype(object):
         init: number of degrees-of-freedom (whatever this may represent)
         dtype_u: variable data type
         dtype_f: RHS data type
+        factorization_cache (FactorizationCache): cache for factorizations, None if the problem does not use it
     """
 
     def __init__(self, init, dtype_u, dtype_f, params):
@@ -48,12 +130,86 @@ class ptype(object):
         self.dtype_u = dtype_u
         self.dtype_f = dtype_f
 
+        # linear problems can opt into caching their factorizations, see setup_factorization_cache
+        self.factorization_cache = None
+
+    def setup_factorization_cache(self, maxsize=16):
+        """
+        Enable caching of factorizations for this problem, to be called by linear problem classes during initialization
+
+        The size of the cache can be overridden by the parameter factorization_cache_size, a size of 0 disables it.
+
+        Args:
+            maxsize (int): default maximal number of factorizations kept
+        """
+        if hasattr(self.params, 'factorization_cache_size'):
+            maxsize = self.params.factorization_cache_size
+        self.factorization_cache = FactorizationCache(maxsize) if maxsize > 0 else None
+
+    def get_factorization(self, factor, factorize, key=None):
+        """
+        Get the factorization for the given factor, using the cache if enabled
+
+        Args:
+            factor (float): abbrev. for the local stepsize (or any other factor required)
+            factorize: function without arguments returning the factorization
+            key: additional hashable key, if the system does not only depend on the factor (e.g. switching states)
+
+        Returns:
+            the factorization
+        """
+        if self.factorization_cache is None:
+            return factorize()
+        return self.factorization_cache.get((factor, key), factorize)
+
+    def reset_factorization_cache(self):
+        """
+        Drop all cached factorizations, e.g. because the step size changed
+        """
+        if self.factorization_cache is not None:
+            self.factorization_cache.clear()
+
     def eval_f(self, u, t):
         """
         Abstract interface to RHS computation of the ODE
         """
         raise NotImplementedError('ERROR: problem has to implement eval_f(self, u, t)')
 
+    def eval_f_batch(self, U, times):
+        """
+        Interface to RHS computation for several values at once, e.g. at all collocation nodes
+
+        Problems for which this is cheaper than separate evaluations (e.g. with one FFT over all values) can override
+        this, the default evaluates the RHS one value after another.
+
+        Args:
+            U (list of dtype_u): current values
+            times (list of float): current times
+
+        Returns:
+            list of dtype_f: the RHS for each value
+        """
+        return [self.eval_f(u, t) for u, t in zip(U, times)]
+
+    def solve_system_batch(self, rhs, factors, u0, t):
+        """
+        Interface to the solution of several systems of the form u - factor * f(u) = rhs at once, e.g. for all
+        collocation nodes
+
+        Problems for which this is cheaper than separate solves can override this, the default calls solve_system for
+        one system after another.
+
+        Args:
+            rhs (list): right-hand sides for the systems
+            factors (list): factors for each system
+            u0 (list): initial guesses for iterative solvers
+            t (list): current times
+
+        Returns:
+            list of dtype_u: the solutions
+        """
+        return [self.solve_system(*args) for args in zip(rhs, factors, u0, t)]
+
     def apply_mass_matrix(self, u):
         """
         Abstract interface to apply mass matrix (only needed for FEM)
@@ -98,3 +254,138 @@ else, you can also give specific steps.')
     coeff = np.linalg.solve(A, sol)
 
     return coeff, zero_pos, steps
+
+
+class StencilOperator(object):
+    """
+    Matrix-free finite difference operator on a periodic grid, applying the same stencil along each dimension
+
+    The operator is applied by adding up shifted slices of the data, which is faster than a sparse matrix-vector product
+    and does not need to store the matrix. The assembled matrix is built on demand, e.g. for direct solvers.
+
+    Attributes:
+        shape (tuple): shape of the grid
+        coeff (numpy.ndarray): coefficients of the stencil, including the scaling
+        steps (numpy.ndarray): offsets of the grid points belonging to the coefficients
+    """
+
+    def __init__(self, shape, coeff, steps, factor=1.0):
+        """
+        Initialization routine
+
+        Args:
+            shape (tuple): shape of the grid
+            coeff (list): coefficients of the stencil
+            steps (list): offsets of the grid points belonging to the coefficients
+            factor (float): scaling of the coefficients, e.g. to include the grid spacing
+        """
+        self.shape = tuple(np.atleast_1d(shape))
+        self.coeff = np.asarray(coeff, dtype=float) * factor
+        self.steps = np.asarray(steps, dtype=int)
+        self.__matrix = None
+
+    @classmethod
+    def from_derivative(cls, shape, derivative, order, type='center', factor=1.0):
+        """
+        Set up the operator from the stencil computed by get_finite_difference_stencil
+
+        Args:
+            shape (tuple): shape of the grid
+            derivative (int): order of the derivative
+            order (int): order of accuracy
+            type (str): type of the stencil, "center", "forward" or "backward"
+            factor (float): scaling of the coefficients, e.g. to include the grid spacing
+
+        Returns:
+            StencilOperator: the operator
+        """
+        coeff, _, steps = get_finite_difference_stencil(derivative=derivative, order=order, type=type)
+        return cls(shape, coeff, steps, factor=factor)
+
+    def apply(self, u):
+        """
+        Apply the operator to data on the grid
+
+        Args:
+            u (numpy.ndarray): the data, either in the shape of the grid or flattened
+
+        Returns:
+            numpy.ndarray: the result in the shape of the grid
+        """
+        u = np.asarray(u).reshape(self.shape)
+        result = np.zeros(self.shape, dtype=np.result_type(u, self.coeff))
+
+        for axis, n in enumerate(self.shape):
+            for coeff, step in zip(self.coeff, self.steps):
+                if coeff == 0:
+                    continue
+
+                # result[i] += coeff * u[i + step] with periodic wrap-around, done in (at most) two slices
+                shift = step % n
+                for target, source in [(slice(0, n - shift), slice(shift, n)), (slice(n - shift, n), slice(0, shift))]:
+                    if target.start < target.stop:
+                        index = (slice(None),) * axis
+                        result[index + (target,)] += coeff * u[index + (source,)]
+
+        return result
+
+    def dot(self, u):
+        """
+        Apply the operator to flattened data, like a matrix
+
+        Args:
+            u (numpy.ndarray): the flattened data
+
+        Returns:
+            numpy.ndarray: the flattened result
+        """
+        return self.apply(u).reshape(-1)
+
+    @property
+    def matrix(self):
+        """
+        Getter for the assembled operator, which is built only once
+
+        Returns:
+            scipy.sparse.csc_matrix: the operator as sparse matrix, acting on flattened data
+        """
+        if self.__matrix is None:
+            A = sp.csc_matrix((np.prod(self.shape), np.prod(self.shape)))
+            for axis, n in enumerate(self.shape):
+                A1 = sp.csc_matrix((n, n))
+                for coeff, step in zip(self.coeff, self.steps):
+                    shift = step % n
+                    A1 += sp.diags([coeff, coeff], [shift, shift - n], shape=(n, n)) if shift > 0 else coeff * sp.eye(n)
+                left = sp.eye(int(np.prod(self.shape[:axis])))
+                right = sp.eye(int(np.prod(self.shape[axis + 1:])))
+                A += sp.kron(sp.kron(left, A1), right)
+            self.__matrix = sp.csc_matrix(A)
+        return self.__matrix
+
+    @property
+    def symbol(self):
+        """
+        Getter for the eigenvalues of the operator, as used by spectral solvers
+
+        Returns:
+            numpy.ndarray: the eigenvalues, sorted like the coefficients of numpy.fft.rfftn
+        """
+        symbol = np.zeros(self.shape[:-1] + (self.shape[-1] // 2 + 1,), dtype=complex)
+        for axis, n in enumerate(self.shape):
+            freq = np.arange(symbol.shape[axis])
+            symbol1 = sum(coeff * np.exp(2j * np.pi * freq * step / n) for coeff, step in zip(self.coeff, self.steps))
+            symbol += symbol1.reshape([-1 if i == axis else 1 for i in range(len(self.shape))])
+        return symbol
+
+    def get_system_operator(self, factor):
+        """
+        Get I - factor * A as matrix-free linear operator, e.g. for Krylov solvers
+
+        Args:
+            factor (float): abbrev. for the local stepsize (or any other factor required)
+
+        Returns:
+            scipy.sparse.linalg.LinearOperator: the operator, acting on flattened data
+        """
+        size = int(np.prod(self.shape))
+        return LinearOperator((size, size), matvec=lambda v: v.reshape(-1) - factor * self.dot(v), dtype=float)
@@ -25,8 +25,12 @@ class space_transfer(object):
         logger: custom logger for transfer-related logging
         fine_prob (pySDC.Problem.ptype): reference to the fine problem
         coarse_prob (pySDC.Problem.ptype): reference to the coarse problem
+        shared_operators (list): names of the attributes holding matrices which are not changed during the run, so they
+                                 can be shared by multiple steps
     """
 
+    shared_operators = []
+
     def __init__(self, fine_prob, coarse_prob, space_transfer_params):
         """
         Initialization routine
@@ -63,3 +67,27 @@ class space_transfer(object):
             G: the coarse level data (easier to access than via the coarse attribute)
         """
         raise NotImplementedError('ERROR: space_transfer has to implement prolong(self, G)')
+
+    def restrict_nodes(self, F):
+        """
+        Restriction in space of the values at multiple nodes, can be overridden to restrict all of them at once
+
+        Args:
+            F (list): the fine level data at the nodes
+
+        Returns:
+            list: the coarse level data at the nodes
+        """
+        return [self.restrict(me) for me in F]
+
+    def prolong_nodes(self, G):
+        """
+        Prolongation in space of the values at multiple nodes, can be overridden to prolong all of them at once
+
+        Args:
+            G (list): the coarse level data at the nodes
+
+        Returns:
+            list: the fine level data at the nodes
+        """
+        return [self.prolong(me) for me in G]
@@ -1,8 +1,11 @@
 import logging
 
+import scipy.sparse as sp
+
 from pySDC.core import Level as levclass
 from pySDC.core.BaseTransfer import base_transfer
 from pySDC.core.Errors import ParameterError
+from pySDC.core.Problem import StencilOperator
 from pySDC.helpers.pysdc_helper import FrozenClass
 
 
@@ -210,6 +213,30 @@ class step(FrozenClass):
         else:
             self.__transfer_dict[(coarse_level, fine_level)] = self.base_transfer.prolong
 
+    def get_shared_operators(self):
+        """
+        Routine to gather the heavy objects of this step, which are not changed during the run and can hence be shared
+        by multiple steps: collocation objects, the matrices listed in shared_operators of the sweepers and space
+        transfers, sparse matrices and stencil operators of the problems and caches of their factorizations
+
+        Returns:
+            list: the shared objects
+        """
+        operators = []
+        for L in self.levels:
+            operators.append(L.sweep.coll)
+            operators += [getattr(L.sweep, name) for name in L.sweep.shared_operators]
+            operators += [v for v in vars(L.prob).values() if sp.issparse(v) or isinstance(v, StencilOperator)]
+            if L.prob.factorization_cache is not None:
+                operators.append(L.prob.factorization_cache)
+
+        for base_transfer in {transfer.__self__ for transfer in self.__transfer_dict.values()}:
+            operators += [base_transfer.Rcoll, base_transfer.Pcoll]
+            space_transfer = base_transfer.space_transfer
+            operators += [getattr(space_transfer, name) for name in space_transfer.shared_operators]
+
+        return operators
+
     def transfer(self, source, target):
         """
         Wrapper routine to ease the call of the transfer functions
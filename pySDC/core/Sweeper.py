@@ -1,4 +1,6 @@
+import hashlib
 import logging
+import os
 
 import numpy as np
 import scipy.linalg
@@ -11,6 +13,12 @@ from pySDC.implementations.collocation_classes.equidistant_right import Equidist
 from pySDC.implementations.collocation_classes.gauss_lobatto import CollGaussLobatto
 from pySDC.implementations.collocation_classes.gauss_radau_right import CollGaussRadau_Right
 
+# types of implicit preconditioners computed by optimization, which are stored on disk if a cache directory is given
+OPTIMIZED_QD_TYPES = ['MIN']
+
+# implicit preconditioners computed in this process, with the flag whether they are parallelizable
+_Qdelta_implicit_cache = {}
+
 
 # short helper class to add params as attributes
 class _Pars(FrozenClass):
@@ -18,6 +26,7 @@ class _Pars(FrozenClass):
 
         self.do_coll_update = False
         self.initial_guess = 'spread'
+        self.Qdelta_cache_dir = None
 
         for k, v in pars.items():
             if k != 'collocation_class':
@@ -34,8 +43,12 @@ class sweeper(object):
         logger: custom logger for sweeper-related logging
         params (__Pars): parameter object containing the custom parameters passed by the user
         coll (pySDC.Collocation.CollBase): collocation object
+        shared_operators (list): names of the attributes holding matrices which are not changed during the run, so they
+                                 can be shared by multiple steps
     """
 
+    shared_operators = []
+
     def __init__(self, params):
         """
         Initialization routine for the base sweeper
@@ -73,6 +86,50 @@ class sweeper(object):
         self.parallelizable = False
 
     def get_Qdelta_implicit(self, coll, qd_type):
+        """
+        Get the implicit preconditioner, which is computed only once per process for each collocation and type
+
+        Preconditioners computed by optimization are in addition stored in the directory Qdelta_cache_dir, if given.
+
+        Args:
+            coll (pySDC.Collocation.CollBase): collocation object
+            qd_type (str): type of the preconditioner
+
+        Returns:
+            numpy.ndarray: the preconditioner
+        """
+        # the collocation is identified by its class and its nodes and matrix
+        digest = hashlib.sha1(np.ascontiguousarray(coll.nodes).tobytes() + np.ascontiguousarray(coll.Qmat).tobytes())
+        key = (type(coll).__name__, coll.num_nodes, qd_type, digest.hexdigest())
+
+        if key not in _Qdelta_implicit_cache:
+            cache_dir = self.params.Qdelta_cache_dir if qd_type in OPTIMIZED_QD_TYPES else None
+            fname = None if cache_dir is None else os.path.join(cache_dir, 'Qdelta_%s_%i_%s_%s.npz' % key)
+
+            if fname is not None and os.path.isfile(fname):
+                with np.load(fname) as data:
+                    _Qdelta_implicit_cache[key] = (data['QDmat'], bool(data['parallelizable']))
+            else:
+                # find out if this preconditioner alone makes the sweeper parallelizable
+                parallelizable = self.parallelizable
+                self.parallelizable = False
+                QDmat = self.__compute_Qdelta_implicit(coll, qd_type)
+                _Qdelta_implicit_cache[key] = (QDmat, self.parallelizable)
+
+                if fname is not None:
+                    # write to a temporary file first, since other processes may read the file at the same time
+                    os.makedirs(cache_dir, exist_ok=True)
+                    tmp_fname = '%s.%i.tmp.npz' % (fname[:-4], os.getpid())
+                    np.savez(tmp_fname, QDmat=QDmat, parallelizable=self.parallelizable)
+                    os.replace(tmp_fname, fname)
+
+                self.parallelizable = parallelizable
+
+        QDmat, parallelizable = _Qdelta_implicit_cache[key]
+        self.parallelizable = self.parallelizable or parallelizable
+        return QDmat.copy()
+
+    def __compute_Qdelta_implicit(self, coll, qd_type):
 
         def rho(x):
             return max(abs(np.linalg.eigvals(np.eye(m) - np.diag([x[i] for i in range(m)]).dot(coll.Qmat[1:, 1:]))))
@@ -238,24 +295,32 @@ class sweeper(object):
         L = self.level
         P = L.prob
 
-        # evaluate RHS at left point
-        L.f[0] = P.eval_f(L.u[0], L.time)
+        M = self.coll.num_nodes
 
-        for m in range(1, self.coll.num_nodes + 1):
-            # copy u[0] to all collocation nodes, evaluate RHS
-            if self.params.initial_guess == 'spread':
+        # copy u[0] to all collocation nodes, evaluate RHS at all nodes (including the left point) at once
+        if self.params.initial_guess == 'spread':
+            for m in range(1, M + 1):
                 L.u[m] = P.dtype_u(L.u[0])
-                L.f[m] = P.eval_f(L.u[m], L.time + L.dt * self.coll.nodes[m - 1])
-            # start with zero everywhere
-            elif self.params.initial_guess == 'zero':
-                L.u[m] = P.dtype_u(init=P.init, val=0.0)
-                L.f[m] = P.dtype_f(init=P.init, val=0.0)
-            # start with random initial guess
-            elif self.params.initial_guess == 'random':
-                L.u[m] = P.dtype_u(init=P.init, val=np.random.rand(1)[0])
-                L.f[m] = P.dtype_f(init=P.init, val=np.random.rand(1)[0])
-            else:
-                raise ParameterError(f'initial_guess option {self.params.initial_guess} not implemented')
+            F = P.eval_f_batch([L.u[m] for m in range(M + 1)],
+                               [L.time] + [L.time + L.dt * self.coll.nodes[m] for m in range(M)])
+            for m in range(M + 1):
+                L.f[m] = F[m]
+
+        else:
+            # evaluate RHS at left point
+            L.f[0] = P.eval_f(L.u[0], L.time)
+
+            for m in range(1, M + 1):
+                # start with zero everywhere
+                if self.params.initial_guess == 'zero':
+                    L.u[m] = P.dtype_u(init=P.init, val=0.0)
+                    L.f[m] = P.dtype_f(init=P.init, val=0.0)
+                # start with random initial guess
+                elif self.params.initial_guess == 'random':
+                    L.u[m] = P.dtype_u(init=P.init, val=np.random.rand(1)[0])
+                    L.f[m] = P.dtype_f(init=P.init, val=np.random.rand(1)[0])
+                else:
+                    raise ParameterError(f'initial_guess option {self.params.initial_guess} not implemented')
 
         # indicate that this level is now ready for sweeps
         L.status.unlocked = True
@@ -275,15 +340,29 @@ class sweeper(object):
         # compute the residual for each node
 
         # build QF(u)
-        res_norm = []
         res = self.integrate()
-        for m in range(self.coll.num_nodes):
-            res[m] += L.u[0] - L.u[m + 1]
-            # add tau if associated
-            if L.tau[m] is not None:
-                res[m] += L.tau[m]
-            # use abs function from data type here
-            res_norm.append(abs(res[m]))
+        if L.params.stack_nodes:
+            # add initial value, subtract node values and add tau (if associated) for all nodes at once
+            R = res.get_stack()
+            U = L.u.get_stack()
+            R += U[0] - U[1:]
+            R[L.tau.valid] += L.tau.get_stack()[L.tau.valid]
+        else:
+            for m in range(self.coll.num_nodes):
+                res[m] += L.u[0] - L.u[m + 1]
+                # add tau if associated
+                if L.tau[m] is not None:
+                    res[m] += L.tau[m]
+
+        # use abs function from data type here, relative residuals need the norm of the initial value as well
+        res_norm = [res[m] for m in range(self.coll.num_nodes)]
+        if L.params.residual_type in ['full_rel', 'last_rel']:
+            res_norm.append(L.u[0])
+        if hasattr(type(L.u[0]), 'batched_abs'):
+            # compute all norms at once, e.g. with a single global reduction for distributed data
+            res_norm = type(L.u[0]).batched_abs(res_norm)
+        else:
+            res_norm = [abs(me) for me in res_norm]
 
         # find maximal residual over the nodes
         if L.params.residual_type == 'full_abs':
@@ -291,18 +370,85 @@ class sweeper(object):
         elif L.params.residual_type == 'last_abs':
             L.status.residual = res_norm[-1]
         elif L.params.residual_type == 'full_rel':
-            L.status.residual = max(res_norm) / abs(L.u[0])
+            L.status.residual = max(res_norm[:-1]) / res_norm[-1]
         elif L.params.residual_type == 'last_rel':
-            L.status.residual = res_norm[-1] / abs(L.u[0])
+            L.status.residual = res_norm[-2] / res_norm[-1]
         else:
             raise ParameterError(f'residual_type = {L.params.residual_type} not implemented, choose '
                                  f'full_abs, last_abs, full_rel or last_rel instead')
 
+        # for ensembles of independent realizations, keep the residual of each member as well
+        if getattr(L.prob.params, 'ensemble_size', None) is not None:
+            L.status.residual_members = self.__compute_member_residuals(res, L.u[0])
+
         # indicate that the residual has seen the new values
         L.status.updated = False
 
         return None
 
+    def __compute_member_residuals(self, res, u0):
+        """
+        Computation of the residual for each member of an ensemble, i.e. along the leading axis of the values
+
+        Args:
+            res (list): the residuals at the nodes
+            u0: the initial value, needed for relative residuals
+
+        Returns:
+            numpy.ndarray: the residual of each member
+        """
+
+        L = self.level
+        size = L.prob.params.ensemble_size
+
+        res_norm = np.array([np.abs(np.asarray(res[m])).reshape(size, -1).max(axis=1)
+                             for m in range(self.coll.num_nodes)])
+        if L.params.residual_type in ['full_abs', 'full_rel']:
+            res_members = res_norm.max(axis=0)
+        else:
+            res_members = res_norm[-1]
+
+        if L.params.residual_type in ['full_rel', 'last_rel']:
+            res_members /= np.abs(np.asarray(u0)).reshape(size, -1).max(axis=1)
+        return res_members
+
+    def update_all_nodes(self, rhs, factors=None):
+        """
+        Update the values at all collocation nodes at once, for preconditioners which do not couple the nodes (e.g.
+        Picard iterations or diagonal QI)
+
+        The problem is asked for all implicit solves and all evaluations of the RHS in one go, which it can implement
+        with batched operations, see solve_system_batch and eval_f_batch of the problem.
+
+        Args:
+            rhs (list of dtype_u): right-hand sides at the nodes, containing all known terms
+            factors (list of float): prefactors of the implicit solves, None for explicit updates
+
+        Returns:
+            None
+        """
+
+        # get current level and problem description
+        L = self.level
+        P = L.prob
+
+        M = self.coll.num_nodes
+        times = [L.time + L.dt * self.coll.nodes[m] for m in range(M)]
+
+        if factors is None:
+            U = [P.dtype_u(rhs[m]) for m in range(M)]
+        else:
+            U = P.solve_system_batch(rhs, factors, [L.u[m + 1] for m in range(M)], times)
+            # never let the solution point to the right-hand side, which may be a scratch buffer
+            U = [P.dtype_u(U[m]) if U[m] is rhs[m] else U[m] for m in range(M)]
+
+        F = P.eval_f_batch(U, times)
+        for m in range(M):
+            L.u[m + 1] = U[m]
+            L.f[m + 1] = F[m]
+
+        return None
+
     def compute_end_point(self):
         """
         Abstract interface to end-node computation
@@ -0,0 +1,239 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import get_lapack_funcs
+from scipy.sparse.linalg import splu
+
+
+def get_bandwidth(A, periodic=False):
+    """
+    Function to get the lower and upper bandwidth of a sparse matrix
+
+    Args:
+        A: sparse square matrix
+        periodic (bool): if True, entries in the corners are counted as wrapping around, as for periodic stencils
+
+    Returns:
+        int: lower bandwidth
+        int: upper bandwidth
+    """
+    row, col, _ = _get_entries(A)
+    offsets = col - row
+    if periodic:
+        offsets = _wrap_offsets(offsets, A.shape[0])
+    return int(max(-offsets.min(initial=0), 0)), int(max(offsets.max(initial=0), 0))
+
+
+def _get_entries(A):
+    """
+    Get rows, columns and values of the nonzero entries of a sparse matrix, without duplicates
+    """
+    if not (sp.isspmatrix_csr(A) or sp.isspmatrix_csc(A)):
+        A = sp.csr_matrix(A)
+    if not A.has_canonical_format:
+        A = A.copy()
+        A.sum_duplicates()
+    major = np.repeat(np.arange(len(A.indptr) - 1), np.diff(A.indptr))
+    row, col = (major, A.indices) if sp.isspmatrix_csr(A) else (A.indices, major)
+    nonzero = A.data != 0
+    return row[nonzero], col[nonzero], A.data[nonzero]
+
+
+def _wrap_offsets(offsets, N):
+    """
+    Map offsets to -N/2 < offset <= N/2, so that corner entries of periodic stencils become near-diagonal
+    """
+    return (offsets + (N - 1) // 2) % N - (N - 1) // 2
+
+
+class BandedSolver(object):
+    """
+    Direct solver for banded and cyclic banded sparse matrices, like (I - factor * A) for 1D FD problems
+
+    The band is factorized once with LAPACK (gttrf for tridiagonal, gbtrf else) and each solve is a single call to
+    the corresponding triangular solver, avoiding the overhead of SuperLU for these simple structures. Entries in the
+    corners, as for periodic boundary conditions, are treated as a low-rank correction via the Woodbury identity, using
+    the rows which contain them. Right-hand sides can be given as columns of a matrix to solve them all at once.
+
+    Attributes:
+        shape (tuple): shape of the matrix
+        lower (int): lower bandwidth, without the corners
+        upper (int): upper bandwidth, without the corners
+        periodic (bool): flag to indicate corner entries
+    """
+
+    def __init__(self, A):
+        """
+        Initialization routine, factorizes the matrix
+
+        Args:
+            A: sparse square matrix, banded up to corner entries
+
+        Raises:
+            numpy.linalg.LinAlgError: if the banded part of the matrix or the matrix itself is singular
+        """
+        row, col, data = _get_entries(A)
+        self.shape = A.shape
+        self.dtype = A.dtype
+        N = A.shape[0]
+
+        # split off entries which are only close to the diagonal when wrapping around
+        offsets = col - row
+        corner = _wrap_offsets(offsets, N) != offsets
+        self.periodic = bool(np.any(corner))
+        band = (row[~corner], col[~corner], offsets[~corner], data[~corner])
+
+        self.lower, self.upper = max(-offsets[~corner].min(initial=0), 0), max(offsets[~corner].max(initial=0), 0)
+        if self.lower <= 1 and self.upper <= 1:
+            self.__factorize_tridiagonal(*band)
+        else:
+            self.__factorize_banded(*band)
+
+        if self.periodic:
+            # A = B + E C with E selecting the rows with corner entries and C containing them, so by the Woodbury
+            # identity A^{-1} b = y - Z (I + C Z)^{-1} C y with y = B^{-1} b and Z = B^{-1} E. Since C only touches
+            # a few columns, the whole correction is one small dense matrix applied to these entries of y.
+            rows, row_index = np.unique(row[corner], return_inverse=True)
+            self.__columns, column_index = np.unique(col[corner], return_inverse=True)
+            C = np.zeros((len(rows), len(self.__columns)), dtype=self.dtype)
+            C[row_index, column_index] = data[corner]
+
+            E = np.zeros((N, len(rows)), dtype=self.dtype)
+            E[rows, np.arange(len(rows))] = 1.0
+            Z = self.__solve_band(E)
+            capacitance = np.eye(len(rows)) + C @ Z[self.__columns]
+            self.__correction = Z @ np.linalg.solve(capacitance, C)
+
+    def __factorize_tridiagonal(self, row, col, offsets, data):
+        N = self.shape[0]
+        d = np.zeros(N, dtype=self.dtype)
+        dl, du = np.zeros(N - 1, dtype=self.dtype), np.zeros(N - 1, dtype=self.dtype)
+        d[row[offsets == 0]] = data[offsets == 0]
+        dl[col[offsets == -1]] = data[offsets == -1]
+        du[row[offsets == 1]] = data[offsets == 1]
+
+        gttrf, self.__gttrs = get_lapack_funcs(('gttrf', 'gttrs'), (d,))
+        *self.__lu, info = gttrf(dl, d, du)
+        if info > 0:
+            raise np.linalg.LinAlgError('matrix is singular')
+        self.__solve_band = self.__solve_tridiagonal
+
+    def __solve_tridiagonal(self, b):
+        return self.__gttrs(*self.__lu, b)[0]
+
+    def __factorize_banded(self, row, col, offsets, data):
+        N = self.shape[0]
+        kl, ku = self.lower, self.upper
+
+        # LAPACK band storage, A[i, j] is stored in ab[kl + ku + i - j, j], with kl additional rows for the fill-in
+        ab = np.zeros((2 * kl + ku + 1, N), dtype=self.dtype)
+        ab[kl + ku - offsets, col] = data
+
+        gbtrf, self.__gbtrs = get_lapack_funcs(('gbtrf', 'gbtrs'), (ab,))
+        lu, piv, info = gbtrf(ab, kl, ku)
+        if info > 0:
+            raise np.linalg.LinAlgError('matrix is singular')
+        self.__lu = (lu, piv)
+        self.__solve_band = self.__solve_banded
+
+    def __solve_banded(self, b):
+        lu, piv = self.__lu
+        return self.__gbtrs(lu, self.lower, self.upper, b, piv)[0]
+
+    def solve(self, b):
+        """
+        Solve the system for one or several right-hand sides
+
+        Args:
+            b (numpy.ndarray): right-hand side of shape (N,) or (N, m) for m right-hand sides
+
+        Returns:
+            numpy.ndarray: the solution, with the shape of b
+        """
+        b = np.asarray(b)
+        if np.iscomplexobj(b) and not np.iscomplexobj(self.__lu[0]):
+            return self.solve(b.real) + 1j * self.solve(b.imag)
+
+        x = self.__solve_band(b)
+        if self.periodic:
+            x -= self.__correction @ x[self.__columns]
+        return x
+
+
+def factorize(A, max_bandwidth=8):
+    """
+    Function to factorize a sparse matrix, using the banded solver if the matrix is (cyclic) banded and SuperLU else
+
+    Args:
+        A: sparse square matrix
+        max_bandwidth (int): maximal sum of lower and upper bandwidth for which the banded solver is used
+
+    Returns:
+        object with a method solve(b), for right-hand sides of shape (N,) or (N, m)
+    """
+    if A.shape[0] > max_bandwidth + 1 and sum(get_bandwidth(A, periodic=True)) <= max_bandwidth:
+        try:
+            return BandedSolver(A)
+        except np.linalg.LinAlgError:
+            pass
+    return splu(sp.csc_matrix(A))
+
+
+def solve_grouped(factorize_for, rhs, factors):
+    """
+    Function to solve systems (I - factor * A) u = rhs for several factors at once, e.g. for all collocation nodes
+
+    Right-hand sides with the same factor share one factorization and are solved with a single call.
+
+    Args:
+        factorize_for: function returning the (cached) factorization for a factor
+        rhs (list): right-hand sides, flattened
+        factors (list): factors for each right-hand side
+
+    Returns:
+        list: the solutions, flattened
+    """
+    sol = [None] * len(rhs)
+    for factor in dict.fromkeys(factors):
+        indices = [i for i, f in enumerate(factors) if f == factor]
+        x = factorize_for(factor).solve(np.stack([np.asarray(rhs[i]).flatten() for i in indices], axis=1))
+        for j, i in enumerate(indices):
+            sol[i] = x[:, j]
+    return sol
+
+
+class GroupedSolves(object):
+    """
+    Mixin for linear problems, providing solve_system_batch with grouped solves for the systems with the same factor
+
+    The problem class has to implement get_system_solver, returning the (cached) factorization for a factor, e.g. of
+    (I - factor * A), and the solutions are returned as dtype_u.
+    """
+
+    def get_system_solver(self, factor):
+        """
+        Abstract interface to the factorization of the system for a factor
+        """
+        raise NotImplementedError('ERROR: problem has to implement get_system_solver(self, factor)')
+
+    def solve_system_batch(self, rhs, factors, u0, t):
+        """
+        Linear solver for several right-hand sides at once, e.g. for all collocation nodes
+
+        Right-hand sides with the same factor are solved together with a single call of the solver.
+
+        Args:
+            rhs (list): right-hand sides (dtype_f) for the linear systems
+            factors (list): factors for each system
+            u0 (list): initial guesses (dtype_u) for the iterative solver (not used here)
+            t (list): current times (e.g. for time-dependent BCs)
+
+        Returns:
+            list: solutions as dtype_u
+        """
+
+        sol = []
+        for x in solve_grouped(self.get_system_solver, rhs, factors):
+            me = self.dtype_u(self.init)
+            me[:] = x
+            sol.append(me)
+        return sol
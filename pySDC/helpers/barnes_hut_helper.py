@@ -0,0 +1,207 @@
+import numpy as np
+from numba import jit
+
+
+@jit(nopython=True, nogil=True)
+def build_octree(pos, q, leaf_size, max_depth=32):
+    """
+    Function to build an octree over particles for the Barnes-Hut method
+
+    The nodes are stored in pre-order, i.e. the first child of an inner node directly follows it. Together with the
+    index of the node following the subtree of each node, the tree can be traversed without recursion or stack.
+
+    Args:
+        pos (numpy.ndarray): positions of the particles, shape (3, N)
+        q (numpy.ndarray): charges of the particles
+        leaf_size (int): maximal number of particles in a leaf
+        max_depth (int): maximal depth of the tree, nodes on this level are leaves regardless of their size
+
+    Returns:
+        numpy.ndarray: permutation of the particles, such that each node contains a contiguous range of them
+        numpy.ndarray: integer data of the nodes (first and last particle in the permutation, next node, leaf flag)
+        numpy.ndarray: float data of the nodes (center of charge, total charge, edge length of the cell)
+    """
+    N = pos.shape[1]
+    perm = np.arange(N)
+    octant = np.empty(N, dtype=np.int64)
+    buffer = np.empty(N, dtype=np.int64)
+
+    capacity = max(16, 2 * N)
+    inodes = np.zeros((capacity, 4), dtype=np.int64)
+    fnodes = np.zeros((capacity, 5))
+    parent = np.zeros(capacity, dtype=np.int64)
+    nnodes = 0
+
+    # the root cell is the bounding cube of all particles
+    lower = np.array([pos[d].min() for d in range(3)])
+    upper = np.array([pos[d].max() for d in range(3)])
+
+    # cells to be processed, given by their range of particles, center, half edge length, depth and parent
+    stack_size = 8 * (max_depth + 1)
+    stack_int = np.zeros((stack_size, 4), dtype=np.int64)
+    stack_float = np.zeros((stack_size, 4))
+    stack_int[0, :] = (0, N, 0, -1)
+    stack_float[0, :3] = 0.5 * (lower + upper)
+    stack_float[0, 3] = max(0.5 * (upper - lower).max(), 1e-300)
+    nstack = 1
+
+    while nstack > 0:
+        nstack -= 1
+        start, end, depth, up = stack_int[nstack]
+        center = stack_float[nstack, :3].copy()
+        half = stack_float[nstack, 3]
+
+        if nnodes == capacity:
+            capacity *= 2
+            inodes = np.concatenate((inodes, np.zeros_like(inodes)))
+            fnodes = np.concatenate((fnodes, np.zeros_like(fnodes)))
+            parent = np.concatenate((parent, np.zeros_like(parent)))
+
+        k = nnodes
+        nnodes += 1
+        parent[k] = up
+
+        # multipole expansion of the cell up to the monopole, located in the center of (absolute) charge
+        charge = 0.0
+        weight = 0.0
+        c0 = 0.0
+        c1 = 0.0
+        c2 = 0.0
+        for p in range(start, end):
+            j = perm[p]
+            charge += q[j]
+            weight += abs(q[j])
+            c0 += abs(q[j]) * pos[0, j]
+            c1 += abs(q[j]) * pos[1, j]
+            c2 += abs(q[j]) * pos[2, j]
+        if weight > 0:
+            fnodes[k, :3] = (c0 / weight, c1 / weight, c2 / weight)
+        else:
+            fnodes[k, :3] = center
+        fnodes[k, 3] = charge
+        fnodes[k, 4] = 2 * half
+        inodes[k, 0] = start
+        inodes[k, 1] = end
+
+        if end - start <= leaf_size or depth >= max_depth:
+            inodes[k, 3] = 1
+            continue
+
+        # sort the particles of the cell into its octants
+        counts = np.zeros(9, dtype=np.int64)
+        for p in range(start, end):
+            j = perm[p]
+            o = 0
+            if pos[0, j] >= center[0]:
+                o += 1
+            if pos[1, j] >= center[1]:
+                o += 2
+            if pos[2, j] >= center[2]:
+                o += 4
+            octant[p] = o
+            counts[o + 1] += 1
+        offsets = np.cumsum(counts) + start
+        fill = offsets[:8].copy()
+        for p in range(start, end):
+            buffer[fill[octant[p]]] = perm[p]
+            fill[octant[p]] += 1
+        perm[start:end] = buffer[start:end]
+
+        # push the non-empty octants in reverse order, so that the first one is processed next
+        for o in range(7, -1, -1):
+            if offsets[o + 1] > offsets[o]:
+                stack_int[nstack, :] = (offsets[o], offsets[o + 1], depth + 1, k)
+                for d in range(3):
+                    stack_float[nstack, d] = center[d] + (0.5 if (o >> d) & 1 else -0.5) * half
+                stack_float[nstack, 3] = 0.5 * half
+                nstack += 1
+
+    # the node after the subtree of a node follows from the sizes of the subtrees
+    size = np.ones(nnodes, dtype=np.int64)
+    for k in range(nnodes - 1, 0, -1):
+        size[parent[k]] += size[k]
+    for k in range(nnodes):
+        inodes[k, 2] = k + size[k]
+
+    return perm, inodes[:nnodes], fnodes[:nnodes]
+
+
+@jit(nopython=True, nogil=True)
+def barnes_hut_interactions(pos, sig, q, theta, leaf_size):
+    """
+    Function to compute the (smoothed) Coulomb field of the particles with the Barnes-Hut method
+
+    Cells which appear smaller than the opening angle theta from a particle, i.e. with edge length below theta times
+    their distance, are approximated by their total charge in the center of charge. Else they are opened and leaves
+    are summed directly. Cells containing the particle itself are always opened, since for large theta their center of
+    charge can be far enough away, which would add a force of the particle on itself. With theta = 0, this is the
+    direct summation.
+
+    Args:
+        pos (numpy.ndarray): positions of the particles, shape (3, N)
+        sig (float): smoothing parameter for the forces
+        q (numpy.ndarray): charges of the particles
+        theta (float): opening angle
+        leaf_size (int): maximal number of particles in a leaf
+
+    Returns:
+        numpy.ndarray: the field for each particle, shape (3, N)
+    """
+    N = pos.shape[1]
+    perm, inodes, fnodes = build_octree(pos, q, leaf_size)
+    nnodes = inodes.shape[0]
+
+    # position of each particle in the permutation, to identify the cells containing it
+    rank = np.empty(N, dtype=np.int64)
+    rank[perm] = np.arange(N)
+
+    Efield = np.zeros((3, N))
+    sig2 = sig ** 2
+    theta2 = theta ** 2
+
+    for i in range(N):
+
+        contrib0 = 0.0
+        contrib1 = 0.0
+        contrib2 = 0.0
+
+        k = 0
+        while k < nnodes:
+
+            dx0 = pos[0, i] - fnodes[k, 0]
+            dx1 = pos[1, i] - fnodes[k, 1]
+            dx2 = pos[2, i] - fnodes[k, 2]
+            dist2 = dx0 ** 2 + dx1 ** 2 + dx2 ** 2
+
+            own = inodes[k, 0] <= rank[i] < inodes[k, 1]
+
+            if not own and fnodes[k, 4] ** 2 < theta2 * dist2:
+                # far enough away, use the monopole of the cell
+                dist3 = (dist2 + sig2) ** 1.5
+                contrib0 += fnodes[k, 3] * dx0 / dist3
+                contrib1 += fnodes[k, 3] * dx1 / dist3
+                contrib2 += fnodes[k, 3] * dx2 / dist3
+                k = inodes[k, 2]
+
+            elif inodes[k, 3] == 1:
+                # close leaf, sum directly
+                for p in range(inodes[k, 0], inodes[k, 1]):
+                    j = perm[p]
+                    dx0 = pos[0, i] - pos[0, j]
+                    dx1 = pos[1, i] - pos[1, j]
+                    dx2 = pos[2, i] - pos[2, j]
+                    dist3 = (dx0 ** 2 + dx1 ** 2 + dx2 ** 2 + sig2) ** 1.5
+                    contrib0 += q[j] * dx0 / dist3
+                    contrib1 += q[j] * dx1 / dist3
+                    contrib2 += q[j] * dx2 / dist3
+                k = inodes[k, 2]
+
+            else:
+                # close inner node, go to the first child
+                k += 1
+
+        Efield[0, i] = contrib0
+        Efield[1, i] = contrib1
+        Efield[2, i] = contrib2
+
+    return Efield
@@ -0,0 +1,216 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, splu
+
+import pySDC.helpers.transfer_helper as th
+
+
+def get_grid_1d(n, periodic):
+    """
+    Function to get the nodes of an equidistant grid on the unit interval, as used by the FD problem classes
+
+    Args:
+        n (int): number of degrees of freedom
+        periodic (bool): flag to indicate periodicity, otherwise only the inner nodes of a Dirichlet problem are used
+
+    Returns:
+        np.ndarray: the grid
+    """
+    if periodic:
+        return np.arange(n) / n
+    return np.arange(1, n + 1) / (n + 1)
+
+
+def can_coarsen_1d(n, periodic, min_size=4):
+    """
+    Function to check whether a 1d grid can be coarsened by a factor of two, keeping the grids nested
+
+    Args:
+        n (int): number of degrees of freedom
+        periodic (bool): flag to indicate periodicity
+        min_size (int): minimal number of degrees of freedom on the coarse grid
+
+    Returns:
+        bool: True if the grid can be coarsened
+    """
+    if periodic:
+        return n % 2 == 0 and n // 2 >= min_size
+    return n % 2 == 1 and (n - 1) // 2 >= min_size
+
+
+def get_prolongation_matrices(nvars, periodic, iorder=2, max_levels=None, min_size=4):
+    """
+    Function to construct the prolongation matrices of a hierarchy of nested grids by coarsening all dimensions
+
+    The 1d interpolation matrices come from transfer_helper and are combined via Kronecker products, where the first
+    dimension is the slowest one, matching the flattened meshes.
+
+    Args:
+        nvars (tuple): number of degrees of freedom per dimension on the finest grid
+        periodic (bool): flag to indicate periodicity
+        iorder (int): order of the interpolation
+        max_levels (int): maximal number of grids including the finest one, None for as many as possible
+        min_size (int): minimal number of degrees of freedom per dimension on the coarsest grid
+
+    Returns:
+        list: prolongation matrices from each grid to the next finer one, starting with the finest
+    """
+    nvars = tuple(np.atleast_1d(nvars))
+    prolongations = []
+    while all(can_coarsen_1d(n, periodic, min_size) for n in nvars):
+        if max_levels is not None and len(prolongations) + 1 >= max_levels:
+            break
+
+        coarse_nvars = tuple(n // 2 for n in nvars)
+        P = sp.eye(1, format='csc')
+        for n, nc in zip(nvars, coarse_nvars):
+            P1 = th.interpolation_matrix_1d(get_grid_1d(n, periodic), get_grid_1d(nc, periodic), k=iorder,
+                                            periodic=periodic, equidist_nested=True)
+            P = sp.kron(P, P1, format='csc')
+
+        prolongations.append(P)
+        nvars = coarse_nvars
+
+    return prolongations
+
+
+class MultigridSolver(object):
+    """
+    Geometric multigrid V-cycle for sparse linear systems on nested grids, like (I - factor * A) for FD problems
+
+    The coarse-grid operators are computed via the Galerkin product R A P, with restriction by full weighting
+    (R proportional to P^T), weighted Jacobi is used as smoother and the coarsest system is solved directly. Since the
+    cycle is symmetric, it can be used as preconditioner for CG.
+
+    Attributes:
+        matrices (list): system matrices on all grids, starting with the finest
+        prolongations (list): prolongation matrices from each grid to the next finer one
+        restrictions (list): restriction matrices from each grid to the next coarser one
+        num_pre (int): number of pre-smoothing steps
+        num_post (int): number of post-smoothing steps
+        omega (float): damping factor of the Jacobi smoother
+        niter (int): number of V-cycles done in the last call of solve
+    """
+
+    def __init__(self, A, prolongations, num_pre=2, num_post=2, omega=2.0 / 3.0):
+        """
+        Initialization routine
+
+        Args:
+            A: sparse system matrix on the finest grid
+            prolongations (list): prolongation matrices from each grid to the next finer one, starting with the finest
+            num_pre (int): number of pre-smoothing steps
+            num_post (int): number of post-smoothing steps
+            omega (float): damping factor of the Jacobi smoother
+        """
+        self.num_pre = num_pre
+        self.num_post = num_post
+        self.omega = omega
+        self.niter = 0
+
+        self.prolongations = [sp.csr_matrix(P) for P in prolongations]
+        self.restrictions = []
+        self.matrices = [sp.csr_matrix(A)]
+        for P in self.prolongations:
+            # full weighting, scaled such that constants are restricted to constants
+            R = sp.csr_matrix(P.T.multiply(1.0 / P.sum(axis=0).T))
+            self.restrictions.append(R)
+            self.matrices.append(sp.csr_matrix(R @ self.matrices[-1] @ P))
+
+        self.__inv_diags = [self.omega / M.diagonal() for M in self.matrices[:-1]]
+        self.__coarse_solver = splu(sp.csc_matrix(self.matrices[-1]))
+
+    @classmethod
+    def from_grid(cls, A, nvars, periodic, iorder=2, max_levels=None, **kwargs):
+        """
+        Set up the multigrid solver for a system on an equidistant grid
+
+        Args:
+            A: sparse system matrix on the finest grid
+            nvars (tuple): number of degrees of freedom per dimension
+            periodic (bool): flag to indicate periodicity
+            iorder (int): order of the interpolation
+            max_levels (int): maximal number of grids, None for as many as possible
+            **kwargs: further parameters for the smoother, see __init__
+
+        Returns:
+            MultigridSolver: the solver
+        """
+        return cls(A, get_prolongation_matrices(nvars, periodic, iorder=iorder, max_levels=max_levels), **kwargs)
+
+    @property
+    def num_levels(self):
+        return len(self.matrices)
+
+    @property
+    def shape(self):
+        return self.matrices[0].shape
+
+    def __smooth(self, level, b, x, num_iter):
+        A = self.matrices[level]
+        for _ in range(num_iter):
+            x += self.__inv_diags[level] * (b - A @ x)
+        return x
+
+    def vcycle(self, b, x=None, level=0):
+        """
+        Do one V-cycle, starting on the given level
+
+        Args:
+            b (np.ndarray): the right-hand side
+            x (np.ndarray): initial guess, zero if None
+            level (int): index of the grid
+
+        Returns:
+            np.ndarray: the improved approximation
+        """
+        if level == self.num_levels - 1:
+            return self.__coarse_solver.solve(b)
+
+        x = np.zeros_like(b) if x is None else np.array(x, dtype=np.result_type(b, x))
+        x = self.__smooth(level, b, x, self.num_pre)
+
+        r = b - self.matrices[level] @ x
+        x += self.prolongations[level] @ self.vcycle(self.restrictions[level] @ r, level=level + 1)
+
+        return self.__smooth(level, b, x, self.num_post)
+
+    def solve(self, b, x0=None, tol=1e-12, maxiter=100, callback=None):
+        """
+        Solve the system with V-cycles until the relative residual is below the tolerance
+
+        Args:
+            b (np.ndarray): the right-hand side, flattened
+            x0 (np.ndarray): initial guess, zero if None
+            tol (float): tolerance for the residual relative to the right-hand side
+            maxiter (int): maximal number of V-cycles
+            callback: function called with the current approximation after each V-cycle, as for scipy's solvers
+
+        Returns:
+            np.ndarray: the solution
+        """
+        b = np.asarray(b).flatten()
+        x = np.zeros_like(b) if x0 is None else np.asarray(x0, dtype=np.result_type(b, x0)).flatten()
+
+        norm_b = np.linalg.norm(b)
+        if norm_b == 0:
+            norm_b = 1.0
+
+        self.niter = 0
+        while np.linalg.norm(b - self.matrices[0] @ x) > tol * norm_b and self.niter < maxiter:
+            x = self.vcycle(b, x)
+            self.niter += 1
+            if callback is not None:
+                callback(x)
+
+        return x
+
+    def aspreconditioner(self):
+        """
+        Get one V-cycle with zero initial guess as linear operator, e.g. as preconditioner for Krylov methods
+
+        Returns:
+            scipy.sparse.linalg.LinearOperator: the preconditioner
+        """
+        return LinearOperator(self.shape, matvec=lambda b: self.vcycle(np.asarray(b).flatten()),
+                              dtype=self.matrices[0].dtype)
@@ -1,5 +1,390 @@
+from collections import namedtuple
+from collections.abc import MutableMapping
+
 import numpy as np
 
+# key of a statistics entry, containing all information to identify the value
+Entry = namedtuple('Entry', ['process', 'time', 'level', 'iter', 'sweep', 'type'])
+
+
+# Python types which can be stored in the typed columns without changing their value
+_INT_TYPES = frozenset([int, np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32])
+_FLOAT_TYPES = _INT_TYPES | frozenset([float, np.float16, np.float32, np.float64])
+
+
+class _Column(object):
+    """
+    Growable numpy array, which doubles its capacity when it is full
+
+    New values are collected in a list and are only moved to the array when it is accessed, so that appending stays
+    cheap and the array is updated incrementally. Unless it is given, the dtype is chosen by the first values (int64,
+    float64 or object) and is widened to float64 or object when a value does not fit, e.g. for None.
+
+    Attributes:
+        __data (numpy.ndarray): the buffer
+        __size (int): number of values in the buffer
+        __pending (list): values which have not been moved to the buffer yet
+        __fits (frozenset): types of values fitting into the buffer, None for objects
+    """
+
+    def __init__(self, data=None, dtype=None):
+        """
+        Initialization routine
+
+        Args:
+            data (numpy.ndarray): initial values, None for an empty column
+            dtype: fixed dtype of the column, e.g. object to keep the values as they are
+        """
+        self.__data = None
+        self.__size = 0
+        self.__pending = []
+        self.__fits = frozenset()
+        if dtype is not None:
+            self.__set_buffer(np.empty(16, dtype=dtype))
+        if data is not None and len(data) > 0:
+            self.__set_buffer(np.array(data, dtype=dtype))
+            self.__size = len(data)
+
+    def __set_buffer(self, data):
+        if data.dtype.kind == 'i':
+            self.__fits = _INT_TYPES
+        elif data.dtype.kind == 'f':
+            self.__fits = _FLOAT_TYPES
+        else:
+            data = data.astype(object, copy=False)
+            self.__fits = None
+        self.__data = data
+
+    def __widen(self, value):
+        """
+        Change the dtype of the buffer so that the value fits
+
+        Args:
+            value: the value
+        """
+        if self.__data is None:
+            dtype = int if type(value) in _INT_TYPES else float if type(value) in _FLOAT_TYPES else object
+            self.__set_buffer(np.empty(16, dtype=dtype))
+        elif type(value) in _FLOAT_TYPES:
+            self.__set_buffer(self.__data.astype(float))
+        else:
+            self.__set_buffer(self.__data.astype(object))
+
+    def __flush(self):
+        """
+        Move the pending values to the buffer
+        """
+        pending = self.__pending
+        for value in pending:
+            if self.__fits is not None and type(value) not in self.__fits:
+                self.__widen(value)
+
+        size = self.__size + len(pending)
+        if size > len(self.__data):
+            capacity = len(self.__data)
+            while capacity < size:
+                capacity *= 2
+            data = np.empty(capacity, dtype=self.__data.dtype)
+            data[:self.__size] = self.__data[:self.__size]
+            self.__data = data
+
+        try:
+            if self.__fits is None:
+                # values which are arrays themselves have to be assigned one by one
+                for row, value in enumerate(pending, self.__size):
+                    self.__data[row] = value
+            else:
+                self.__data[self.__size:size] = pending
+        except OverflowError:
+            self.__set_buffer(self.__data.astype(object))
+            self.__flush()
+            return
+
+        self.__size = size
+        self.__pending = []
+
+    def append(self, value):
+        """
+        Append a value
+
+        Args:
+            value: the value
+        """
+        self.__pending.append(value)
+
+    def __setitem__(self, row, value):
+        if row >= self.__size:
+            self.__pending[row - self.__size] = value
+            return
+        if self.__fits is not None and type(value) not in self.__fits:
+            self.__widen(value)
+        self.__data[row] = value
+
+    def __len__(self):
+        return self.__size + len(self.__pending)
+
+    @property
+    def data(self):
+        """
+        Getter for the values
+
+        Returns:
+            numpy.ndarray: view of the values in the buffer
+        """
+        if len(self.__pending) > 0:
+            self.__flush()
+        if self.__data is None:
+            return np.empty(0, dtype=object)
+        return self.__data[:self.__size]
+
+
+class StatsStore(MutableMapping):
+    """
+    Append-only, columnar store for the statistics of a run
+
+    Each field of the entries is kept in its own growable numpy array, and the rows of each type are indexed, so that
+    filtering and sorting work on arrays instead of scanning all entries. For compatibility, the store behaves like the
+    dictionary mapping Entry keys to values used before. Removed entries are only marked and the arrays are compacted
+    at the next query.
+
+    Attributes:
+        __columns (dict): one _Column per field of the entries
+        __values (_Column): the values
+        __rows (dict): row of each key, keys are plain tuples (which compare equal to the Entry namedtuples)
+        __types (dict): _Column with the rows of each type, in order of insertion
+        __removed (list): rows which have been removed, but not yet compacted
+    """
+
+    def __init__(self):
+        """
+        Initialization routine
+        """
+        self.__columns = {name: _Column() for name in Entry._fields}
+        self.__values = _Column(dtype=object)
+        self.__rows = {}
+        self.__types = {}
+        self.__removed = []
+
+    def append(self, process, time, level, iter, sweep, type, value):
+        """
+        Add a value to the store, overwriting the value if the key exists already
+
+        Args:
+            process: the current process recording this data
+            time (float): the current simulation time
+            level (int): the current level index
+            iter (int): the current iteration count
+            sweep (int): the current sweep count
+            type (str): string to describe the type of value
+            value: the actual data
+        """
+        key = (process, time, level, iter, sweep, type)
+        row = self.__rows.get(key)
+        if row is not None:
+            self.__values[row] = value
+            return
+
+        row = len(self.__values)
+        self.__rows[key] = row
+        for name, me in zip(Entry._fields, key):
+            self.__columns[name].append(me)
+        self.__values.append(value)
+        if type not in self.__types:
+            self.__types[type] = _Column()
+        self.__types[type].append(row)
+
+    def increment(self, process, time, level, iter, sweep, type, value, initialize=None):
+        """
+        Increment a value in the store. If the key does not exist yet, it will be initialized to initialize if
+        applicable and to value otherwise
+
+        Args:
+            process: the current process recording this data
+            time (float): the current simulation time
+            level (int): the current level index
+            iter (int): the current iteration count
+            sweep (int): the current sweep count
+            type (str): string to describe the type of value
+            value: the increment
+            initialize: if supplied and the key does not exist already, this will be used over value
+        """
+        key = (process, time, level, iter, sweep, type)
+        if key in self:
+            self[key] += value
+        elif initialize is not None:
+            self[key] = initialize
+        else:
+            self[key] = value
+
+    def __getitem__(self, key):
+        return self.__values.data[self.__rows[tuple(key)]]
+
+    def __setitem__(self, key, value):
+        self.append(*key, value=value)
+
+    def __delitem__(self, key):
+        # entries are not meant to be removed, so we only mark the row and compact the arrays when they are needed
+        self.__removed.append(self.__rows.pop(tuple(key)))
+
+    def __contains__(self, key):
+        return tuple(key) in self.__rows
+
+    def clear(self):
+        """
+        Remove all entries
+        """
+        StatsStore.__init__(self)
+
+    def __iter__(self):
+        self.__compact()
+        columns = [self.__columns[name].data.tolist() for name in Entry._fields]
+        for key in zip(*columns):
+            yield Entry(*key)
+
+    def __len__(self):
+        return len(self.__rows)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({len(self)} entries, types {self.types})'
+
+    def __compact(self):
+        """
+        Drop the rows which have been removed from the arrays
+        """
+        if len(self.__removed) > 0:
+            keep = np.ones(len(self.__values), dtype=bool)
+            keep[self.__removed] = False
+            self.__init_from(self, np.nonzero(keep)[0])
+
+    def __init_from(self, other, rows):
+        """
+        Fill the store with the given rows of another store
+
+        Args:
+            other (StatsStore): the store to copy from
+            rows: indices of the rows to copy, in this order
+        """
+        rows = np.asarray(rows, dtype=int)
+        columns = {name: _Column(other.__columns[name].data[rows]) for name in Entry._fields}
+        values = _Column(other.__values.data[rows], dtype=object)
+
+        StatsStore.__init__(self)
+        self.__columns = columns
+        self.__values = values
+        keys = zip(*[columns[name].data.tolist() for name in Entry._fields])
+        self.__rows = dict(zip(keys, range(len(rows))))
+        types = columns['type'].data
+        for type in dict.fromkeys(types.tolist()):
+            self.__types[type] = _Column(np.nonzero(types == type)[0])
+
+    @property
+    def types(self):
+        """
+        Getter for the types of values in the store, in order of first appearance
+
+        Returns:
+            list: the types
+        """
+        self.__compact()
+        return list(self.__types.keys())
+
+    def column(self, name):
+        """
+        Get a column of the store as numpy array
+
+        Args:
+            name (str): name of the field
+
+        Returns:
+            numpy.ndarray: the column
+        """
+        self.__compact()
+        return self.__columns[name].data
+
+    def rows(self, type=None):
+        """
+        Get the rows of the store, possibly only the ones of a given type
+
+        Args:
+            type (str): the type of values, None for all
+
+        Returns:
+            numpy.ndarray: the row indices
+        """
+        self.__compact()
+        if type is None:
+            return np.arange(len(self))
+        if type not in self.__types:
+            return np.array([], dtype=int)
+        return self.__types[type].data
+
+    def subset(self, rows):
+        """
+        Create a new store containing only the given rows
+
+        Args:
+            rows: indices of the rows
+
+        Returns:
+            StatsStore: the new store
+        """
+        self.__compact()
+        result = StatsStore()
+        result.__init_from(self, rows)
+        return result
+
+    def get_values(self, rows, name=None):
+        """
+        Get the values or the entries of a field in the given rows
+
+        Args:
+            rows: indices of the rows
+            name (str): name of the field, None for the values
+
+        Returns:
+            list: the values or entries of the field
+        """
+        self.__compact()
+        source = self.__values if name is None else self.__columns[name]
+        return source.data[np.asarray(rows, dtype=int)].tolist()
+
+
+def _get_recomputed_mask(times, restart_times, restart_values, recomputed):
+    """
+    Check which entries are kept when filtering for recomputed values
+
+    Args:
+        times (numpy.ndarray): times of the entries
+        restart_times (list): times for which restarts have been recorded, sorted
+        restart_values (list): values recorded for the restarts
+        recomputed (bool): whether to keep restarted or not restarted steps
+
+    Returns:
+        numpy.ndarray: mask of the entries to keep
+    """
+    # only the first record at each time counts
+    first = {}
+    for t, v in zip(restart_times, restart_values):
+        first.setdefault(t, v)
+
+    try:
+        unique_times = np.array(list(first.keys()), dtype=float)
+        keep_times = np.array([v == float(recomputed) for v in first.values()], dtype=bool)
+        times = np.asarray(times, dtype=float)
+    except (TypeError, ValueError):
+        return np.array([t not in first or first[t] == float(recomputed) for t in times], dtype=bool)
+
+    if len(unique_times) == 0:
+        return np.ones(len(times), dtype=bool)
+
+    order = np.argsort(unique_times)
+    unique_times = unique_times[order]
+    keep_times = keep_times[order]
+
+    idx = np.minimum(np.searchsorted(unique_times, times), len(unique_times) - 1)
+    found = unique_times[idx] == times
+    return ~found | keep_times[idx]
+
 
 def filter_stats(stats, process=None, time=None, level=None, iter=None, type=None, recomputed=None):
     """
@@ -17,17 +402,25 @@ def filter_stats(stats, process=None, time=None, level=None, iter=None, type=Non
     Returns:
         dict: dictionary containing only the entries corresponding to the filter
     """
-    result = {}
 
     # check which steps have been recomputed
     if recomputed is not None:
-        # this will contain a 2d array with all times and whether they have been recomputed
-        restarts = np.array(get_sorted(stats, process=None, time=None, iter=None, type='recomputed',
-                            recomputed=None, sortby='time'))
-    else:
-        # dummy values for when no filtering of restarts is desired
-        restarts = np.array([[None, None]])
+        restarts = sort_stats(filter_stats(stats, type='recomputed'), sortby='time')
+        restart_times = [me[0] for me in restarts]
+        restart_values = [me[1] for me in restarts]
+
+    if isinstance(stats, StatsStore):
+        rows = stats.rows(type)
+        for name, value in zip(['process', 'time', 'level', 'iter'], [process, time, level, iter]):
+            if value is not None and len(rows) > 0:
+                rows = rows[stats.column(name)[rows] == value]
+
+        if recomputed is not None and len(rows) > 0:
+            rows = rows[_get_recomputed_mask(stats.column('time')[rows], restart_times, restart_values, recomputed)]
+
+        return stats.subset(rows)
 
+    result = {}
     for k, v in stats.items():
         # get data if key matches the filter (if specified)
         if (k.time == time or time is None) and \
@@ -35,15 +428,11 @@ def filter_stats(stats, process=None, time=None, level=None, iter=None, type=Non
                 (k.level == level or level is None) and \
                 (k.iter == iter or iter is None) and \
                 (k.type == type or type is None):
+            result[k] = v
 
-            if k.time in restarts[:, 0]:
-                # we know there is only one entry for each time, so we make a mask for the time and take the first and
-                # only entry and then take the second entry of this, which contains whether a restart was performed at
-                # this time as a float and compare it to the value we specified for recomputed
-                if restarts[restarts[:, 0] == k.time][0][1] == float(recomputed):
-                    result[k] = v
-            else:
-                result[k] = v
+    if recomputed is not None:
+        mask = _get_recomputed_mask([k.time for k in result.keys()], restart_times, restart_values, recomputed)
+        result = {k: v for (k, v), keep in zip(result.items(), mask) if keep}
 
     return result
 
@@ -60,6 +449,14 @@ def sort_stats(stats, sortby):
         list: list of tuples containing the sortby item and the value
     """
 
+    if isinstance(stats, StatsStore):
+        column = stats.column(sortby)
+        if column.dtype == object:
+            rows = sorted(range(len(column)), key=lambda r: column[r])
+        else:
+            rows = np.argsort(column, kind='stable')
+        return list(zip(stats.get_values(rows, sortby), stats.get_values(rows)))
+
     result = []
     for k, v in stats.items():
         # convert string to attribute and append key + value to result as tuple
@@ -82,6 +479,9 @@ def get_list_of_types(stats):
 
     """
 
+    if isinstance(stats, StatsStore):
+        return stats.types
+
     type_list = []
     for k, _ in stats.items():
         if k.type not in type_list:
@@ -0,0 +1,445 @@
+import json
+import pickle
+import queue
+import threading
+
+import numpy as np
+
+from pySDC.helpers.stats_helper import StatsStore, Entry
+
+# record of a single entry in the file, values which are no scalars are stored separately
+STATS_DTYPE = np.dtype([('process', '<i8'), ('time', '<f8'), ('level', '<i8'), ('iter', '<i8'), ('sweep', '<i8'),
+                        ('type', '<i4'), ('kind', 'i1'), ('value', '<f8')])
+
+# kinds of values, needed to restore the original type of scalars
+KIND_FLOAT, KIND_INT, KIND_BOOL, KIND_NONE, KIND_OBJECT = range(5)
+
+# placeholder for None in the integer fields
+NONE_INT = np.iinfo(np.int64).min
+
+# total length of the header of the .npy file, fixed so that it can be rewritten when more records are appended
+HEADER_LENGTH = 256
+
+
+def _write_header(fh, length):
+    """
+    Write the header of the .npy file for the given number of records, padded to a fixed length
+
+    Args:
+        fh: the file handle
+        length (int): the number of records in the file
+    """
+    header = repr({'descr': np.lib.format.dtype_to_descr(STATS_DTYPE), 'fortran_order': False, 'shape': (length,)})
+    magic = np.lib.format.magic(1, 0)
+    size = HEADER_LENGTH - len(magic) - 2
+    header = header.ljust(size - 1) + '\n'
+    assert len(header) == size, 'header of the stats file too long'
+    fh.seek(0)
+    fh.write(magic + np.uint16(size).astype('<u2').tobytes() + header.encode('latin1'))
+
+
+def _encode_value(value):
+    """
+    Get the kind and the numeric representation of a value
+
+    Args:
+        value: the value
+
+    Returns:
+        int: the kind of the value
+        float: the value as float, nan if it is no scalar
+    """
+    if value is None:
+        return KIND_NONE, np.nan
+    if isinstance(value, (bool, np.bool_)):
+        return KIND_BOOL, float(value)
+    if isinstance(value, (int, np.integer)):
+        return KIND_INT, float(value)
+    if isinstance(value, (float, np.floating)):
+        return KIND_FLOAT, float(value)
+    return KIND_OBJECT, np.nan
+
+
+def _int_or_none(value):
+    return NONE_INT if value is None else value
+
+
+class StatsWriter(StatsStore):
+    """
+    Statistics store, which streams the entries in chunks to a .npy file instead of keeping them in memory
+
+    Up to chunk_size entries are kept in memory, then they are appended to the file, optionally by a background thread.
+    Only entries which are still in memory can be changed. If an entry is added again after it was written, the file
+    contains both records and the reader returns the latest value. Incremented entries are kept in memory separately
+    and are only written when the writer waits for the file, so that counters are not split across chunks. Scalar
+    values are read back as Python scalars, values which are no scalars are pickled to a separate file, with their
+    offsets in that file stored in the records, and the types are kept in a small json file next to the records.
+
+    Attributes:
+        fname (str): name of the .npy file
+        chunk_size (int): number of entries to keep in memory before writing them
+        background (bool): write the chunks in a background thread
+    """
+
+    def __init__(self, fname, chunk_size=100000, background=False):
+        """
+        Initialization routine
+
+        Args:
+            fname (str): name of the .npy file, will be overwritten
+            chunk_size (int): number of entries to keep in memory before writing them
+            background (bool): write the chunks in a background thread
+        """
+        super(StatsWriter, self).__init__()
+
+        self.fname = fname
+        self.chunk_size = chunk_size
+        self.background = background
+
+        self.__type_codes = {}
+        self.__num_records = 0
+        self.__objects_size = 0
+        self.__counters = StatsStore()
+
+        self.__fh = open(fname, 'wb+')
+        _write_header(self.__fh, 0)
+        self.__fh.flush()
+        with open(self.objects_fname(fname), 'wb'):
+            pass
+        self.__write_types()
+
+        self.__queue = None
+        self.__error = None
+        if background:
+            self.__queue = queue.Queue(maxsize=2)
+            threading.Thread(target=self.__work, daemon=True).start()
+
+    @staticmethod
+    def types_fname(fname):
+        return f'{fname}.types.json'
+
+    @staticmethod
+    def objects_fname(fname):
+        return f'{fname}.objects.pickle'
+
+    def append(self, process, time, level, iter, sweep, type, value):
+        """
+        Add a value to the store and write the entries in memory to the file if there are enough of them
+
+        Args:
+            process: the current process recording this data
+            time (float): the current simulation time
+            level (int): the current level index
+            iter (int): the current iteration count
+            sweep (int): the current sweep count
+            type (str): string to describe the type of value
+            value: the actual data
+        """
+        super(StatsWriter, self).append(process, time, level, iter, sweep, type, value)
+        if len(self) >= self.chunk_size:
+            self.flush()
+
+    def increment(self, process, time, level, iter, sweep, type, value, initialize=None):
+        """
+        Increment a counter, which is kept in memory until the writer waits for the file
+
+        Args:
+            process: the current process recording this data
+            time (float): the current simulation time
+            level (int): the current level index
+            iter (int): the current iteration count
+            sweep (int): the current sweep count
+            type (str): string to describe the type of value
+            value: the increment
+            initialize: if supplied and the counter does not exist already, this will be used over value
+        """
+        self.__counters.increment(process, time, level, iter, sweep, type, value, initialize=initialize)
+
+    def flush(self):
+        """
+        Write the entries in memory to the file
+        """
+        if len(self) == 0:
+            return
+
+        rows = range(len(self))
+        types = self.get_values(rows, 'type')
+        for type in types:
+            self.__type_codes.setdefault(type, len(self.__type_codes))
+
+        records = np.empty(len(self), dtype=STATS_DTYPE)
+        for name in ['process', 'level', 'iter', 'sweep']:
+            records[name] = [_int_or_none(me) for me in self.get_values(rows, name)]
+        records['time'] = [np.nan if me is None else me for me in self.get_values(rows, 'time')]
+        records['type'] = [self.__type_codes[me] for me in types]
+
+        # the offsets of the objects are only known when they are written
+        objects = []
+        for i, value in enumerate(self.get_values(rows)):
+            kind, records['value'][i] = _encode_value(value)
+            records['kind'][i] = kind
+            if kind == KIND_OBJECT:
+                objects.append((i, value))
+
+        self.clear()
+
+        if self.__queue is not None:
+            self.__raise_error()
+            self.__queue.put((records, objects, list(self.__type_codes.keys())))
+        else:
+            self.__write(records, objects, list(self.__type_codes.keys()))
+
+    def __write(self, records, objects, types):
+        """
+        Append records to the file
+
+        Args:
+            records (numpy.ndarray): the records
+            objects (list): rows and values which are no scalars
+            types (list): all types so far, ordered by their codes
+        """
+        if len(objects) > 0:
+            with open(self.objects_fname(self.fname), 'ab') as fh:
+                for row, obj in objects:
+                    data = pickle.dumps(obj)
+                    records['value'][row] = self.__objects_size
+                    fh.write(data)
+                    self.__objects_size += len(data)
+        self.__write_types(types)
+
+        self.__fh.seek(HEADER_LENGTH + self.__num_records * STATS_DTYPE.itemsize)
+        self.__fh.write(records.tobytes())
+        self.__num_records += len(records)
+        _write_header(self.__fh, self.__num_records)
+        self.__fh.flush()
+
+    def __write_types(self, types=None):
+        with open(self.types_fname(self.fname), 'w') as fh:
+            json.dump(types or [], fh)
+
+    def __work(self):
+        """
+        Write chunks from the queue in the background
+        """
+        while True:
+            records, objects, types = self.__queue.get()
+            try:
+                if self.__error is None:
+                    self.__write(records, objects, types)
+            except Exception as error:
+                self.__error = error
+            finally:
+                self.__queue.task_done()
+
+    def __raise_error(self):
+        if self.__error is not None:
+            raise self.__error
+
+    def wait(self):
+        """
+        Write all entries in memory and the current state of the counters and wait until everything is in the file
+        """
+        if self.__fh.closed:
+            return
+
+        # the counters stay in memory, if they are incremented further, the reader takes the latest value
+        for key, value in self.__counters.items():
+            super(StatsWriter, self).append(*key, value=value)
+        self.flush()
+        if self.__queue is not None:
+            self.__queue.join()
+            self.__raise_error()
+
+    def read(self, unique=False):
+        """
+        Write all entries and read the statistics from the file
+
+        Args:
+            unique (bool): keep only the latest value for entries which have been written multiple times, this sorts
+                           all keys in memory
+
+        Returns:
+            StatsFile: the statistics
+        """
+        self.wait()
+        return StatsFile(self.fname, unique=unique)
+
+    def close(self):
+        """
+        Write all entries and close the file, the statistics can still be read afterwards
+        """
+        self.wait()
+        self.__fh.close()
+
+
+class StatsFile(StatsStore):
+    """
+    Read-only statistics from a file written by StatsWriter
+
+    The records are memory-mapped, so queries with the functions in stats_helper work without loading the whole file,
+    and only the requested values which are no scalars are unpickled. Results of queries are regular StatsStore objects
+    in memory. Entries which have been written multiple times appear multiple times, unless duplicates are removed
+    with unique, while looking up a single key always gives the latest value.
+
+    Attributes:
+        fname (str): name of the .npy file
+    """
+
+    def __init__(self, fname, unique=False):
+        """
+        Initialization routine
+
+        Args:
+            fname (str): name of the .npy file
+            unique (bool): keep only the latest value for entries which have been written multiple times, this sorts
+                           all keys in memory
+        """
+        super(StatsFile, self).__init__()
+        self.fname = fname
+
+        self.__records = np.load(fname, mmap_mode='r')
+        with open(StatsWriter.types_fname(fname), 'r') as fh:
+            self.__type_list = json.load(fh)
+
+        # select the last record of each entry, if some have been written multiple times
+        self.__selection = None
+        if unique and len(self.__records) > 0:
+            last = np.ones(len(self.__records), dtype=bool)
+            last[:-1] = False
+            # sort the keys with stable sorts starting from the last column, so that only a single column is loaded
+            # at once, and compare the sorted keys one column at a time
+            order = np.arange(len(self.__records))
+            for name in reversed(Entry._fields):
+                order = order[np.argsort(self.__get_key_column(name)[order], kind='stable')]
+            for name in Entry._fields:
+                column = self.__get_key_column(name)[order]
+                last[:-1] |= column[1:] != column[:-1]
+            if not np.all(last):
+                self.__selection = np.sort(order[last])
+
+    def __get_key_column(self, name):
+        """
+        Get a field of the keys from the file, with the times as integers so that None (stored as nan) compares equal
+
+        Args:
+            name (str): name of the field
+
+        Returns:
+            numpy.ndarray: the memory-mapped field
+        """
+        field = self.__records[name]
+        return field.view('<i8') if name == 'time' else field
+
+    def __get_field(self, name):
+        field = self.__records[name]
+        return field if self.__selection is None else field[self.__selection]
+
+    def append(self, *args, **kwargs):
+        raise TypeError('statistics read from a file cannot be changed')
+
+    def increment(self, *args, **kwargs):
+        raise TypeError('statistics read from a file cannot be changed')
+
+    def __delitem__(self, key):
+        raise TypeError('statistics read from a file cannot be changed')
+
+    def clear(self):
+        raise TypeError('statistics read from a file cannot be changed')
+
+    def __len__(self):
+        return len(self.__records) if self.__selection is None else len(self.__selection)
+
+    def __iter__(self):
+        rows = range(len(self))
+        yield from (Entry(*me) for me in zip(*[self.get_values(rows, name) for name in Entry._fields]))
+
+    def __find(self, key):
+        """
+        Search a key in the memory-mapped columns, narrowing down the matching rows one field at a time
+
+        Args:
+            key: the key
+
+        Returns:
+            int: the latest row with this key, None if there is none
+        """
+        key = tuple(key)
+        if len(key) != len(Entry._fields) or key[-1] not in self.__type_list:
+            return None
+
+        rows = self.rows(key[-1])
+        for name, value in zip(Entry._fields[:-1], key[:-1]):
+            if len(rows) == 0:
+                return None
+            column = self.__get_field(name)[rows]
+            if value is None:
+                rows = rows[np.isnan(column) if name == 'time' else column == NONE_INT]
+            elif isinstance(value, (int, float, np.integer, np.floating)):
+                rows = rows[column == value]
+            else:
+                return None
+        return rows[-1] if len(rows) > 0 else None
+
+    def __getitem__(self, key):
+        row = self.__find(key)
+        if row is None:
+            raise KeyError(key)
+        return self.get_values([row])[0]
+
+    def __contains__(self, key):
+        return self.__find(key) is not None
+
+    @property
+    def types(self):
+        codes = np.unique(self.__get_field('type'))
+        first = [np.argmax(self.__get_field('type') == code) for code in codes]
+        return [self.__type_list[code] for _, code in sorted(zip(first, codes))]
+
+    def column(self, name):
+        if name == 'type':
+            return np.array(self.__type_list, dtype=object)[self.__get_field('type')]
+        return self.__get_field(name)
+
+    def rows(self, type=None):
+        if type is None:
+            return np.arange(len(self))
+        if type not in self.__type_list:
+            return np.array([], dtype=int)
+        return np.nonzero(self.__get_field('type') == self.__type_list.index(type))[0]
+
+    def subset(self, rows):
+        result = StatsStore()
+        rows = np.asarray(rows, dtype=int)
+        for key in zip(*[self.get_values(rows, name) for name in Entry._fields], self.get_values(rows)):
+            result.append(*key)
+        return result
+
+    def get_values(self, rows, name=None):
+        rows = np.asarray(rows, dtype=int)
+        if name == 'type':
+            return [self.__type_list[me] for me in self.__get_field('type')[rows].tolist()]
+        if name == 'time':
+            return [None if np.isnan(me) else me for me in self.__get_field('time')[rows].tolist()]
+        if name is not None:
+            return [None if me == NONE_INT else me for me in self.__get_field(name)[rows].tolist()]
+
+        values = []
+        objects = None
+        for kind, value in zip(self.__get_field('kind')[rows].tolist(), self.__get_field('value')[rows].tolist()):
+            if kind == KIND_INT:
+                values.append(int(value))
+            elif kind == KIND_BOOL:
+                values.append(bool(value))
+            elif kind == KIND_NONE:
+                values.append(None)
+            elif kind == KIND_OBJECT:
+                # only the requested objects are read, starting at their offset
+                if objects is None:
+                    objects = open(StatsWriter.objects_fname(self.fname), 'rb')
+                objects.seek(int(value))
+                values.append(pickle.load(objects))
+            else:
+                values.append(value)
+        if objects is not None:
+            objects.close()
+        return values
@@ -1,3 +1,4 @@
+import os
 import numpy as np
 from mpi4py import MPI
 
@@ -38,6 +39,12 @@ class controller_MPI(controller):
         # insert data on time communicator to the steps (helpful here and there)
         self.S.status.time_size = num_procs
 
+        # every rank streams its statistics to its own file, so that the ranks do not overwrite each other
+        if self.params.stats_file is not None and num_procs > 1:
+            root, ext = os.path.splitext(self.params.stats_file)
+            self.hooks.stream_stats(fname=f'{root}_rank{rank}{ext}', chunk_size=self.params.stats_chunk_size,
+                                    background=self.params.stats_background_writer)
+
         if self.params.dump_setup and rank == 0:
             self.dump_setup(step=self.S, controller_params=controller_params, description=description)
 
@@ -139,6 +146,9 @@ class controller_MPI(controller):
 
         comm_active.Free()
 
+        # write the remaining statistics, if they are streamed to a file
+        self.hooks.close_stats()
+
         return uend, self.hooks.return_stats()
 
     def restart_block(self, size, time, u0):
@@ -37,7 +37,7 @@ class controller_nonMPI(controller):
         # try to initialize via dill.copy (much faster for many time-steps)
         try:
             for _ in range(num_procs - 1):
-                self.MS.append(dill.copy(self.MS[0]))
+                self.MS.append(self.__copy_step(self.MS[0]))
         # if this fails (e.g. due to un-picklable data in the steps), initialize seperately
         except dill.PicklingError and TypeError:
             self.logger.warning('Need to initialize steps separately due to pickling error')
@@ -80,6 +80,27 @@ class controller_nonMPI(controller):
             C.reset_buffers_nonMPI(self)
             C.setup_status_variables(self)
 
+    def __copy_step(self, S):
+        """
+        Copy a step, either completely or sharing the operators which are not changed during the run
+
+        Args:
+            S (pySDC.Step.step): the step to copy
+
+        Returns:
+            pySDC.Step.step: the copy
+        """
+        if not self.params.share_operators:
+            return dill.copy(S)
+
+        # objects in the memo are not copied but used by reference, so shared arrays are made read-only
+        memo = {}
+        for me in S.get_shared_operators():
+            if isinstance(me, np.ndarray):
+                me.setflags(write=False)
+            memo[id(me)] = me
+        return cp.deepcopy(S, memo)
+
     def run(self, u0, t0, Tend):
         """
         Main driver for running the serial version of SDC, MSSDC, MLSDC and PFASST (virtual parallelism)
@@ -167,6 +188,9 @@ class controller_nonMPI(controller):
         for S in self.MS:
             self.hooks.post_run(step=S, level_number=0)
 
+        # write the remaining statistics, if they are streamed to a file
+        self.hooks.close_stats()
+
         return uend, self.hooks.return_stats()
 
     def restart_block(self, active_slots, time, u0):
@@ -0,0 +1,186 @@
+import numpy as np
+
+from pySDC.core.ConvergenceController import ConvergenceController
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+
+class CheckEnsembleConvergence(ConvergenceController):
+    '''
+    Check convergence for each member of an ensemble of independent realizations separately.
+
+    Problems with an ensemble_size carry many realizations in the leading axis of their values, which are all swept at
+    once. A member counts as converged as soon as its own residual is below the tolerance and it has converged on the
+    previous step (if any), as it would in an individual run. From then on, its values are frozen, i.e. restored after
+    each iteration, so that each member ends with the solution of its individual run, while the others keep iterating.
+    The residual of the step is the maximal residual over the members, such that the step is done when all of them are.
+    The number of iterations of each member is added to the statistics with type 'niter_members' after each step.
+    This needs the non-MPI controller, since the members of a step depend on the state of the previous step.
+
+    Default control order is 150, i.e. before checking the convergence of the step.
+    '''
+
+    def setup(self, controller, params, description):
+        '''
+        Define default parameters here
+
+        Args:
+            controller (pySDC.Controller): The controller
+            params (dict): The params passed for this specific convergence controller
+            description (dict): The description object used to instantiate the controller
+
+        Returns:
+            (dict): The updated params dictionary
+        '''
+        self.frozen = {}
+        return {'control_order': +150, **params}
+
+    def check_parameters(self, controller, params, description):
+        '''
+        Check whether parameters are compatible with whatever assumptions went into the step size functions etc.
+
+        Args:
+            controller (pySDC.Controller): The controller
+            params (dict): The params passed for this specific convergence controller
+            description (dict): The description object used to instantiate the controller
+
+        Returns:
+            bool: Whether the parameters are compatible
+            str: The error message
+        '''
+        if description['problem_params'].get('ensemble_size', None) is None:
+            return False, 'need a problem with ensemble_size to check the convergence of the members'
+        if type(controller) != controller_nonMPI:
+            return False, 'convergence of the members can only be checked with the non-MPI controller'
+
+        return True, ''
+
+    @staticmethod
+    def __copy_members(target, source, members):
+        '''
+        Copy the values of some members from one datatype to another
+
+        Args:
+            target: the datatype to copy to
+            source: the datatype to copy from
+            members (numpy.ndarray): boolean mask of the members
+
+        Returns:
+            None
+        '''
+        if hasattr(source, 'impl'):
+            target.impl[members] = source.impl[members]
+            target.expl[members] = source.expl[members]
+        elif hasattr(source, 'comp1'):
+            target.comp1[members] = source.comp1[members]
+            target.comp2[members] = source.comp2[members]
+        else:
+            target[members] = source[members]
+
+    def __get_state(self, S):
+        '''
+        Get the state of the members on a step, which is reset at the beginning of each step (or restart)
+
+        Args:
+            S (pySDC.Step): The current step
+
+        Returns:
+            dict: the state of the members
+        '''
+        L = S.levels[0]
+        size = L.prob.params.ensemble_size
+
+        if S.status.iter == 0 or S.status.slot not in self.frozen:
+            self.frozen[S.status.slot] = {
+                'members': np.zeros(size, dtype=bool),
+                'niter': np.zeros(size, dtype=int),
+                'residual': np.zeros(size),
+                'u': [None if me is None else L.prob.dtype_u(me) for me in L.u],
+                'f': [None if me is None else L.prob.dtype_f(me) for me in L.f],
+                'prev_members': np.zeros(size, dtype=bool),
+                'u0': L.prob.dtype_u(L.u[0]),
+                'f0': L.prob.dtype_f(L.f[0]),
+            }
+        return self.frozen[S.status.slot]
+
+    def post_iteration_processing(self, controller, S):
+        '''
+        Freeze the converged members and restore the values of the members which have been frozen before
+
+        Args:
+            controller (pySDC.Controller): The controller
+            S (pySDC.Step): The current step
+
+        Returns:
+            None
+        '''
+        L = S.levels[0]
+        state = self.__get_state(S)
+
+        if not S.status.first and not S.status.prev_done:
+            # the previous step keeps sending the values of its frozen members, which it has overwritten during the
+            # sweep, so we keep the initial values we got when they were frozen, as in an individual run
+            prev_frozen = self.frozen[S.prev.status.slot]['members']
+            new = prev_frozen & ~state['prev_members']
+            old = prev_frozen & state['prev_members']
+            self.__copy_members(state['u0'], L.u[0], new)
+            self.__copy_members(state['f0'], L.f[0], new)
+            state['prev_members'] |= new
+
+            if any(old):
+                self.__copy_members(L.u[0], state['u0'], old)
+                self.__copy_members(L.f[0], state['f0'], old)
+                L.sweep.compute_residual()
+
+        # members can only converge if they have converged on the previous step
+        if S.status.first or S.prev.status.done:
+            prev_members = np.ones_like(state['members'])
+        else:
+            prev_members = self.frozen[S.prev.status.slot]['members']
+
+        # restore the members which are frozen already
+        for m in range(len(L.u)):
+            if L.u[m] is not None and state['u'][m] is not None:
+                self.__copy_members(L.u[m], state['u'][m], state['members'])
+            if L.f[m] is not None and state['f'][m] is not None:
+                self.__copy_members(L.f[m], state['f'][m], state['members'])
+        residual = np.where(state['members'], state['residual'], L.status.residual_members)
+
+        # freeze the members which have converged in this iteration
+        new = ~state['members'] & prev_members & (residual <= L.params.restol)
+        for m in range(len(L.u)):
+            if L.u[m] is not None:
+                if state['u'][m] is None:
+                    state['u'][m] = L.prob.dtype_u(L.u[m])
+                self.__copy_members(state['u'][m], L.u[m], new)
+            if L.f[m] is not None:
+                if state['f'][m] is None:
+                    state['f'][m] = L.prob.dtype_f(L.f[m])
+                self.__copy_members(state['f'][m], L.f[m], new)
+        state['residual'][new] = residual[new]
+        state['niter'][new] = S.status.iter
+        state['members'] |= new
+
+        L.status.residual_members = residual
+        L.status.residual = float(residual.max())
+
+        return None
+
+    def post_step_processing(self, controller, S):
+        '''
+        Add the number of iterations of each member to the statistics
+
+        Args:
+            controller (pySDC.Controller): The controller
+            S (pySDC.Step): The current step
+
+        Returns:
+            None
+        '''
+        state = self.frozen.pop(S.status.slot)
+        niter = np.where(state['members'], state['niter'], S.status.iter)
+
+        L = S.levels[0]
+        controller.hooks.add_to_stats(process=S.status.slot, time=L.time, level=L.level_index, iter=S.status.iter,
+                                      sweep=L.status.sweep, type='niter_members', value=niter)
+
+        return None
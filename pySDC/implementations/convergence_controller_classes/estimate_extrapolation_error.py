@@ -126,13 +126,13 @@ el multistep mode!'
         if type(f) == imex_mesh:
             self.prev.f[oldest_val] = f.impl + f.expl
         elif type(f) == mesh:
-            self.prev.f[oldest_val] = f
+            self.prev.f[oldest_val] = mesh(f)
         else:
             raise DataError(f'Unable to store f from datatype {type(f)}, extrapolation based error estimate only\
  works with types imex_mesh and mesh')
 
         # store the rest of the values
-        self.prev.u[oldest_val] = S.levels[0].u[-1]
+        self.prev.u[oldest_val] = S.levels[0].prob.dtype_u(S.levels[0].u[-1])
         self.prev.t[oldest_val] = S.time + S.dt
         self.prev.dt[oldest_val] = S.dt
 
@@ -119,6 +119,6 @@ smaller than 0!'
         '''
         if S.status.iter == S.params.maxiter:
             for L in S.levels:
-                L.u[:] = L.uold[:]
+                L.u[:] = [L.prob.dtype_u(me) if me is not None else None for me in L.uold]
 
         return None
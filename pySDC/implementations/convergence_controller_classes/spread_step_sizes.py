@@ -85,6 +85,9 @@ class SpreadStepSizesBlockwise(ConvergenceController):
         for p in active_slots:
             # spread the step sizes to all levels
             for i in range(len(MS[p].levels)):
+                # factorizations for the old step size will not be needed anymore
+                if MS[p].levels[i].params.dt != new_steps[i]:
+                    MS[p].levels[i].prob.reset_factorization_cache()
                 MS[p].levels[i].params.dt = new_steps[i]
 
         return None
@@ -35,7 +35,7 @@ class StoreUOld(ConvergenceController):
         '''
         if S.status.iter < S.params.maxiter:
             for L in S.levels:
-                L.uold[:] = L.u[:]
+                L.uold[:] = [L.prob.dtype_u(me) if me is not None else None for me in L.u]
 
         return None
 
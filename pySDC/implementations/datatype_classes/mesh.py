@@ -54,9 +54,9 @@ class mesh(np.ndarray):
     def __array_finalize__(self, obj):
         """
         Finalizing the datatype. Without this, new datatypes do not 'inherit' the communicator.
+
+        Meshes created from scratch (e.g. when unpickled in another process) start without communicator.
         """
-        if obj is None:
-            return
         self._comm = getattr(obj, '_comm', None)
 
     def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
@@ -71,6 +71,11 @@ class mesh(np.ndarray):
                 comm = input_.comm
             else:
                 args.append(input_)
+        # pass output arrays on to allow for in-place operations (e.g. np.multiply(a, b, out=c) or a += b)
+        if out is not None:
+            kwargs['out'] = tuple(o.view(np.ndarray) if isinstance(o, mesh) else o for o in out)
+            super(mesh, self).__array_ufunc__(ufunc, method, *args, **kwargs)
+            return out[0] if len(out) == 1 else out
         results = super(mesh, self).__array_ufunc__(ufunc, method, *args, **kwargs).view(mesh)
         if not method == 'reduce':
             results._comm = comm
@@ -97,6 +102,28 @@ class mesh(np.ndarray):
 
         return float(global_absval)
 
+    @staticmethod
+    def batched_abs(values):
+        """
+        Compute the absolute maximum of many meshes with a single reduction instead of one per mesh
+
+        All meshes are expected to live on the same communicator.
+
+        Args:
+            values (list of mesh): the meshes
+
+        Returns:
+            list of float: absolute maxima of the meshes
+        """
+        # take local absolute maxima, one entry per mesh (empty local parts do not contribute)
+        absvals = np.array([np.amax(np.abs(me.view(np.ndarray)), initial=0.0) for me in values], dtype=float)
+
+        comm = values[0].comm if len(values) > 0 else None
+        if comm is not None and comm.Get_size() > 1:
+            comm.Allreduce(MPI.IN_PLACE, absvals, op=MPI.MAX)
+
+        return [float(v) for v in absvals]
+
     def isend(self, dest=None, tag=None, comm=None):
         """
         Routine for sending data forward in time (non-blocking)
@@ -0,0 +1,177 @@
+import numpy as np
+
+from pySDC.core.Errors import DataError
+from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh, comp2_mesh
+
+
+class mesh_stack(object):
+    """
+    Contiguous storage for a fixed number of mesh-based values, e.g. the values at all collocation nodes of a level
+
+    All entries are backed by one array of shape (num_entries, *shape) per component. The class mimics the list
+    interface used by the levels: reading an entry returns a view of the datatype into the stack, writing an entry
+    copies the values into the stack, and entries which have not been written yet (or have been set to None) read as
+    None. This allows to treat all nodes at once, e.g. via a single tensor contraction with the collocation matrix.
+
+    Attributes:
+        dtype: datatype of the entries (mesh, imex_mesh or comp2_mesh)
+        components (tuple): names of the components of the datatype, (None,) for plain meshes
+        comm: MPI communicator or None
+    """
+
+    def __init__(self, init, dtype, num_entries):
+        """
+        Initialization routine
+
+        Args:
+            init: tuple containing the dimensions, the communicator and the dtype (as for mesh)
+            dtype: datatype of the entries
+            num_entries (int): number of entries in the stack
+        Raises:
+            DataError: if the datatype or init cannot be stacked
+        """
+
+        if isinstance(dtype, type) and issubclass(dtype, mesh):
+            self.components = (None,)
+        elif dtype is imex_mesh:
+            self.components = ('impl', 'expl')
+        elif dtype is comp2_mesh:
+            self.components = ('comp1', 'comp2')
+        else:
+            raise DataError('cannot stack data of type %s' % dtype)
+
+        if not (isinstance(init, tuple) and len(init) == 3 and isinstance(init[2], np.dtype)):
+            raise DataError('cannot stack data with init %s' % str(init))
+
+        self.dtype = dtype
+        self.init = init
+        self.comm = init[1]
+
+        shape = (num_entries,) + tuple(np.atleast_1d(init[0]))
+        self.__data = {comp: np.zeros(shape, dtype=init[2]) for comp in self.components}
+        self.__valid = np.zeros(num_entries, dtype=bool)
+
+    @property
+    def u_type(self):
+        """
+        Datatype of a single component, used for results of linear combinations (e.g. integrals)
+
+        Returns:
+            type: mesh class of the components
+        """
+        return self.dtype if self.components == (None,) else mesh
+
+    @property
+    def valid(self):
+        """
+        Returns:
+            numpy.ndarray: boolean flags indicating which entries hold data
+        """
+        return self.__valid
+
+    def get_stack(self, comp=None):
+        """
+        Getter for the stacked raw data
+
+        Args:
+            comp (str): name of the component (None for plain meshes)
+
+        Returns:
+            numpy.ndarray: array of shape (num_entries, *shape), writing to it changes the entries
+        """
+        return self.__data[comp]
+
+    def reset(self):
+        """
+        Mark all entries as empty, but keep the storage
+        """
+        self.__valid[:] = False
+
+    def __view(self, comp, m):
+        """
+        Helper routine to create a mesh view of a single entry
+
+        Args:
+            comp (str): name of the component
+            m (int): index of the entry
+
+        Returns:
+            mesh: view into the stack
+        """
+        me = self.__data[comp][m].view(self.u_type)
+        me._comm = self.comm
+        return me
+
+    def __len__(self):
+        return len(self.__valid)
+
+    def __iter__(self):
+        for m in range(len(self)):
+            yield self[m]
+
+    def __getitem__(self, key):
+        """
+        Read entries of the stack
+
+        Args:
+            key (int or slice): index of the entry
+
+        Returns:
+            view of the entry as dtype, None if it has not been set (list of those for slices)
+        """
+        if isinstance(key, slice):
+            return [self[m] for m in range(*key.indices(len(self)))]
+
+        m = range(len(self))[key]
+        if not self.__valid[m]:
+            return None
+
+        if self.components == (None,):
+            return self.__view(None, m)
+
+        me = self.dtype.__new__(self.dtype)
+        for comp in self.components:
+            setattr(me, comp, self.__view(comp, m))
+        return me
+
+    def __setitem__(self, key, value):
+        """
+        Write entries of the stack by copying the values into the storage
+
+        Args:
+            key (int or slice): index of the entry
+            value: values of type dtype or None (list of those for slices)
+        """
+        if isinstance(key, slice):
+            for m, v in zip(range(*key.indices(len(self))), value):
+                self[m] = v
+            return
+
+        m = range(len(self))[key]
+        if value is None:
+            self.__valid[m] = False
+            return
+
+        for comp in self.components:
+            self.__data[comp][m][...] = value if comp is None else getattr(value, comp)
+        self.__valid[m] = True
+
+    def contract(self, mat, start=0):
+        """
+        Compute all linear combinations sum_j mat[i, j] * self[start + j] in a single tensor contraction.
+
+        For data with multiple components, the components are summed up (as e.g. needed for integrating the RHS).
+
+        Args:
+            mat (numpy.ndarray): coefficient matrix of shape (n, k)
+            start (int): index of the first entry to combine
+
+        Returns:
+            mesh_stack: stack of n combinations of type u_type
+        """
+        me = mesh_stack(self.init, self.u_type, mat.shape[0])
+        res = me.get_stack()
+        for comp in self.components:
+            res += np.tensordot(mat, self.__data[comp][start:start + mat.shape[1]], axes=1)
+        me.valid[:] = True
+        return me
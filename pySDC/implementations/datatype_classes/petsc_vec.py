@@ -1,3 +1,5 @@
+import numpy as np
+from mpi4py import MPI
 from petsc4py import PETSc
 
 from pySDC.core.Errors import DataError
@@ -29,6 +31,28 @@ class petsc_vec(PETSc.Vec):
         # take absolute values of the mesh values (INF = 3)
         return self.norm(3)
 
+    @staticmethod
+    def batched_abs(values):
+        """
+        Compute the absolute maximum of many vecs with a single reduction instead of one per vec
+
+        All vecs are expected to live on the same communicator.
+
+        Args:
+            values (list of petsc_vec): the vecs
+
+        Returns:
+            list of float: absolute maxima of the vecs
+        """
+        # take local absolute maxima, one entry per vec (empty local parts do not contribute)
+        absvals = np.array([np.amax(np.abs(me.getArray(readonly=True)), initial=0.0) for me in values], dtype=float)
+
+        comm = values[0].getComm().tompi4py() if len(values) > 0 else None
+        if comm is not None and comm.Get_size() > 1:
+            comm.Allreduce(MPI.IN_PLACE, absvals, op=MPI.MAX)
+
+        return [float(v) for v in absvals]
+
     def isend(self, dest=None, tag=None, comm=None):
         """
         Routine for sending data forward in time (non-blocking)
@@ -78,6 +78,30 @@ class advectiondiffusion1d_imex(ptype):
 
         return f
 
+    def eval_f_batch(self, U, times):
+        """
+        Routine to evaluate the RHS for several values at once, using one FFT over all of them
+
+        Args:
+            U (list of dtype_u): current values
+            times (list of float): current times
+
+        Returns:
+            list of dtype_f: the RHS for each value
+        """
+
+        tmp_u = np.fft.rfft(np.stack([np.asarray(u) for u in U]))
+        impl = np.fft.irfft(self.params.nu * self.lap * tmp_u)
+        expl = np.fft.irfft(-self.params.c * self.ddx * tmp_u)
+
+        F = []
+        for k in range(len(U)):
+            F.append(self.dtype_f(self.init))
+            F[-1].impl[:] = impl[k]
+            F[-1].expl[:] = expl[k]
+
+        return F
+
     def solve_system(self, rhs, factor, u0, t):
         """
         Simple FFT solver for the diffusion part
@@ -98,6 +122,32 @@ class advectiondiffusion1d_imex(ptype):
 
         return me
 
+    def solve_system_batch(self, rhs, factors, u0, t):
+        """
+        Simple FFT solver for the diffusion part for several right-hand sides at once, using one FFT over all of them
+
+        Args:
+            rhs (list): right-hand sides for the linear systems
+            factors (list): factors for each system
+            u0 (list): initial guesses for the iterative solver (not used here so far)
+            t (list): current times (e.g. for time-dependent BCs)
+
+        Returns:
+            list: solutions as meshes
+        """
+
+        factors = np.array(factors)[:, None]
+        tmp = np.fft.rfft(np.stack([np.asarray(me) for me in rhs])) / (1.0 - self.params.nu * factors * self.lap)
+        x = np.fft.irfft(tmp)
+
+        sol = []
+        for k in range(len(rhs)):
+            me = self.dtype_u(self.init)
+            me[:] = x[k]
+            sol.append(me)
+
+        return sol
+
     def u_exact(self, t):
         """
         Routine to compute the exact solution at time t
@@ -167,6 +217,28 @@ class advectiondiffusion1d_implicit(advectiondiffusion1d_imex):
 
         return f
 
+    def eval_f_batch(self, U, times):
+        """
+        Routine to evaluate the RHS for several values at once, using one FFT over all of them
+
+        Args:
+            U (list of dtype_u): current values
+            times (list of float): current times
+
+        Returns:
+            list of dtype_f: the RHS for each value
+        """
+
+        tmp_u = np.fft.rfft(np.stack([np.asarray(u) for u in U]))
+        tmp = np.fft.irfft(self.params.nu * self.lap * tmp_u - self.params.c * self.ddx * tmp_u)
+
+        F = []
+        for k in range(len(U)):
+            F.append(self.dtype_f(self.init))
+            F[-1][:] = tmp[k]
+
+        return F
+
     def solve_system(self, rhs, factor, u0, t):
         """
         Simple FFT solver for the diffusion and advection part (both are linear!)
@@ -186,3 +258,31 @@ class advectiondiffusion1d_implicit(advectiondiffusion1d_imex):
         me[:] = np.fft.irfft(tmp)
 
         return me
+
+    def solve_system_batch(self, rhs, factors, u0, t):
+        """
+        Simple FFT solver for the diffusion and advection part for several right-hand sides at once, using one FFT over
+        all of them
+
+        Args:
+            rhs (list): right-hand sides for the linear systems
+            factors (list): factors for each system
+            u0 (list): initial guesses for the iterative solver (not used here so far)
+            t (list): current times (e.g. for time-dependent BCs)
+
+        Returns:
+            list: solutions as meshes
+        """
+
+        factors = np.array(factors)[:, None]
+        tmp = np.fft.rfft(np.stack([np.asarray(me) for me in rhs])) / \
+            (1.0 - factors * (self.params.nu * self.lap - self.params.c * self.ddx))
+        x = np.fft.irfft(tmp)
+
+        sol = []
+        for k in range(len(rhs)):
+            me = self.dtype_u(self.init)
+            me[:] = x[k]
+            sol.append(me)
+
+        return sol
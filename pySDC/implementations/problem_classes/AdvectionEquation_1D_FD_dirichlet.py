@@ -1,14 +1,14 @@
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import splu
 
 from pySDC.core.Errors import ParameterError, ProblemError
 from pySDC.core.Problem import ptype
+from pySDC.helpers.banded_helper import GroupedSolves, factorize
 from pySDC.implementations.datatype_classes.mesh import mesh
 
 
 # noinspection PyUnusedLocal
-class advection1d_dirichlet(ptype):
+class advection1d_dirichlet(GroupedSolves, ptype):
     """
     Example implementing the unforced 1D advection equation with periodic BC in [0,1],
     discretized using upwinding finite differences
@@ -52,6 +52,9 @@ class advection1d_dirichlet(ptype):
         self.dx = 1.0 / (self.params.nvars + 1)
         self.A = self.__get_A(self.params.nvars, self.params.c, self.dx, self.params.order, self.params.type)
 
+        # the systems to solve only depend on the factor, so their factorizations can be reused
+        self.setup_factorization_cache()
+
     @staticmethod
     def __get_A(N, c, dx, order, type):
         """
@@ -113,6 +116,19 @@ class advection1d_dirichlet(ptype):
         f[:] = -1.0 * self.A.dot(u)
         return f
 
+    def get_system_solver(self, factor):
+        """
+        Helper function to get the (cached) factorization of I+factor*A, banded if possible
+
+        Args:
+            factor (float): abbrev. for the node-to-node stepsize (or any other factor required)
+
+        Returns:
+            factorization with a method solve
+        """
+        return self.get_factorization(factor,
+                                      lambda: factorize(sp.eye(self.params.nvars, format='csc') + factor * self.A))
+
     def solve_system(self, rhs, factor, u0, t):
         """
         Simple linear solver for (I+factor*A)u = rhs
@@ -128,7 +144,7 @@ class advection1d_dirichlet(ptype):
         """
 
         me = self.dtype_u(self.init)
-        L = splu(sp.eye(self.params.nvars, format='csc') + factor * self.A)
+        L = self.get_system_solver(factor)
         me[:] = L.solve(rhs)
         return me
 
@@ -1,11 +1,12 @@
 
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import spsolve
 
 from pySDC.core.Errors import ParameterError, ProblemError
 from pySDC.core.Problem import ptype
+from pySDC.helpers.banded_helper import factorize
 from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh, comp2_mesh
+from pySDC.implementations.solver_classes.newton import newton_solver
 
 
 class allencahn_front_fullyimplicit(ptype):
@@ -16,6 +17,7 @@ class allencahn_front_fullyimplicit(ptype):
     Attributes:
         A: second-order FD discretization of the 1D laplace operator
         dx: distance between two spatial nodes
+        newton_solver (newton_solver): Newton's method, with the strategy given by newton_strategy and newton_refresh
     """
 
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=mesh):
@@ -41,6 +43,10 @@ class allencahn_front_fullyimplicit(ptype):
 
         if 'stop_at_nan' not in problem_params:
             problem_params['stop_at_nan'] = True
+        if 'newton_strategy' not in problem_params:
+            problem_params['newton_strategy'] = 'full'
+        if 'newton_refresh' not in problem_params:
+            problem_params['newton_refresh'] = None
 
         # invoke super init, passing number of dofs, dtype_u and dtype_f
         super(allencahn_front_fullyimplicit, self).__init__((problem_params['nvars'], None, np.dtype('float64')),
@@ -53,11 +59,23 @@ class allencahn_front_fullyimplicit(ptype):
         self.A = self.__get_A(self.params.nvars, self.dx)
         self.uext = self.dtype_u((self.init[0] + 2, self.init[1], self.init[2]), val=0.0)
 
+        # the linear systems of the semi-implicit variants only depend on the factor, so their factorizations are kept
+        self.setup_factorization_cache()
+        self.newton_solver = newton_solver({'strategy': self.params.newton_strategy,
+                                            'refresh': self.params.newton_refresh,
+                                            'maxiter': self.params.newton_maxiter, 'tol': self.params.newton_tol})
         self.newton_itercount = 0
         self.lin_itercount = 0
         self.newton_ncalls = 0
         self.lin_ncalls = 0
 
+    def reset_factorization_cache(self):
+        """
+        Drop all cached factorizations and the frozen Jacobians of Newton's method
+        """
+        super(allencahn_front_fullyimplicit, self).reset_factorization_cache()
+        self.newton_solver.reset()
+
     @staticmethod
     def __get_A(N, dx):
         """
@@ -102,33 +120,20 @@ class allencahn_front_fullyimplicit(ptype):
         self.uext[-1] = 0.5 * (1 + np.tanh((self.params.interval[1] - v * t) / (np.sqrt(2) * self.params.eps)))
 
         A = self.A[1:-1, 1:-1]
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.params.newton_maxiter:
-            # print(n)
+
+        def g(u):
             # form the function g with g(u) = 0
             self.uext[1:-1] = u[:]
-            g = u - rhs \
+            return u - rhs \
                 - factor * (self.A.dot(self.uext)[1:-1] - 2.0 / eps2 * u * (1.0 - u) * (1.0 - 2.0 * u) -
                             6.0 * dw * u * (1.0 - u))
 
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.params.newton_tol:
-                break
-
-            # assemble dg
-            dg = Id - factor * (A - 2.0 / eps2 * sp.diags(
+        def dg(u):
+            return Id - factor * (A - 2.0 / eps2 * sp.diags(
                 (1.0 - u) * (1.0 - 2.0 * u) - u * ((1.0 - 2.0 * u) + 2.0 * (1.0 - u)), offsets=0) - 6.0 * dw * sp.diags(
                 (1.0 - u) - u, offsets=0))
 
-            # newton update: u1 = u0 - g/dg
-            u -= spsolve(dg, g)
-            # u -= gmres(dg, g, x0=z, tol=self.params.lin_tol)[0]
-            # increase iteration count
-            n += 1
+        u, n, res = self.newton_solver.solve(g, dg, u, key=factor)
 
         if np.isnan(res) and self.params.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
@@ -266,7 +271,9 @@ class allencahn_front_semiimplicit(allencahn_front_fullyimplicit):
         self.uext[0] = 0.0
         self.uext[-1] = 0.0
         self.uext[1:-1] = rhs[:]
-        me[:] = spsolve(sp.eye(self.params.nvars + 2, format='csc') - factor * self.A, self.uext)[1:-1]
+        L = self.get_factorization(factor,
+                                   lambda: factorize(sp.eye(self.params.nvars + 2, format='csc') - factor * self.A))
+        me[:] = L.solve(self.uext)[1:-1]
         return me
 
 
@@ -302,35 +309,21 @@ class allencahn_front_finel(allencahn_front_fullyimplicit):
         self.uext[-1] = 0.5 * (1 + np.tanh((self.params.interval[1] - v * t) / (np.sqrt(2) * self.params.eps)))
 
         A = self.A[1:-1, 1:-1]
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.params.newton_maxiter:
-            # print(n)
+
+        def g(u):
             # form the function g with g(u) = 0
             self.uext[1:-1] = u[:]
             gprim = 1.0 / self.dx ** 2 * ((1.0 - a2) / (1.0 - a2 * (2.0 * u - 1.0) ** 2) - 1.0) * (2.0 * u - 1.0)
-            g = u - rhs - factor * (self.A.dot(self.uext)[1:-1] - 1.0 * gprim - 6.0 * dw * u * (1.0 - u))
-
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
+            return u - rhs - factor * (self.A.dot(self.uext)[1:-1] - 1.0 * gprim - 6.0 * dw * u * (1.0 - u))
 
-            if res < self.params.newton_tol:
-                break
-
-            # assemble dg
+        def dg(u):
             dgprim = 1.0 / self.dx ** 2 * \
                 (2.0 * ((1.0 - a2) / (1.0 - a2 * (2.0 * u - 1.0) ** 2) - 1.0) +
                  (2.0 * u - 1) ** 2 * (1.0 - a2) * 4 * a2 / (1.0 - a2 * (2.0 * u - 1.0) ** 2) ** 2)
 
-            dg = Id - factor * (A - 1.0 * sp.diags(dgprim, offsets=0) - 6.0 * dw * sp.diags((1.0 - u) - u, offsets=0))
+            return Id - factor * (A - 1.0 * sp.diags(dgprim, offsets=0) - 6.0 * dw * sp.diags((1.0 - u) - u, offsets=0))
 
-            # newton update: u1 = u0 - g/dg
-            u -= spsolve(dg, g)
-            # For some reason, doing cg or gmres does not work so well here...
-            # u -= cg(dg, g, x0=z, tol=self.params.lin_tol)[0]
-            # increase iteration count
-            n += 1
+        u, n, res = self.newton_solver.solve(g, dg, u, key=factor)
 
         if np.isnan(res) and self.params.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
@@ -382,6 +375,7 @@ class allencahn_periodic_fullyimplicit(ptype):
     Attributes:
         A: second-order FD discretization of the 1D laplace operator
         dx: distance between two spatial nodes
+        newton_solver (newton_solver): Newton's method, with the strategy given by newton_strategy and newton_refresh
     """
 
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=mesh):
@@ -407,6 +401,10 @@ class allencahn_periodic_fullyimplicit(ptype):
 
         if 'stop_at_nan' not in problem_params:
             problem_params['stop_at_nan'] = True
+        if 'newton_strategy' not in problem_params:
+            problem_params['newton_strategy'] = 'full'
+        if 'newton_refresh' not in problem_params:
+            problem_params['newton_refresh'] = None
 
         # invoke super init, passing number of dofs, dtype_u and dtype_f
         super(allencahn_periodic_fullyimplicit, self).__init__((problem_params['nvars'], None, np.dtype('float64')),
@@ -418,11 +416,23 @@ class allencahn_periodic_fullyimplicit(ptype):
 
         self.A = self.__get_A(self.params.nvars, self.dx)
 
+        # the linear systems of the semi-implicit variants only depend on the factor, so their factorizations are kept
+        self.setup_factorization_cache()
+        self.newton_solver = newton_solver({'strategy': self.params.newton_strategy,
+                                            'refresh': self.params.newton_refresh,
+                                            'maxiter': self.params.newton_maxiter, 'tol': self.params.newton_tol})
         self.newton_itercount = 0
         self.lin_itercount = 0
         self.newton_ncalls = 0
         self.lin_ncalls = 0
 
+    def reset_factorization_cache(self):
+        """
+        Drop all cached factorizations and the frozen Jacobians of Newton's method
+        """
+        super(allencahn_periodic_fullyimplicit, self).reset_factorization_cache()
+        self.newton_solver.reset()
+
     @staticmethod
     def __get_A(N, dx):
         """
@@ -468,31 +478,17 @@ class allencahn_periodic_fullyimplicit(ptype):
 
         Id = sp.eye(self.params.nvars)
 
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.params.newton_maxiter:
-            # print(n)
+        def g(u):
             # form the function g with g(u) = 0
-            g = u - rhs - factor * (self.A.dot(u) - 2.0 / eps2 * u * (1.0 - u) * (1.0 - 2.0 * u) -
-                                    6.0 * dw * u * (1.0 - u))
+            return u - rhs - factor * (self.A.dot(u) - 2.0 / eps2 * u * (1.0 - u) * (1.0 - 2.0 * u) -
+                                       6.0 * dw * u * (1.0 - u))
 
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.params.newton_tol:
-                break
-
-            # assemble dg
-            dg = Id - factor * (self.A - 2.0 / eps2 * sp.diags(
+        def dg(u):
+            return Id - factor * (self.A - 2.0 / eps2 * sp.diags(
                 (1.0 - u) * (1.0 - 2.0 * u) - u * ((1.0 - 2.0 * u) + 2.0 * (1.0 - u)), offsets=0) - 6.0 * dw * sp.diags(
                 (1.0 - u) - u, offsets=0))
 
-            # newton update: u1 = u0 - g/dg
-            u -= spsolve(dg, g)
-            # u -= gmres(dg, g, x0=z, tol=self.params.lin_tol)[0]
-            # increase iteration count
-            n += 1
+        u, n, res = self.newton_solver.solve(g, dg, u, key=factor)
 
         if np.isnan(res) and self.params.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
@@ -593,7 +589,8 @@ class allencahn_periodic_semiimplicit(allencahn_periodic_fullyimplicit):
         """
 
         me = self.dtype_u(u0)
-        me[:] = spsolve(sp.eye(self.params.nvars, format='csc') - factor * self.A, rhs)
+        L = self.get_factorization(factor, lambda: factorize(sp.eye(self.params.nvars, format='csc') - factor * self.A))
+        me[:] = L.solve(rhs)
         return me
 
     def eval_f(self, u, t):
@@ -664,7 +661,8 @@ class allencahn_periodic_multiimplicit(allencahn_periodic_fullyimplicit):
         """
 
         me = self.dtype_u(u0)
-        me[:] = spsolve(sp.eye(self.params.nvars, format='csc') - factor * self.A, rhs)
+        L = self.get_factorization(factor, lambda: factorize(sp.eye(self.params.nvars, format='csc') - factor * self.A))
+        me[:] = L.solve(rhs)
         return me
 
     def eval_f(self, u, t):
@@ -704,31 +702,17 @@ class allencahn_periodic_multiimplicit(allencahn_periodic_fullyimplicit):
 
         Id = sp.eye(self.params.nvars)
 
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.params.newton_maxiter:
-            # print(n)
+        def g(u):
             # form the function g with g(u) = 0
-            g = u - rhs - factor * (- 2.0 / eps2 * u * (1.0 - u) * (1.0 - 2.0 * u) -
-                                    6.0 * dw * u * (1.0 - u) + 0.0 / self.params.eps ** 2 * u)
-
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.params.newton_tol:
-                break
+            return u - rhs - factor * (- 2.0 / eps2 * u * (1.0 - u) * (1.0 - 2.0 * u) -
+                                       6.0 * dw * u * (1.0 - u) + 0.0 / self.params.eps ** 2 * u)
 
-            # assemble dg
-            dg = Id - factor * (- 2.0 / eps2 * sp.diags(
+        def dg(u):
+            return Id - factor * (- 2.0 / eps2 * sp.diags(
                 (1.0 - u) * (1.0 - 2.0 * u) - u * ((1.0 - 2.0 * u) + 2.0 * (1.0 - u)), offsets=0) - 6.0 * dw * sp.diags(
                 (1.0 - u) - u, offsets=0) + 0.0 / self.params.eps ** 2 * Id)
 
-            # newton update: u1 = u0 - g/dg
-            u -= spsolve(dg, g)
-            # u -= gmres(dg, g, x0=z, tol=self.params.lin_tol)[0]
-            # increase iteration count
-            n += 1
+        u, n, res = self.newton_solver.solve(g, dg, u, key=factor)
 
         if np.isnan(res) and self.params.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
@@ -1,11 +1,12 @@
 
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import cg
 
 from pySDC.core.Errors import ParameterError, ProblemError
-from pySDC.core.Problem import ptype
+from pySDC.core.Problem import ptype, StencilOperator
 from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh, comp2_mesh
+from pySDC.implementations.solver_classes.linear_solver import linear_solver
+from pySDC.implementations.solver_classes.newton import newton_solver
 
 
 # http://www.personal.psu.edu/qud2/Res/Pre/dz09sisc.pdf
@@ -17,8 +18,11 @@ class allencahn_fullyimplicit(ptype):
     Example implementing the Allen-Cahn equation in 2D with finite differences and periodic BC
 
     Attributes:
-        A: second-order FD discretization of the 2D laplace operator
+        operator (StencilOperator): matrix-free second-order FD discretization of the 2D laplace operator
+        A: the same operator assembled as sparse matrix, built on first access
         dx: distance between two spatial nodes (same for both directions)
+        linear_solver (linear_solver): solver for the linear systems and the linear systems in Newton's method
+        newton_solver (newton_solver): Newton's method, with the strategy given by newton_strategy and newton_refresh
     """
 
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=mesh):
@@ -38,6 +42,17 @@ class allencahn_fullyimplicit(ptype):
                 msg = 'need %s to instantiate problem, only got %s' % (key, str(problem_params.keys()))
                 raise ParameterError(msg)
 
+        if 'lin_solver' not in problem_params:
+            problem_params['lin_solver'] = 'CG'
+        if problem_params['lin_solver'] not in ['CG', 'MG', 'PCG']:
+            raise ParameterError(f'lin_solver {problem_params["lin_solver"]} not implemented, choose CG, MG or PCG')
+        if 'linear_solver' not in problem_params:
+            problem_params['linear_solver'] = {}
+        if 'newton_strategy' not in problem_params:
+            problem_params['newton_strategy'] = 'full'
+        if 'newton_refresh' not in problem_params:
+            problem_params['newton_refresh'] = None
+
         # we assert that nvars looks very particular here.. this will be necessary for coarsening in space later on
         if len(problem_params['nvars']) != 2:
             raise ProblemError('this is a 2d example, got %s' % problem_params['nvars'])
@@ -50,41 +65,68 @@ class allencahn_fullyimplicit(ptype):
         super(allencahn_fullyimplicit, self).__init__((problem_params['nvars'], None, np.dtype('float64')),
                                                       dtype_u, dtype_f, problem_params)
 
-        # compute dx and get discretization matrix A
+        # compute dx and get discretization operator
         self.dx = 1.0 / self.params.nvars[0]
-        self.A = self.__get_A(self.params.nvars, self.dx)
+        self.operator = StencilOperator(self.params.nvars, [1, -2, 1], [-1, 0, 1], factor=1.0 / (self.dx ** 2))
         self.xvalues = np.array([i * self.dx - 0.5 for i in range(self.params.nvars[0])])
 
+        # factorizations and multigrid hierarchies for the linear systems only depend on the factor, so they are kept
+        self.setup_factorization_cache()
+        solver_params = {'method': 'CG' if self.params.lin_solver == 'PCG' else self.params.lin_solver,
+                         'preconditioner': 'MG' if self.params.lin_solver == 'PCG' else None,
+                         'tol': self.params.lin_tol, 'maxiter': self.params.lin_maxiter, **self.params.linear_solver}
+        self.linear_solver = linear_solver(solver_params, nvars=self.params.nvars, periodic=True,
+                                           cache=self.factorization_cache)
+        self.newton_solver = newton_solver({'strategy': self.params.newton_strategy,
+                                            'refresh': self.params.newton_refresh,
+                                            'maxiter': self.params.newton_maxiter, 'tol': self.params.newton_tol},
+                                           solver=self.linear_solver)
+
         self.newton_itercount = 0
         self.lin_itercount = 0
         self.newton_ncalls = 0
         self.lin_ncalls = 0
 
-    @staticmethod
-    def __get_A(N, dx):
+    @property
+    def A(self):
         """
-        Helper function to assemble FD matrix A in sparse format
+        Getter for the assembled discretization matrix, e.g. for the Jacobian in Newton's method
+
+        Returns:
+            scipy.sparse.csc_matrix: matrix A in CSC format
+        """
+        return self.operator.matrix
+
+    def reset_factorization_cache(self):
+        """
+        Drop all cached factorizations and the frozen Jacobians of Newton's method
+        """
+        super(allencahn_fullyimplicit, self).reset_factorization_cache()
+        self.newton_solver.reset()
+
+    def solve_linear_system(self, rhs, factor, u0):
+        """
+        Linear solver for (I-factor*A)u = rhs, using the configured linear solver
 
         Args:
-            N (list): number of dofs
-            dx (float): distance between two spatial nodes
+            rhs (dtype_f): right-hand side for the linear system
+            factor (float): abbrev. for the local stepsize (or any other factor required)
+            u0 (dtype_u): initial guess for the iterative solver
 
         Returns:
-            scipy.sparse.csc_matrix: matrix A in CSC format
+            dtype_u: solution as mesh
         """
 
-        stencil = [1, -2, 1]
-        zero_pos = 2
+        me = self.dtype_u(self.init)
 
-        dstencil = np.concatenate((stencil, np.delete(stencil, zero_pos - 1)))
-        offsets = np.concatenate(([N[0] - i - 1 for i in reversed(range(zero_pos - 1))],
-                                  [i - zero_pos + 1 for i in range(zero_pos - 1, len(stencil))]))
-        doffsets = np.concatenate((offsets, np.delete(offsets, zero_pos - 1) - N[0]))
+        Id = sp.eye(self.params.nvars[0] * self.params.nvars[1], format='csc')
+        me[:] = self.linear_solver.solve(self.operator.get_system_operator(factor), rhs, x0=u0, key=factor,
+                                         matrix=lambda: Id - factor * self.A).reshape(self.params.nvars)
 
-        A = sp.diags(dstencil, doffsets, shape=(N[0], N[0]), format='csc')
-        A = sp.kron(A, sp.eye(N[0])) + sp.kron(sp.eye(N[1]), A)
-        A *= 1.0 / (dx ** 2)
-        return A
+        self.lin_ncalls += 1
+        self.lin_itercount += self.linear_solver.last_niter
+
+        return me
 
     # noinspection PyTypeChecker
     def solve_system(self, rhs, factor, u0, t):
@@ -102,35 +144,19 @@ class allencahn_fullyimplicit(ptype):
         """
 
         u = self.dtype_u(u0).flatten()
-        z = self.dtype_u(self.init, val=0.0).flatten()
         nu = self.params.nu
         eps2 = self.params.eps ** 2
 
         Id = sp.eye(self.params.nvars[0] * self.params.nvars[1])
 
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.params.newton_maxiter:
-
+        def g(u):
             # form the function g with g(u) = 0
-            g = u - factor * (self.A.dot(u) + 1.0 / eps2 * u * (1.0 - u ** nu)) - rhs.flatten()
-
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.params.newton_tol:
-                break
+            return u - factor * (self.operator.dot(u) + 1.0 / eps2 * u * (1.0 - u ** nu)) - rhs.flatten()
 
-            # assemble dg
-            dg = Id - factor * (self.A + 1.0 / eps2 * sp.diags((1.0 - (nu + 1) * u ** nu), offsets=0))
+        def dg(u):
+            return Id - factor * (self.A + 1.0 / eps2 * sp.diags((1.0 - (nu + 1) * u ** nu), offsets=0))
 
-            # newton update: u1 = u0 - g/dg
-            # u -= spsolve(dg, g)
-            u -= cg(dg, g, x0=z, tol=self.params.lin_tol)[0]
-            # increase iteration count
-            n += 1
-            # print(n, res)
+        u, n, res = self.newton_solver.solve(g, dg, u, key=factor)
 
         # if n == self.params.newton_maxiter:
         #     raise ProblemError('Newton did not converge after %i iterations, error is %s' % (n, res))
@@ -156,7 +182,8 @@ class allencahn_fullyimplicit(ptype):
         """
         f = self.dtype_f(self.init)
         v = u.flatten()
-        f[:] = (self.A.dot(v) + 1.0 / self.params.eps ** 2 * v * (1.0 - v ** self.params.nu)).reshape(self.params.nvars)
+        f[:] = (self.operator.dot(v) + 1.0 / self.params.eps ** 2 * v * (1.0 - v ** self.params.nu)).reshape(
+            self.params.nvars)
 
         return f
 
@@ -213,7 +240,7 @@ class allencahn_semiimplicit(allencahn_fullyimplicit):
         """
         f = self.dtype_f(self.init)
         v = u.flatten()
-        f.impl[:] = self.A.dot(v).reshape(self.params.nvars)
+        f.impl[:] = self.operator.dot(v).reshape(self.params.nvars)
         f.expl[:] = (1.0 / self.params.eps ** 2 * v * (1.0 - v ** self.params.nu)).reshape(self.params.nvars)
 
         return f
@@ -232,24 +259,7 @@ class allencahn_semiimplicit(allencahn_fullyimplicit):
             dtype_u: solution as mesh
         """
 
-        class context:
-            num_iter = 0
-
-        def callback(xk):
-            context.num_iter += 1
-            return context.num_iter
-
-        me = self.dtype_u(self.init)
-
-        Id = sp.eye(self.params.nvars[0] * self.params.nvars[1])
-
-        me[:] = cg(Id - factor * self.A, rhs.flatten(), x0=u0.flatten(), tol=self.params.lin_tol,
-                   maxiter=self.params.lin_maxiter, callback=callback)[0].reshape(self.params.nvars)
-
-        self.lin_ncalls += 1
-        self.lin_itercount += context.num_iter
-
-        return me
+        return self.solve_linear_system(rhs, factor, u0)
 
 
 # noinspection PyUnusedLocal
@@ -284,7 +294,8 @@ class allencahn_semiimplicit_v2(allencahn_fullyimplicit):
         """
         f = self.dtype_f(self.init)
         v = u.flatten()
-        f.impl[:] = (self.A.dot(v) - 1.0 / self.params.eps ** 2 * v ** (self.params.nu + 1)).reshape(self.params.nvars)
+        f.impl[:] = (self.operator.dot(v) - 1.0 / self.params.eps ** 2 * v ** (self.params.nu + 1)).reshape(
+            self.params.nvars)
         f.expl[:] = (1.0 / self.params.eps ** 2 * v).reshape(self.params.nvars)
 
         return f
@@ -304,36 +315,19 @@ class allencahn_semiimplicit_v2(allencahn_fullyimplicit):
         """
 
         u = self.dtype_u(u0).flatten()
-        z = self.dtype_u(self.init, val=0.0).flatten()
         nu = self.params.nu
         eps2 = self.params.eps ** 2
 
         Id = sp.eye(self.params.nvars[0] * self.params.nvars[1])
 
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.params.newton_maxiter:
-
+        def g(u):
             # form the function g with g(u) = 0
-            g = u - factor * (self.A.dot(u) - 1.0 / eps2 * u ** (nu + 1)) - rhs.flatten()
-
-            # if g is close to 0, then we are done
-            # res = np.linalg.norm(g, np.inf)
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.params.newton_tol:
-                break
+            return u - factor * (self.operator.dot(u) - 1.0 / eps2 * u ** (nu + 1)) - rhs.flatten()
 
-            # assemble dg
-            dg = Id - factor * (self.A - 1.0 / eps2 * sp.diags(((nu + 1) * u ** nu), offsets=0))
+        def dg(u):
+            return Id - factor * (self.A - 1.0 / eps2 * sp.diags(((nu + 1) * u ** nu), offsets=0))
 
-            # newton update: u1 = u0 - g/dg
-            # u -= spsolve(dg, g)
-            u -= cg(dg, g, x0=z, tol=self.params.lin_tol)[0]
-            # increase iteration count
-            n += 1
-            # print(n, res)
+        u, n, res = self.newton_solver.solve(g, dg, u, key=factor)
 
         # if n == self.params.newton_maxiter:
         #     raise ProblemError('Newton did not converge after %i iterations, error is %s' % (n, res))
@@ -379,7 +373,7 @@ class allencahn_multiimplicit(allencahn_fullyimplicit):
         """
         f = self.dtype_f(self.init)
         v = u.flatten()
-        f.comp1[:] = self.A.dot(v).reshape(self.params.nvars)
+        f.comp1[:] = self.operator.dot(v).reshape(self.params.nvars)
         f.comp2[:] = (1.0 / self.params.eps ** 2 * v * (1.0 - v ** self.params.nu)).reshape(self.params.nvars)
 
         return f
@@ -398,24 +392,7 @@ class allencahn_multiimplicit(allencahn_fullyimplicit):
             dtype_u: solution as mesh
         """
 
-        class context:
-            num_iter = 0
-
-        def callback(xk):
-            context.num_iter += 1
-            return context.num_iter
-
-        me = self.dtype_u(self.init)
-
-        Id = sp.eye(self.params.nvars[0] * self.params.nvars[1])
-
-        me[:] = cg(Id - factor * self.A, rhs.flatten(), x0=u0.flatten(), tol=self.params.lin_tol,
-                   maxiter=self.params.lin_maxiter, callback=callback)[0].reshape(self.params.nvars)
-
-        self.lin_ncalls += 1
-        self.lin_itercount += context.num_iter
-
-        return me
+        return self.solve_linear_system(rhs, factor, u0)
 
     def solve_system_2(self, rhs, factor, u0, t):
         """
@@ -432,35 +409,19 @@ class allencahn_multiimplicit(allencahn_fullyimplicit):
         """
 
         u = self.dtype_u(u0).flatten()
-        z = self.dtype_u(self.init, val=0.0).flatten()
         nu = self.params.nu
         eps2 = self.params.eps ** 2
 
         Id = sp.eye(self.params.nvars[0] * self.params.nvars[1])
 
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.params.newton_maxiter:
-
+        def g(u):
             # form the function g with g(u) = 0
-            g = u - factor * (1.0 / eps2 * u * (1.0 - u ** nu)) - rhs.flatten()
-
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.params.newton_tol:
-                break
+            return u - factor * (1.0 / eps2 * u * (1.0 - u ** nu)) - rhs.flatten()
 
-            # assemble dg
-            dg = Id - factor * (1.0 / eps2 * sp.diags((1.0 - (nu + 1) * u ** nu), offsets=0))
+        def dg(u):
+            return Id - factor * (1.0 / eps2 * sp.diags((1.0 - (nu + 1) * u ** nu), offsets=0))
 
-            # newton update: u1 = u0 - g/dg
-            # u -= spsolve(dg, g)
-            u -= cg(dg, g, x0=z, tol=self.params.lin_tol)[0]
-            # increase iteration count
-            n += 1
-            # print(n, res)
+        u, n, res = self.newton_solver.solve(g, dg, u, key=factor)
 
         # if n == self.params.newton_maxiter:
         #     raise ProblemError('Newton did not converge after %i iterations, error is %s' % (n, res))
@@ -506,7 +467,8 @@ class allencahn_multiimplicit_v2(allencahn_fullyimplicit):
         """
         f = self.dtype_f(self.init)
         v = u.flatten()
-        f.comp1[:] = (self.A.dot(v) - 1.0 / self.params.eps ** 2 * v ** (self.params.nu + 1)).reshape(self.params.nvars)
+        f.comp1[:] = (self.operator.dot(v) - 1.0 / self.params.eps ** 2 * v ** (self.params.nu + 1)).reshape(
+            self.params.nvars)
         f.comp2[:] = (1.0 / self.params.eps ** 2 * v).reshape(self.params.nvars)
 
         return f
@@ -526,35 +488,19 @@ class allencahn_multiimplicit_v2(allencahn_fullyimplicit):
         """
 
         u = self.dtype_u(u0).flatten()
-        z = self.dtype_u(self.init, val=0.0).flatten()
         nu = self.params.nu
         eps2 = self.params.eps ** 2
 
         Id = sp.eye(self.params.nvars[0] * self.params.nvars[1])
 
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.params.newton_maxiter:
-
+        def g(u):
             # form the function g with g(u) = 0
-            g = u - factor * (self.A.dot(u) - 1.0 / eps2 * u ** (nu + 1)) - rhs.flatten()
-
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.params.newton_tol:
-                break
+            return u - factor * (self.operator.dot(u) - 1.0 / eps2 * u ** (nu + 1)) - rhs.flatten()
 
-            # assemble dg
-            dg = Id - factor * (self.A - 1.0 / eps2 * sp.diags(((nu + 1) * u ** nu), offsets=0))
+        def dg(u):
+            return Id - factor * (self.A - 1.0 / eps2 * sp.diags(((nu + 1) * u ** nu), offsets=0))
 
-            # newton update: u1 = u0 - g/dg
-            # u -= spsolve(dg, g)
-            u -= cg(dg, g, x0=z, tol=self.params.lin_tol)[0]
-            # increase iteration count
-            n += 1
-            # print(n, res)
+        u, n, res = self.newton_solver.solve(g, dg, u, key=factor)
 
         # if n == self.params.newton_maxiter:
         #     raise ProblemError('Newton did not converge after %i iterations, error is %s' % (n, res))
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.sparse.linalg import gmres
 
 from pySDC.core.Errors import ParameterError
 from pySDC.core.Problem import ptype
@@ -7,8 +6,9 @@ from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh
 from pySDC.implementations.problem_classes.boussinesq_helpers.build2DFDMatrix import get2DMesh
 from pySDC.implementations.problem_classes.boussinesq_helpers.buildBoussinesq2DMatrix import getBoussinesq2DMatrix
 from pySDC.implementations.problem_classes.boussinesq_helpers.buildBoussinesq2DMatrix import getBoussinesq2DUpwindMatrix
-from pySDC.implementations.problem_classes.boussinesq_helpers.helper_classes import Callback, logging
+from pySDC.implementations.problem_classes.boussinesq_helpers.helper_classes import logging
 from pySDC.implementations.problem_classes.boussinesq_helpers.unflatten import unflatten
+from pySDC.implementations.solver_classes.linear_solver import linear_solver
 
 
 # noinspection PyUnusedLocal
@@ -35,6 +35,9 @@ class boussinesq_2d_imex(ptype):
                 msg = 'need %s to instantiate problem, only got %s' % (key, str(problem_params.keys()))
                 raise ParameterError(msg)
 
+        if 'linear_solver' not in problem_params:
+            problem_params['linear_solver'] = {}
+
         # invoke super init, passing number of dofs, dtype_u and dtype_f
         super(boussinesq_2d_imex, self).__init__((problem_params['nvars'], None, np.dtype('float64')),
                                                  dtype_u, dtype_f, problem_params)
@@ -54,6 +57,9 @@ class boussinesq_2d_imex(ptype):
         self.D_upwind = getBoussinesq2DUpwindMatrix(self.N, self.h[0], self.params.u_adv, self.params.order_upw)
 
         self.gmres_logger = logging()
+        solver_params = {'method': 'GMRES', 'tol': self.params.gmres_tol_limit, 'restart': self.params.gmres_restart,
+                         'maxiter': self.params.gmres_maxiter, **self.params.linear_solver}
+        self.linear_solver = linear_solver(solver_params)
 
     def solve_system(self, rhs, factor, u0, t):
         """
@@ -69,14 +75,10 @@ class boussinesq_2d_imex(ptype):
             dtype_u: solution as mesh
         """
 
-        b = rhs.flatten()
-        cb = Callback()
-
-        sol, info = gmres(self.Id - factor * self.M, b, x0=u0.flatten(), tol=self.params.gmres_tol_limit,
-                          restart=self.params.gmres_restart, maxiter=self.params.gmres_maxiter, callback=cb)
+        sol = self.linear_solver.solve(self.Id - factor * self.M, rhs, x0=u0, key=factor)
         # If this is a dummy call with factor==0.0, do not log because it should not be counted as a solver call
         if factor != 0.0:
-            self.gmres_logger.add(cb.getcounter())
+            self.gmres_logger.add(self.linear_solver.last_niter)
         me = self.dtype_u(self.init)
         me[:] = unflatten(sol, 4, self.N[0], self.N[1])
 
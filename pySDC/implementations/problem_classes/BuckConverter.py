@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.linalg import lu_factor, lu_solve
 
 from pySDC.core.Errors import ParameterError
 from pySDC.core.Problem import ptype
@@ -36,6 +37,9 @@ class buck_converter(ptype):
 
         self.A = np.zeros((3, 3))
 
+        # the systems to solve only depend on the factor and the switching state, so factorizations can be reused
+        self.setup_factorization_cache()
+
     def eval_f(self, u, t):
         """
         Routine to evaluate the RHS
@@ -73,8 +77,9 @@ class buck_converter(ptype):
         """
         Tsw = 1 / self.params.fsw
         self.A = np.zeros((3, 3))
+        switch_on = 0 <= ((t / Tsw) % 1) <= self.params.duty
 
-        if 0 <= ((t / Tsw) % 1) <= self.params.duty:
+        if switch_on:
 
             self.A[0, 0] = -1 / (self.params.C1 * self.params.Rs)
             self.A[0, 2] = -1 / self.params.C1
@@ -97,7 +102,9 @@ class buck_converter(ptype):
             self.A[2, 1] = -1 / self.params.L1
 
         me = self.dtype_u(self.init)
-        me[:] = np.linalg.solve(np.eye(self.params.nvars) - factor * self.A, rhs)
+        LU = self.get_factorization(factor, lambda: lu_factor(np.eye(self.params.nvars) - factor * self.A),
+                                    key=switch_on)
+        me[:] = lu_solve(LU, rhs)
         return me
 
     def u_exact(self, t):
@@ -22,6 +22,8 @@ class full_solar_system(outer_solar_system):
 
         if 'sun_only' not in problem_params:
             problem_params['sun_only'] = False
+        if 'kernel' not in problem_params:
+            problem_params['kernel'] = 'numpy'
 
         # these parameters will be used later, so assert their existence
         essential_keys = []
@@ -30,6 +32,9 @@ class full_solar_system(outer_solar_system):
                 msg = 'need %s to instantiate problem, only got %s' % (key, str(problem_params.keys()))
                 raise ParameterError(msg)
 
+        if problem_params['kernel'] not in ['numpy', 'numba']:
+            raise ParameterError('unknown kernel for the accelerations, got %s' % problem_params['kernel'])
+
         # invoke parant's class (!) super init, passing nparts, dtype_u and dtype_f
         super(outer_solar_system, self).__init__(((3, 10), None, np.dtype('float64')), dtype_u, dtype_f, problem_params)
 
@@ -1,11 +1,11 @@
 
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import spsolve
 
 from pySDC.core.Errors import ParameterError, ProblemError
 from pySDC.core.Problem import ptype
 from pySDC.implementations.datatype_classes.mesh import mesh
+from pySDC.implementations.solver_classes.newton import newton_solver
 
 
 # noinspection PyUnusedLocal
@@ -16,6 +16,7 @@ class generalized_fisher(ptype):
     Attributes:
         A: second-order FD discretization of the 1D laplace operator
         dx: distance between two spatial nodes
+        newton_solver (newton_solver): Newton's method, with the strategy given by newton_strategy and newton_refresh
     """
 
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=mesh):
@@ -41,6 +42,10 @@ class generalized_fisher(ptype):
 
         if 'stop_at_nan' not in problem_params:
             problem_params['stop_at_nan'] = True
+        if 'newton_strategy' not in problem_params:
+            problem_params['newton_strategy'] = 'full'
+        if 'newton_refresh' not in problem_params:
+            problem_params['newton_refresh'] = None
 
         # invoke super init, passing number of dofs, dtype_u and dtype_f
         super(generalized_fisher, self).__init__((problem_params['nvars'], None, np.dtype('float64')),
@@ -50,6 +55,19 @@ class generalized_fisher(ptype):
         self.dx = (self.params.interval[1] - self.params.interval[0]) / (self.params.nvars + 1)
         self.A = self.__get_A(self.params.nvars, self.dx)
 
+        self.newton_solver = newton_solver({'strategy': self.params.newton_strategy,
+                                            'refresh': self.params.newton_refresh,
+                                            'maxiter': self.params.newton_maxiter, 'tol': self.params.newton_tol})
+        self.newton_itercount = 0
+        self.newton_ncalls = 0
+
+    def reset_factorization_cache(self):
+        """
+        Drop all cached factorizations and the frozen Jacobians of Newton's method
+        """
+        super(generalized_fisher, self).reset_factorization_cache()
+        self.newton_solver.reset()
+
     @staticmethod
     def __get_A(N, dx):
         """
@@ -84,8 +102,6 @@ class generalized_fisher(ptype):
             dtype_u: solution u
         """
 
-        u = self.dtype_u(u0)
-
         nu = self.params.nu
         lambda0 = self.params.lambda0
 
@@ -97,31 +113,18 @@ class generalized_fisher(ptype):
         ur = (1 + (2 ** (nu / 2.0) - 1) *
               np.exp(-nu / 2.0 * sig1 * (self.params.interval[1] + 2 * lam1 * t))) ** (-2.0 / nu)
 
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.params.newton_maxiter:
-
+        def g(u):
             # form the function g with g(u) = 0
             uext = np.concatenate(([ul], u, [ur]))
-            g = u - \
-                factor * (self.A.dot(uext)[1:-1] + lambda0 ** 2 * u * (1 - u ** nu)) - rhs
+            return u - factor * (self.A.dot(uext)[1:-1] + lambda0 ** 2 * u * (1 - u ** nu)) - rhs
 
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.params.newton_tol:
-                break
-
-            # assemble dg
-            dg = sp.eye(self.params.nvars) - factor * \
+        def dg(u):
+            return sp.eye(self.params.nvars, format='csc') - factor * \
                 (self.A[1:-1, 1:-1] + sp.diags(lambda0 ** 2 - lambda0 ** 2 * (nu + 1) * u ** nu, offsets=0))
 
-            # newton update: u1 = u0 - g/dg
-            u -= spsolve(dg, g)
-
-            # increase iteration count
-            n += 1
+        # the Jacobian also depends on the factor, so frozen Jacobians are kept per factor
+        me = self.dtype_u(self.init)
+        me[:], n, res = self.newton_solver.solve(g, dg, u0, key=factor)
 
         if np.isnan(res) and self.params.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
@@ -131,7 +134,10 @@ class generalized_fisher(ptype):
         if n == self.params.newton_maxiter:
             self.logger.warning('Newton did not converge after %i iterations, error is %s' % (n, res))
 
-        return u
+        self.newton_ncalls += 1
+        self.newton_itercount += n
+
+        return me
 
     def eval_f(self, u, t):
         """
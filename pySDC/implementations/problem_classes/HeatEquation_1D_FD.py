@@ -1,14 +1,14 @@
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import spsolve
 
 from pySDC.core.Errors import ParameterError, ProblemError
 from pySDC.core.Problem import ptype
+from pySDC.helpers.banded_helper import GroupedSolves, factorize
 from pySDC.implementations.datatype_classes.mesh import mesh
 
 
 # noinspection PyUnusedLocal
-class heat1d(ptype):
+class heat1d(GroupedSolves, ptype):
     """
     Example implementing the unforced 1D heat equation with Dirichlet-0 BC in [0,1],
     discretized using central finite differences
@@ -47,6 +47,9 @@ class heat1d(ptype):
         self.dx = 1.0 / (self.params.nvars + 1)
         self.A = self.__get_A(self.params.nvars, self.params.nu, self.dx)
 
+        # the systems to solve only depend on the factor, so their factorizations can be reused
+        self.setup_factorization_cache()
+
     @staticmethod
     def __get_A(N, nu, dx):
         """
@@ -82,6 +85,19 @@ class heat1d(ptype):
         f[:] = self.A.dot(u)
         return f
 
+    def get_system_solver(self, factor):
+        """
+        Helper function to get the (cached) factorization of I-factor*A, banded if possible
+
+        Args:
+            factor (float): abbrev. for the node-to-node stepsize (or any other factor required)
+
+        Returns:
+            factorization with a method solve
+        """
+        return self.get_factorization(factor,
+                                      lambda: factorize(sp.eye(self.params.nvars, format='csc') - factor * self.A))
+
     def solve_system(self, rhs, factor, u0, t):
         """
         Simple linear solver for (I-factor*A)u = rhs
@@ -97,7 +113,8 @@ class heat1d(ptype):
         """
 
         me = self.dtype_u(self.init)
-        me[:] = spsolve(sp.eye(self.params.nvars, format='csc') - factor * self.A, rhs)
+        L = self.get_system_solver(factor)
+        me[:] = L.solve(rhs)
         return me
 
     def u_exact(self, t):
@@ -1,15 +1,15 @@
 
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import splu
 
 from pySDC.core.Errors import ParameterError, ProblemError
 from pySDC.core.Problem import ptype
+from pySDC.helpers.banded_helper import GroupedSolves, factorize
 from pySDC.implementations.datatype_classes.mesh import mesh
 
 
 # noinspection PyUnusedLocal
-class heat1d_periodic(ptype):
+class heat1d_periodic(GroupedSolves, ptype):
     """
     Example implementing the unforced 1D heat equation with periodic BCs in [0,1],
     discretized using central finite differences
@@ -49,6 +49,9 @@ class heat1d_periodic(ptype):
         self.dx = 1.0 / self.params.nvars
         self.A = self.__get_A(self.params.nvars, self.params.nu, self.dx)
 
+        # the systems to solve only depend on the factor, so their factorizations can be reused
+        self.setup_factorization_cache()
+
     @staticmethod
     def __get_A(N, nu, dx):
         """
@@ -91,6 +94,19 @@ class heat1d_periodic(ptype):
         f[:] = self.A.dot(u)
         return f
 
+    def get_system_solver(self, factor):
+        """
+        Helper function to get the (cached) factorization of I-factor*A, banded if possible
+
+        Args:
+            factor (float): abbrev. for the node-to-node stepsize (or any other factor required)
+
+        Returns:
+            factorization with a method solve
+        """
+        return self.get_factorization(factor,
+                                      lambda: factorize(sp.eye(self.params.nvars, format='csc') - factor * self.A))
+
     def solve_system(self, rhs, factor, u0, t):
         """
         Simple linear solver for (I-factor*A)u = rhs
@@ -106,7 +122,7 @@ class heat1d_periodic(ptype):
         """
 
         me = self.dtype_u(self.init)
-        L = splu(sp.eye(self.params.nvars, format='csc') - factor * self.A)
+        L = self.get_system_solver(factor)
         me[:] = L.solve(rhs[:])
         return me
 
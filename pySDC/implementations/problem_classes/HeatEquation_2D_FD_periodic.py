@@ -4,7 +4,7 @@ import scipy.sparse as sp
 from scipy.sparse.linalg import cg
 
 from pySDC.core.Errors import ParameterError, ProblemError
-from pySDC.core.Problem import ptype, get_finite_difference_stencil
+from pySDC.core.Problem import ptype, get_finite_difference_stencil, StencilOperator
 from pySDC.implementations.datatype_classes.mesh import mesh
 
 
@@ -17,6 +17,7 @@ class heat2d_periodic(ptype):
     Attributes:
         A: second-order FD discretization of the 2D laplace operator
         dx: distance between two spatial nodes (here: being the same in both dimensions)
+        symbol: eigenvalues of A, used by the FFT-based solver
     """
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=mesh):
         """
@@ -46,6 +47,10 @@ class heat2d_periodic(ptype):
             raise ProblemError('the setup requires nvars = 2^p per dimension')
         if 'order' not in problem_params:
             problem_params['order'] = 2
+        if 'solver_type' not in problem_params:
+            problem_params['solver_type'] = 'CG'
+        if problem_params['solver_type'] not in ['CG', 'fft']:
+            raise ParameterError(f'solver_type {problem_params["solver_type"]} not implemented, choose CG or fft')
 
         # invoke super init, passing number of dofs, dtype_u and dtype_f
         super(heat2d_periodic, self).__init__(init=(problem_params['nvars'], None, np.dtype('float64')),
@@ -55,6 +60,12 @@ class heat2d_periodic(ptype):
         self.dx = 1.0 / self.params.nvars[0]
         self.A = self.__get_A(self.params.nvars, self.params.nu, self.dx, self.params.order)
 
+        # A is circulant, so the FFT diagonalizes it, with the eigenvalues given by the symbol of the stencil
+        self.symbol = None
+        if self.params.solver_type == 'fft':
+            self.symbol = StencilOperator.from_derivative(self.params.nvars, derivative=2, order=self.params.order,
+                                                          type='center', factor=self.params.nu / self.dx ** 2).symbol
+
     @staticmethod
     def __get_A(N, nu, dx, order):
         """
@@ -113,8 +124,11 @@ class heat2d_periodic(ptype):
         """
 
         me = self.dtype_u(self.init)
-        me[:] = cg(sp.eye(self.params.nvars[0] * self.params.nvars[1], format='csc') - factor * self.A,
-                   rhs.flatten(), x0=u0.flatten(), tol=1E-12)[0].reshape(self.params.nvars)
+        if self.params.solver_type == 'fft':
+            me[:] = np.fft.irfftn(np.fft.rfftn(rhs) / (1.0 - factor * self.symbol), s=self.params.nvars)
+        else:
+            me[:] = cg(sp.eye(self.params.nvars[0] * self.params.nvars[1], format='csc') - factor * self.A,
+                       rhs.flatten(), x0=u0.flatten(), tol=1E-12)[0].reshape(self.params.nvars)
         return me
 
     def u_exact(self, t):
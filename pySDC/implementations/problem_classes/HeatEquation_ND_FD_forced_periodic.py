@@ -1,10 +1,10 @@
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import spsolve, cg  # , gmres
 
 from pySDC.core.Errors import ParameterError, ProblemError
-from pySDC.core.Problem import ptype
+from pySDC.core.Problem import ptype, StencilOperator
 from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh
+from pySDC.implementations.solver_classes.linear_solver import linear_solver
 
 
 # noinspection PyUnusedLocal
@@ -14,8 +14,12 @@ class heatNd_periodic(ptype):
     discretized using central finite differences
 
     Attributes:
-        A: second-order FD discretization of the ND laplace operator
+        operator (StencilOperator): matrix-free FD discretization of the ND laplace operator
+        A: the same operator assembled as sparse matrix, built on first access
         dx: distance between two spatial nodes (here: being the same in all dimensions)
+        solver_type (str): linear solver used in solve_system
+        linear_solver (linear_solver): solver for the linear systems, None if the FFT is used
+        symbol: eigenvalues of A, used by the FFT-based solver
     """
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=imex_mesh):
         """
@@ -37,8 +41,12 @@ class heatNd_periodic(ptype):
             problem_params['liniter'] = 10000
         if 'direct_solver' not in problem_params:
             problem_params['direct_solver'] = False
+        if 'solver_type' not in problem_params:
+            problem_params['solver_type'] = None
+        if 'linear_solver' not in problem_params:
+            problem_params['linear_solver'] = {}
 
-        essential_keys = ['nvars', 'nu', 'freq', 'order', 'ndim', 'lintol', 'liniter', 'direct_solver']
+        essential_keys = ['nvars', 'nu', 'freq', 'order', 'ndim', 'lintol', 'liniter', 'direct_solver', 'solver_type']
         for key in essential_keys:
             if key not in problem_params:
                 msg = 'need %s to instantiate problem, only got %s' % (key, str(problem_params.keys()))
@@ -64,58 +72,63 @@ class heatNd_periodic(ptype):
         super(heatNd_periodic, self).__init__(init=(problem_params['nvars'], None, np.dtype('float64')),
                                               dtype_u=dtype_u, dtype_f=dtype_f, params=problem_params)
 
-        # compute dx (equal in both dimensions) and get discretization matrix A
+        # compute dx (equal in both dimensions) and get discretization operator
         self.dx = 1.0 / self.params.nvars[0]
-        self.A = self.__get_A(self.params.nvars, self.params.nu, self.dx, self.params.ndim, self.params.order)
+        self.operator = self.__get_operator(self.params.nvars, self.params.nu, self.dx, self.params.order)
         xvalues = np.array([i * self.dx for i in range(self.params.nvars[0])])
         self.xv = np.meshgrid(*[xvalues for _ in range(self.params.ndim)])
         self.Id = sp.eye(np.prod(self.params.nvars), format='csc')
 
+        # without explicit choice of the solver, the direct_solver flag decides
+        self.solver_type = self.params.solver_type
+        if self.solver_type is None:
+            self.solver_type = 'direct' if self.params.direct_solver else 'CG'
+        if self.solver_type not in ['direct', 'CG', 'fft', 'MG', 'PCG']:
+            raise ParameterError(f'solver_type {self.solver_type} not implemented, choose direct, CG, fft, MG or PCG')
+
+        # the systems to solve only depend on the factor, so their factorizations or multigrid hierarchies can be reused
+        self.linear_solver = None
+        if self.solver_type != 'fft':
+            self.setup_factorization_cache()
+            solver_params = {'method': 'CG' if self.solver_type == 'PCG' else self.solver_type,
+                             'preconditioner': 'MG' if self.solver_type == 'PCG' else None,
+                             'tol': self.params.lintol, 'maxiter': self.params.liniter,
+                             **self.params.linear_solver}
+            self.linear_solver = linear_solver(solver_params, nvars=self.params.nvars, periodic=True,
+                                               cache=self.factorization_cache)
+
+        # A is circulant, so the FFT diagonalizes it
+        self.symbol = self.operator.symbol if self.solver_type == 'fft' else None
+
     @staticmethod
-    def __get_A(N, nu, dx, ndim, order):
+    def __get_operator(N, nu, dx, order):
         """
-        Helper function to assemble FD matrix A in sparse format
+        Helper function to set up the matrix-free FD operator
 
         Args:
             N (list): number of dofs
             nu (float): diffusion coefficient
             dx (float): distance between two spatial nodes
-            ndim (int): number of dimensions
+            order (int): order of accuracy
 
         Returns:
-            scipy.sparse.csc_matrix: matrix A in CSC format
+            StencilOperator: the discretized laplace operator
         """
 
-        if order == 2:
-            stencil = [1, -2, 1]
-            zero_pos = 2
-        elif order == 4:
-            stencil = [-1 / 12, 4 / 3, -5 / 2, 4 / 3, -1 / 12]
-            zero_pos = 3
-        elif order == 6:
-            stencil = [1 / 90, -3 / 20, 3 / 2, -49 / 18, 3 / 2, -3 / 20, 1 / 90]
-            zero_pos = 4
-        elif order == 8:
-            stencil = [-1 / 560, 8 / 315, -1 / 5, 8 / 5, -205 / 72, 8 / 5, -1 / 5, 8 / 315, -1 / 560]
-            zero_pos = 5
-        else:
+        if order not in [2, 4, 6, 8]:
             raise ProblemError(f'wrong order given, has to be 2, 4, 6, or 8, got {order}')
-        dstencil = np.concatenate((stencil, np.delete(stencil, zero_pos - 1)))
-        offsets = np.concatenate(([N[0] - i - 1 for i in reversed(range(zero_pos - 1))],
-                                  [i - zero_pos + 1 for i in range(zero_pos - 1, len(stencil))]))
-        doffsets = np.concatenate((offsets, np.delete(offsets, zero_pos - 1) - N[0]))
-
-        A = sp.diags(dstencil, doffsets, shape=(N[0], N[0]), format='csc')
-        # stencil = [1, -2, 1]
-        # A = sp.diags(stencil, [-1, 0, 1], shape=(N[0], N[0]), format='csc')
-        if ndim == 2:
-            A = sp.kron(A, sp.eye(N[0])) + sp.kron(sp.eye(N[1]), A)
-        elif ndim == 3:
-            A = sp.kron(A, sp.eye(N[1] * N[0])) + sp.kron(sp.eye(N[2] * N[1]), A) + \
-                sp.kron(sp.kron(sp.eye(N[2]), A), sp.eye(N[0]))
-        A *= nu / (dx ** 2)
-
-        return A
+
+        return StencilOperator.from_derivative(N, derivative=2, order=order, type='center', factor=nu / (dx ** 2))
+
+    @property
+    def A(self):
+        """
+        Getter for the assembled discretization matrix, e.g. for direct solvers
+
+        Returns:
+            scipy.sparse.csc_matrix: matrix A in CSC format
+        """
+        return self.operator.matrix
 
     def eval_f(self, u, t):
         """
@@ -130,7 +143,7 @@ class heatNd_periodic(ptype):
         """
 
         f = self.dtype_f(self.init)
-        f.impl[:] = self.A.dot(u.flatten()).reshape(self.params.nvars)
+        f.impl[:] = self.operator.apply(u)
         if self.params.ndim == 1:
             f.expl[:] = np.sin(np.pi * self.params.freq[0] * self.xv[0]) * \
                 (self.params.nu * np.pi ** 2 * sum([freq ** 2 for freq in self.params.freq]) * np.cos(t) - np.sin(t))
@@ -162,11 +175,11 @@ class heatNd_periodic(ptype):
 
         me = self.dtype_u(self.init)
 
-        if self.params.direct_solver:
-            me[:] = spsolve(self.Id - factor * self.A, rhs.flatten()).reshape(self.params.nvars)
+        if self.solver_type == 'fft':
+            me[:] = np.fft.irfftn(np.fft.rfftn(rhs) / (1.0 - factor * self.symbol), s=self.params.nvars)
         else:
-            me[:] = cg(self.Id - factor * self.A, rhs.flatten(), x0=u0.flatten(),
-                       tol=self.params.lintol, maxiter=self.params.liniter)[0].reshape(self.params.nvars)
+            me[:] = self.linear_solver.solve(self.operator.get_system_operator(factor), rhs, x0=u0, key=factor,
+                                             matrix=lambda: self.Id - factor * self.A).reshape(self.params.nvars)
         return me
 
     def u_exact(self, t):
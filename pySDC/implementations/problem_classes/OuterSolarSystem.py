@@ -1,5 +1,6 @@
 
 import numpy as np
+from numba import jit
 
 from pySDC.core.Errors import ParameterError
 from pySDC.core.Problem import ptype
@@ -24,6 +25,8 @@ class outer_solar_system(ptype):
 
         if 'sun_only' not in problem_params:
             problem_params['sun_only'] = False
+        if 'kernel' not in problem_params:
+            problem_params['kernel'] = 'numpy'
 
         # these parameters will be used later, so assert their existence
         essential_keys = []
@@ -32,47 +35,119 @@ class outer_solar_system(ptype):
                 msg = 'need %s to instantiate problem, only got %s' % (key, str(problem_params.keys()))
                 raise ParameterError(msg)
 
+        if problem_params['kernel'] not in ['numpy', 'numba']:
+            raise ParameterError('unknown kernel for the accelerations, got %s' % problem_params['kernel'])
+
         # invoke super init, passing nparts, dtype_u and dtype_f
         super(outer_solar_system, self).__init__(((3, 6), None, np.dtype('float64')), dtype_u, dtype_f, problem_params)
 
         # gravitational constant
         self.G = 2.95912208286E-4
 
-    def eval_f(self, u, t):
+    @staticmethod
+    @jit(nopython=True, nogil=True)
+    def fast_accelerations(pos, m, G):
         """
-        Routine to compute the RHS
+        Compiled kernel for the pairwise gravitational accelerations of all planets, for larger numbers of bodies
 
         Args:
-            u (dtype_u): the particles
-            t (float): current time (not used here)
+            pos (numpy.ndarray): positions, shape (K, 3, N) for K sets of N bodies
+            m (numpy.ndarray): masses of the bodies
+            G (float): gravitational constant
         Returns:
-            dtype_f: RHS
+            numpy.ndarray: accelerations, shape (K, 3, N)
+        """
+
+        K, _, N = pos.shape
+        acc = np.zeros((K, 3, N))
+
+        for k in range(K):
+            for i in range(N):
+                for j in range(i):
+                    dx0 = pos[k, 0, i] - pos[k, 0, j]
+                    dx1 = pos[k, 1, i] - pos[k, 1, j]
+                    dx2 = pos[k, 2, i] - pos[k, 2, j]
+                    r3 = (dx0 ** 2 + dx1 ** 2 + dx2 ** 2) ** 1.5
+                    acc[k, 0, i] -= m[j] * G * dx0 / r3
+                    acc[k, 1, i] -= m[j] * G * dx1 / r3
+                    acc[k, 2, i] -= m[j] * G * dx2 / r3
+                    acc[k, 0, j] += m[i] * G * dx0 / r3
+                    acc[k, 1, j] += m[i] * G * dx1 / r3
+                    acc[k, 2, j] += m[i] * G * dx2 / r3
+
+        return acc
+
+    def get_accelerations(self, pos, m):
         """
-        me = self.dtype_f(self.init, val=0.0)
+        Routine to compute the gravitational accelerations for one or more sets of positions at once
+
+        Args:
+            pos (numpy.ndarray): positions, shape (3, N) or (K, 3, N)
+            m (numpy.ndarray): masses of the bodies
+        Returns:
+            numpy.ndarray: accelerations, same shape as pos
+        """
+
+        pos = np.asarray(pos)
 
         # compute the acceleration due to gravitational forces
         # ... only with respect to the sun
         if self.params.sun_only:
 
-            for i in range(1, self.init[0][-1]):
-                dx = u.pos[:, i] - u.pos[:, 0]
-                r = np.sqrt(np.dot(dx, dx))
-                df = self.G * dx / (r ** 3)
-                me[:, i] -= u.m[0] * df
+            acc = np.zeros(pos.shape)
+            dx = pos[..., 1:] - pos[..., :1]
+            acc[..., 1:] = -m[0] * self.G * dx / np.sum(dx ** 2, axis=-2, keepdims=True) ** 1.5
 
-        # ... or with all planets involved
+        # ... or with all planets involved, using the compiled kernel
+        elif self.params.kernel == 'numba':
+
+            acc = self.fast_accelerations(pos.reshape(-1, 3, pos.shape[-1]), np.asarray(m), self.G).reshape(pos.shape)
+
+        # ... or with all planets involved, using the pairwise differences dx[..., :, i, j] = x_i - x_j
         else:
 
-            for i in range(self.init[0][-1]):
-                for j in range(i):
-                    dx = u.pos[:, i] - u.pos[:, j]
-                    r = np.sqrt(np.dot(dx, dx))
-                    df = self.G * dx / (r ** 3)
-                    me[:, i] -= u.m[j] * df
-                    me[:, j] += u.m[i] * df
+            N = pos.shape[-1]
+            dx = pos[..., :, None] - pos[..., None, :]
+            r2 = np.sum(dx ** 2, axis=-3)
+            r2[..., range(N), range(N)] = np.inf
+            acc = -self.G * np.einsum('...kij,...ij,j->...ki', dx, r2 ** -1.5, np.asarray(m))
+
+        return acc
+
+    def eval_f(self, u, t):
+        """
+        Routine to compute the RHS
+
+        Args:
+            u (dtype_u): the particles
+            t (float): current time (not used here)
+        Returns:
+            dtype_f: RHS
+        """
+        me = self.dtype_f(self.init)
+        me[:] = self.get_accelerations(u.pos, u.m)
 
         return me
 
+    def eval_f_batch(self, U, times):
+        """
+        Routine to compute the RHS for several sets of particles (e.g. at all collocation nodes) at once
+
+        Args:
+            U (list of dtype_u): the particles, all with the same masses
+            times (list of float): current times (not used here)
+        Returns:
+            list of dtype_f: RHS for each set of particles
+        """
+        acc = self.get_accelerations(np.stack([u.pos for u in U]), U[0].m)
+
+        F = []
+        for k in range(len(U)):
+            F.append(self.dtype_f(self.init))
+            F[-1][:] = acc[k]
+
+        return F
+
     def u_exact(self, t):
         """
         Routine to compute the exact/initial trajectory at time t
@@ -118,15 +193,12 @@ class outer_solar_system(ptype):
             float: hamiltonian
         """
 
-        ham = 0
-
-        for i in range(self.init[0][-1]):
-            ham += 0.5 * u.m[i] * np.dot(u.vel[:, i], u.vel[:, i])
+        # kinetic energy of all bodies and potential energy of all pairs
+        pos = np.asarray(u.pos)
+        ham = 0.5 * np.sum(u.m * np.sum(np.asarray(u.vel) ** 2, axis=0))
 
-        for i in range(self.init[0][-1]):
-            for j in range(i):
-                dx = u.pos[:, i] - u.pos[:, j]
-                r = np.sqrt(np.dot(dx, dx))
-                ham -= self.G * u.m[i] * u.m[j] / r
+        i, j = np.tril_indices(self.init[0][-1], k=-1)
+        r = np.sqrt(np.sum((pos[:, i] - pos[:, j]) ** 2, axis=0))
+        ham -= self.G * np.sum(u.m[i] * u.m[j] / r)
 
         return ham
@@ -4,6 +4,7 @@ from numba import jit
 
 from pySDC.core.Errors import ParameterError, ProblemError
 from pySDC.core.Problem import ptype
+from pySDC.helpers.barnes_hut_helper import barnes_hut_interactions
 from pySDC.implementations.datatype_classes.particles import particles, fields, acceleration
 
 
@@ -30,6 +31,17 @@ class penningtrap(ptype):
                 msg = 'need %s to instantiate problem, only got %s' % (key, str(problem_params.keys()))
                 raise ParameterError(msg)
 
+        # default to direct summation of the particle-particle interactions, which serves as reference
+        if 'interactions' not in problem_params:
+            problem_params['interactions'] = 'direct'
+        if 'theta' not in problem_params:
+            problem_params['theta'] = 0.5
+        if 'leaf_size' not in problem_params:
+            problem_params['leaf_size'] = 8
+
+        if problem_params['interactions'] not in ['direct', 'barnes_hut']:
+            raise ParameterError('unknown method for the interactions, got %s' % problem_params['interactions'])
+
         # invoke super init, passing nparts, dtype_u and dtype_f
         super(penningtrap, self).__init__(((3, problem_params['nparts']), None, np.dtype('float64')),
                                           dtype_u, dtype_f, problem_params)
@@ -39,19 +51,28 @@ class penningtrap(ptype):
     def fast_interactions(N, pos, sig, q):
 
         Efield = np.zeros((3, N))
-        contrib = np.zeros(3)
 
         for i in range(N):
 
-            contrib[:] = 0
+            # accumulate the components in scalars to avoid temporary arrays in the inner loop
+            contrib0 = 0.0
+            contrib1 = 0.0
+            contrib2 = 0.0
 
             for j in range(N):
 
-                dist2 = (pos[0, i] - pos[0, j]) ** 2 + (pos[1, i] - pos[1, j]) ** 2 + \
-                        (pos[2, i] - pos[2, j]) ** 2 + sig ** 2
-                contrib += q[j] * (pos[:, i] - pos[:, j]) / dist2 ** 1.5
+                dx0 = pos[0, i] - pos[0, j]
+                dx1 = pos[1, i] - pos[1, j]
+                dx2 = pos[2, i] - pos[2, j]
+                dist2 = dx0 ** 2 + dx1 ** 2 + dx2 ** 2 + sig ** 2
+                dist3 = dist2 ** 1.5
+                contrib0 += q[j] * dx0 / dist3
+                contrib1 += q[j] * dx1 / dist3
+                contrib2 += q[j] * dx2 / dist3
 
-            Efield[:, i] += contrib[:]
+            Efield[0, i] += contrib0
+            Efield[1, i] += contrib1
+            Efield[2, i] += contrib2
 
         return Efield
 
@@ -59,6 +80,9 @@ class penningtrap(ptype):
         """
         Routine to compute the particle-particle interaction, assuming q = 1 for all particles
 
+        With interactions = 'direct', all pairs are summed up in O(N^2). With interactions = 'barnes_hut', an octree
+        with opening angle theta is used instead, which needs O(N log N) operations.
+
         Args:
             part (dtype_u): the particles
         Returns:
@@ -68,7 +92,11 @@ class penningtrap(ptype):
 
         N = self.params.nparts
 
-        Efield = self.fast_interactions(N, part.pos, self.params.sig, part.q)
+        if self.params.interactions == 'barnes_hut':
+            Efield = barnes_hut_interactions(part.pos, self.params.sig, part.q, self.params.theta,
+                                             self.params.leaf_size)
+        else:
+            Efield = self.fast_interactions(N, part.pos, self.params.sig, part.q)
 
         return Efield
 
@@ -83,16 +111,14 @@ class penningtrap(ptype):
             dtype_f: Fields for the particles (internal and external)
         """
 
-        N = self.params.nparts
-
         Emat = np.diag([1, 1, -2])
         f = self.dtype_f(self.init)
 
         f.elec[:] = self.get_interactions(part)
 
-        for n in range(N):
-            f.elec[:, n] += self.params.omega_E ** 2 / (part.q[n] / part.m[n]) * np.dot(Emat, part.pos[:, n])
-            f.magn[:, n] = self.params.omega_B * np.array([0, 0, 1])
+        # external fields for all particles at once
+        f.elec += self.params.omega_E ** 2 / (part.q / part.m) * np.dot(Emat, part.pos)
+        f.magn[:] = self.params.omega_B * np.array([0, 0, 1])[:, None]
 
         return f
 
@@ -126,32 +152,13 @@ class penningtrap(ptype):
         # initialize random seed
         np.random.seed(N)
 
-        comx = u.pos[0, 0]
-        comy = u.pos[1, 0]
-        comz = u.pos[2, 0]
-
-        for n in range(1, N):
-            # draw 3 random variables in [-1,1] to shift positions
-            r = np.random.random_sample(3) - 1
-            u.pos[0, n] = r[0] + u0[0][0]
-            u.pos[1, n] = r[1] + u0[0][1]
-            u.pos[2, n] = r[2] + u0[0][2]
+        # draw 3 random variables in [-1,1] to shift positions and 3 in [-5,5] to shift velocities for each particle
+        r = np.random.random_sample((N - 1) * 6).reshape(N - 1, 6)
+        u.pos[:, 1:] = (r[:, 0:3] - 1).T + np.array(u0[0])[:, None]
+        u.vel[:, 1:] = (r[:, 3:6] - 5).T + np.array(u0[1])[:, None]
 
-            # draw 3 random variables in [-5,5] to shift velocities
-            r = np.random.random_sample(3) - 5
-            u.vel[0, n] = r[0] + u0[1][0]
-            u.vel[1, n] = r[1] + u0[1][1]
-            u.vel[2, n] = r[2] + u0[1][2]
-
-            u.q[n] = u0[2][0]
-            u.m[n] = u0[3][0]
-
-            # gather positions to check center
-            comx += u.pos[0, n]
-            comy += u.pos[1, n]
-            comz += u.pos[2, n]
-
-        # print('Center of positions:',comx/N,comy/N,comz/N)
+        u.q[1:] = u0[2][0]
+        u.m[1:] = u0[3][0]
 
         return u
 
@@ -218,11 +225,8 @@ class penningtrap(ptype):
         if not isinstance(part, particles):
             raise ProblemError('something is wrong during build_f, got %s' % type(part))
 
-        N = self.params.nparts
-
         rhs = acceleration(self.init)
-        for n in range(N):
-            rhs[:, n] = part.q[n] / part.m[n] * (f.elec[:, n] + np.cross(part.vel[:, n], f.magn[:, n]))
+        rhs[:] = part.q / part.m * (f.elec + np.cross(part.vel, f.magn, axis=0))
 
         return rhs
 
@@ -241,23 +245,22 @@ class penningtrap(ptype):
             the velocities at the (m+1)th node
         """
 
-        N = self.params.nparts
         vel = particles.velocity(self.init)
 
         Emean = 0.5 * (old_fields.elec + new_fields.elec)
 
-        for n in range(N):
-            a = old_parts.q[n] / old_parts.m[n]
+        # all particles at once, with the vectors stored in the columns
+        a = old_parts.q / old_parts.m
 
-            c[:, n] += dt / 2 * a * np.cross(old_parts.vel[:, n], old_fields.magn[:, n] - new_fields.magn[:, n])
+        c += dt / 2 * a * np.cross(old_parts.vel, old_fields.magn - new_fields.magn, axis=0)
 
-            # pre-velocity, separated by the electric forces (and the c term)
-            vm = old_parts.vel[:, n] + dt / 2 * a * Emean[:, n] + c[:, n] / 2
-            # rotation
-            t = dt / 2 * a * new_fields.magn[:, n]
-            s = 2 * t / (1 + np.linalg.norm(t, 2) ** 2)
-            vp = vm + np.cross(vm + np.cross(vm, t), s)
-            # post-velocity
-            vel[:, n] = vp + dt / 2 * a * Emean[:, n] + c[:, n] / 2
+        # pre-velocity, separated by the electric forces (and the c term)
+        vm = old_parts.vel + dt / 2 * a * Emean + c / 2
+        # rotation
+        t = dt / 2 * a * new_fields.magn
+        s = 2 * t / (1 + np.sum(t ** 2, axis=0))
+        vp = vm + np.cross(vm + np.cross(vm, t, axis=0), s, axis=0)
+        # post-velocity
+        vel[:] = vp + dt / 2 * a * Emean + c / 2
 
         return vel
@@ -1,5 +1,6 @@
 import numpy as np
 from scipy.integrate import solve_ivp
+from scipy.linalg import lu_factor, lu_solve
 
 from pySDC.core.Errors import ParameterError
 from pySDC.core.Problem import ptype
@@ -11,8 +12,12 @@ class piline(ptype):
     """
     Example implementing the Piline model as in the description in the PinTSimE project
 
+    If ensemble_size is set, the problem holds that many independent realizations at once, with values of shape
+    (ensemble_size, 3). Then, all circuit parameters can also be given per member, as numpy arrays of shape
+    (ensemble_size,).
+
     Attributes:
-        A: system matrix, representing the 3 ODEs
+        A: system matrix, representing the 3 ODEs (one per member for ensembles, i.e. of shape (ensemble_size, 3, 3))
     """
 
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=imex_mesh):
@@ -34,19 +39,32 @@ class piline(ptype):
                 msg = 'need %s to instantiate problem, only got %s' % (key, str(problem_params.keys()))
                 raise ParameterError(msg)
 
+        if 'ensemble_size' not in problem_params:
+            problem_params['ensemble_size'] = None
+
+        if problem_params['ensemble_size'] is None:
+            shape = problem_params['nvars']
+        else:
+            shape = (problem_params['ensemble_size'], problem_params['nvars'])
+            for key in essential_keys:
+                problem_params[key] = np.asarray(problem_params[key])
+
         # invoke super init, passing number of dofs, dtype_u and dtype_f
-        super(piline, self).__init__(init=(problem_params['nvars'], None, np.dtype('float64')),
+        super(piline, self).__init__(init=(shape, None, np.dtype('float64')),
                                      dtype_u=dtype_u, dtype_f=dtype_f, params=problem_params)
 
         # compute dx and get discretization matrix A
-        self.A = np.zeros((3, 3))
-        self.A[0, 0] = -1 / (self.params.Rs * self.params.C1)
-        self.A[0, 2] = -1 / self.params.C1
-        self.A[1, 1] = -1 / (self.params.Rl * self.params.C2)
-        self.A[1, 2] = 1 / self.params.C2
-        self.A[2, 0] = 1 / self.params.Lpi
-        self.A[2, 1] = -1 / self.params.Lpi
-        self.A[2, 2] = -self.params.Rpi / self.params.Lpi
+        self.A = np.zeros((3, 3) if self.params.ensemble_size is None else (self.params.ensemble_size, 3, 3))
+        self.A[..., 0, 0] = -1 / (self.params.Rs * self.params.C1)
+        self.A[..., 0, 2] = -1 / self.params.C1
+        self.A[..., 1, 1] = -1 / (self.params.Rl * self.params.C2)
+        self.A[..., 1, 2] = 1 / self.params.C2
+        self.A[..., 2, 0] = 1 / self.params.Lpi
+        self.A[..., 2, 1] = -1 / self.params.Lpi
+        self.A[..., 2, 2] = -self.params.Rpi / self.params.Lpi
+
+        # the systems to solve only depend on the factor, so their factorizations can be reused
+        self.setup_factorization_cache()
 
     def eval_f(self, u, t):
         """
@@ -61,8 +79,11 @@ class piline(ptype):
         """
 
         f = self.dtype_f(self.init, val=0.0)
-        f.impl[:] = self.A.dot(u)
-        f.expl[0] = self.params.Vs / (self.params.Rs * self.params.C1)
+        if self.params.ensemble_size is None:
+            f.impl[:] = self.A.dot(u)
+        else:
+            f.impl[:] = np.einsum('eij,ej->ei', self.A, u)
+        f.expl[..., 0] = self.params.Vs / (self.params.Rs * self.params.C1)
         return f
 
     def solve_system(self, rhs, factor, u0, t):
@@ -80,7 +101,13 @@ class piline(ptype):
         """
 
         me = self.dtype_u(self.init)
-        me[:] = np.linalg.solve(np.eye(self.params.nvars) - factor * self.A, rhs)
+        if self.params.ensemble_size is None:
+            LU = self.get_factorization(factor, lambda: lu_factor(np.eye(self.params.nvars) - factor * self.A))
+            me[:] = lu_solve(LU, rhs)
+        else:
+            # the small systems of all members are inverted at once and the inverses are kept
+            inv = self.get_factorization(factor, lambda: np.linalg.inv(np.eye(self.params.nvars) - factor * self.A))
+            me[:] = np.einsum('eij,ej->ei', inv, rhs)
         return me
 
     def u_exact(self, t, u_init=None, t_init=None):
@@ -99,9 +126,9 @@ class piline(ptype):
         me = self.dtype_u(self.init)
 
         # fill initial conditions
-        me[0] = 0.0  # v1
-        me[1] = 0.0  # v2
-        me[2] = 0.0  # p3
+        me[..., 0] = 0.0  # v1
+        me[..., 1] = 0.0  # v2
+        me[..., 2] = 0.0  # p3
 
         if t > 0.:
             if u_init is not None:
@@ -113,10 +140,11 @@ is not 0!')
                 t_init = 0.
 
             def rhs(t, u):
-                f = self.eval_f(u, t)
-                return f.impl + f.expl  # evaluate only explicitly rather than IMEX
+                f = self.eval_f(u.reshape(me.shape), t)
+                return (f.impl + f.expl).flatten()  # evaluate only explicitly rather than IMEX
 
+            # all members of an ensemble are integrated at once
             tol = 100 * np.finfo(float).eps
-            me[:] = solve_ivp(rhs, (t_init, t), me, rtol=tol, atol=tol).y[:, -1]
+            me[:] = solve_ivp(rhs, (t_init, t), me.flatten(), rtol=tol, atol=tol).y[:, -1].reshape(me.shape)
 
         return me
@@ -12,8 +12,12 @@ class testequation0d(ptype):
     """
     Example implementing a bundle of test equations at once (via diagonal matrix)
 
+    If ensemble_size is set, the problem holds that many independent realizations at once, with values of shape
+    (ensemble_size, nvars). Then, lambdas and u0 can also be given per member, as numpy arrays of that shape.
+
     Attributes:
-        A: digonal matrix containing the parameters
+        A: digonal matrix containing the parameters, None if ensemble_size is set
+        lambdas (numpy.ndarray): the parameters for all members, if ensemble_size is set
     """
 
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=mesh):
@@ -33,16 +37,32 @@ class testequation0d(ptype):
                 msg = 'need %s to instantiate problem, only got %s' % (key, str(problem_params.keys()))
                 raise ParameterError(msg)
 
-        assert not any(isinstance(i, list) for i in problem_params['lambdas']), \
-            'ERROR: expect flat list here, got %s' % problem_params['lambdas']
-        problem_params['nvars'] = len(problem_params['lambdas'])
+        if 'ensemble_size' not in problem_params:
+            problem_params['ensemble_size'] = None
+
+        if problem_params['ensemble_size'] is None:
+            assert not any(isinstance(i, list) for i in problem_params['lambdas']), \
+                'ERROR: expect flat list here, got %s' % problem_params['lambdas']
+            problem_params['nvars'] = len(problem_params['lambdas'])
+            shape = problem_params['nvars']
+        else:
+            problem_params['nvars'] = np.shape(problem_params['lambdas'])[-1]
+            shape = (problem_params['ensemble_size'], problem_params['nvars'])
         assert problem_params['nvars'] > 0, 'ERROR: expect at least one lambda parameter here'
 
         # invoke super init, passing number of dofs, dtype_u and dtype_f
-        super(testequation0d, self).__init__(init=(problem_params['nvars'], None, np.dtype('complex128')),
+        super(testequation0d, self).__init__(init=(shape, None, np.dtype('complex128')),
                                              dtype_u=dtype_u, dtype_f=dtype_f, params=problem_params)
 
-        self.A = self.__get_A(self.params.lambdas)
+        if self.params.ensemble_size is None:
+            self.A = self.__get_A(self.params.lambdas)
+        else:
+            # the matrix is diagonal for each member, so all of them are treated entrywise
+            self.A = None
+            self.lambdas = np.broadcast_to(np.array(self.params.lambdas, dtype=complex), shape)
+
+        # the systems to solve only depend on the factor, so their factorizations can be reused
+        self.setup_factorization_cache()
 
     @staticmethod
     def __get_A(lambdas):
@@ -72,7 +92,10 @@ class testequation0d(ptype):
         """
 
         f = self.dtype_f(self.init)
-        f[:] = self.A.dot(u)
+        if self.params.ensemble_size is None:
+            f[:] = self.A.dot(u)
+        else:
+            f[:] = self.lambdas * u
         return f
 
     def solve_system(self, rhs, factor, u0, t):
@@ -90,8 +113,11 @@ class testequation0d(ptype):
         """
 
         me = self.dtype_u(self.init)
-        L = splu(sp.eye(self.params.nvars, format='csc') - factor * self.A)
-        me[:] = L.solve(rhs)
+        if self.params.ensemble_size is None:
+            L = self.get_factorization(factor, lambda: splu(sp.eye(self.params.nvars, format='csc') - factor * self.A))
+            me[:] = L.solve(rhs)
+        else:
+            me[:] = rhs / (1.0 - factor * self.lambdas)
         return me
 
     def u_exact(self, t):
@@ -10,6 +10,10 @@ from pySDC.implementations.datatype_classes.mesh import mesh
 class vanderpol(ptype):
     """
     Example implementing the van der pol oscillator
+
+    If ensemble_size is set, the problem holds that many independent realizations at once, with values of shape
+    (ensemble_size, 2). Then, u0 and mu can be given per member, as numpy arrays of shape (ensemble_size, 2) and
+    (ensemble_size,), respectively (lists would be taken as parameters for different levels).
     """
 
     def __init__(self, problem_params, dtype_u=mesh, dtype_f=mesh):
@@ -34,10 +38,17 @@ class vanderpol(ptype):
             problem_params['stop_at_nan'] = True
         if 'crash_at_maxiter' not in problem_params:
             problem_params['crash_at_maxiter'] = True
+        if 'ensemble_size' not in problem_params:
+            problem_params['ensemble_size'] = None
+
+        if problem_params['ensemble_size'] is None:
+            shape = problem_params['nvars']
+        else:
+            shape = (problem_params['ensemble_size'], problem_params['nvars'])
+            problem_params['mu'] = np.asarray(problem_params['mu'])
 
-        # invoke super init, passing dtype_u and dtype_f, plus setting number of elements to 2
-        super(vanderpol, self).__init__((problem_params['nvars'], None, np.dtype('float64')),
-                                        dtype_u, dtype_f, problem_params)
+        # invoke super init, passing dtype_u and dtype_f, plus setting number of elements to 2 (per member)
+        super(vanderpol, self).__init__((shape, None, np.dtype('float64')), dtype_u, dtype_f, problem_params)
 
     def u_exact(self, t, u_init=None, t_init=None):
         """
@@ -57,7 +68,7 @@ class vanderpol(ptype):
         if t > 0.:
 
             def rhs(t, u):
-                return self.eval_f(u, t)
+                return self.eval_f(u.reshape(me.shape), t).flatten()
 
             tol = 100 * np.finfo(float).eps
 
@@ -67,11 +78,12 @@ class vanderpol(ptype):
 is not 0!')
                 me = u_init.copy()
             else:
-                u_init = self.params.u0.copy()
+                me[:] = self.params.u0
                 t_init = 0.
-            me[:] = solve_ivp(rhs, (t_init, t), u_init, rtol=tol, atol=tol).y[:, -1]
+            # all members of an ensemble are integrated at once
+            me[:] = solve_ivp(rhs, (t_init, t), me.flatten(), rtol=tol, atol=tol).y[:, -1].reshape(me.shape)
         else:
-            me[:] = self.params.u0[:]
+            me[:] = self.params.u0
         return me
 
     def eval_f(self, u, t):
@@ -85,16 +97,15 @@ is not 0!')
             dtype_f: RHS, 2 components
         """
 
-        x1 = u[0]
-        x2 = u[1]
+        # split off the components, for all members of an ensemble at once
+        x1, x2 = np.moveaxis(np.asarray(u), -1, 0)
         f = self.dtype_f(self.init)
-        f[0] = x2
-        f[1] = self.params.mu * (1 - x1 ** 2) * x2 - x1
+        f[:] = np.stack([x2, self.params.mu * (1 - x1 ** 2) * x2 - x1], axis=-1)
         return f
 
     def solve_system(self, rhs, dt, u0, t):
         """
-        Simple Newton solver for the nonlinear system
+        Simple Newton solver for the nonlinear system, for an ensemble it iterates all members at once
 
         Args:
             rhs (dtype_f): right-hand side for the nonlinear system
@@ -108,10 +119,10 @@ is not 0!')
 
         mu = self.params.mu
 
-        # create new mesh object from u0 and set initial values for iteration
+        # create new mesh object from u0 and set initial values for iteration, for all members of an ensemble at once
         u = self.dtype_u(u0)
-        x1 = u[0]
-        x2 = u[1]
+        x1, x2 = np.moveaxis(np.asarray(u), -1, 0)
+        rhs1, rhs2 = np.moveaxis(np.asarray(rhs), -1, 0)
 
         # start newton iteration
         n = 0
@@ -119,24 +130,24 @@ is not 0!')
         while n < self.params.newton_maxiter:
 
             # form the function g with g(u) = 0
-            g = np.array([x1 - dt * x2 - rhs[0], x2 - dt * (mu * (1 - x1 ** 2) * x2 - x1) - rhs[1]])
+            g = np.array([x1 - dt * x2 - rhs1, x2 - dt * (mu * (1 - x1 ** 2) * x2 - x1) - rhs2])
 
             # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
+            res = np.linalg.norm(g.flatten(), np.inf)
             if res < self.params.newton_tol or np.isnan(res):
                 break
 
             # prefactor for dg/du
             c = 1.0 / (-2 * dt ** 2 * mu * x1 * x2 - dt ** 2 - 1 + dt * mu * (1 - x1 ** 2))
-            # assemble dg/du
-            dg = c * np.array([[dt * mu * (1 - x1 ** 2) - 1, -dt], [2 * dt * mu * x1 * x2 + dt, -1]])
+            # assemble the inverse of dg/du entrywise
+            dg = c * np.array([[dt * mu * (1 - x1 ** 2) - 1, np.full_like(x1, -dt)],
+                               [2 * dt * mu * x1 * x2 + dt, np.full_like(x1, -1.0)]])
 
             # newton update: u1 = u0 - g/dg
-            u -= np.dot(dg, g)
+            u -= np.stack([dg[0, 0] * g[0] + dg[0, 1] * g[1], dg[1, 0] * g[0] + dg[1, 1] * g[1]], axis=-1)
 
             # set new values and increase iteration count
-            x1 = u[0]
-            x2 = u[1]
+            x1, x2 = np.moveaxis(np.asarray(u), -1, 0)
             n += 1
 
         if np.isnan(res) and self.params.stop_at_nan:
@@ -0,0 +1,215 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, bicgstab, cg, gmres, spilu
+
+from pySDC.core.Errors import ParameterError
+from pySDC.core.Problem import FactorizationCache
+from pySDC.helpers.banded_helper import factorize
+from pySDC.helpers.multigrid_helper import MultigridSolver, get_prolongation_matrices
+from pySDC.helpers.pysdc_helper import FrozenClass
+
+
+# short helper class to add params as attributes
+class _Pars(FrozenClass):
+    def __init__(self, pars):
+
+        self.method = 'CG'
+        self.preconditioner = None
+        self.tol = 1E-12
+        self.maxiter = None
+        self.restart = None
+        self.warm_start = True
+        self.adaptive_tol = None
+        self.cache_size = 16
+
+        for k, v in pars.items():
+            setattr(self, k, v)
+
+        self._freeze()
+
+
+class linear_solver(object):
+    """
+    Configurable solver for the linear systems in problem classes, like (I - factor * A) u = rhs
+
+    Problem classes hand their systems to this class instead of calling scipy directly, so that the method and the
+    preconditioner can be chosen via a single dictionary in the problem parameters for all levels. Factorizations,
+    multigrid hierarchies and preconditioners are cached by a key given by the problem, usually the factor.
+
+    Parameters:
+        method (str): 'direct' (banded LAPACK solver for narrow bands, SuperLU else), 'CG', 'GMRES', 'BiCGSTAB' or 'MG'
+        preconditioner: None, 'jacobi', 'ilu' (not symmetric, so not for CG), 'MG', a LinearOperator or a function
+                        returning one for a matrix
+        tol (float): tolerance for the residual relative to the right-hand side
+        maxiter (int): maximal number of iterations, None for the default of scipy
+        restart (int): restart of GMRES, None for the default of scipy
+        warm_start (bool): start from the given initial guess or the last solution for the same key, else from zero
+        adaptive_tol (float): if set, only reduce the initial residual by this factor (but not below tol)
+        cache_size (int): number of factorizations and preconditioners kept, if the solver has its own cache
+
+    Attributes:
+        params (_Pars): the parameters
+        ncalls (int): number of solves
+        niter (int): total number of iterations over all solves
+        last_niter (int): number of iterations of the last solve
+        last_info (int): convergence information of the last solve, 0 if successful (as for scipy)
+    """
+
+    def __init__(self, params=None, nvars=None, periodic=False, cache=None):
+        """
+        Initialization routine
+
+        Args:
+            params (dict): parameters of the solver, see above
+            nvars (tuple): number of degrees of freedom per dimension, needed for multigrid only
+            periodic (bool): flag to indicate periodicity of the grid, needed for multigrid only
+            cache (FactorizationCache): cache to use, e.g. the one of the problem, a new one is created if None
+        """
+        self.params = _Pars(params or {})
+
+        if self.params.method not in ['direct', 'CG', 'GMRES', 'BiCGSTAB', 'MG']:
+            raise ParameterError(f'linear solver {self.params.method} not implemented, choose direct, CG, GMRES, '
+                                 f'BiCGSTAB or MG')
+        if type(self.params.preconditioner) is str and self.params.preconditioner not in ['jacobi', 'ilu', 'MG']:
+            raise ParameterError(f'preconditioner {self.params.preconditioner} not implemented, choose jacobi, '
+                                 f'ilu or MG')
+        uses_multigrid = self.params.method == 'MG' or self.params.preconditioner == 'MG'
+        if uses_multigrid and nvars is None:
+            raise ParameterError('need the grid to use multigrid')
+
+        self.nvars = nvars
+        self.periodic = periodic
+        self.prolongations = get_prolongation_matrices(nvars, periodic) if uses_multigrid else None
+
+        self.cache = FactorizationCache(self.params.cache_size) if cache is None else cache
+        self.__last_solutions = {}
+
+        self.ncalls = 0
+        self.niter = 0
+        self.last_niter = 0
+        self.last_info = 0
+
+    @property
+    def needs_matrix(self):
+        """
+        Check whether the assembled matrix is required, i.e. whether the system cannot be solved matrix-free
+        """
+        return self.params.method in ['direct', 'MG'] or type(self.params.preconditioner) is str or \
+            (callable(self.params.preconditioner) and not isinstance(self.params.preconditioner, LinearOperator))
+
+    def __setup(self, A, key, setup):
+        """
+        Get a factorization, hierarchy or preconditioner from the cache, or set it up if the key is None or unknown
+        """
+        if key is None:
+            return setup(A())
+        return self.cache.get((setup.__name__, key), lambda: setup(A()))
+
+    def __multigrid(self, A):
+        return MultigridSolver(A, self.prolongations)
+
+    @staticmethod
+    def __factorize(A):
+        return factorize(A)
+
+    def __preconditioner(self, A):
+        preconditioner = self.params.preconditioner
+        if preconditioner == 'jacobi':
+            inv_diag = 1.0 / A.diagonal()
+            return LinearOperator(A.shape, matvec=lambda x: inv_diag * np.asarray(x).flatten(), dtype=A.dtype)
+        elif preconditioner == 'ilu':
+            return LinearOperator(A.shape, matvec=spilu(sp.csc_matrix(A)).solve, dtype=A.dtype)
+        elif preconditioner == 'MG':
+            return self.__multigrid(A).aspreconditioner()
+        return preconditioner(A)
+
+    def solve(self, A, b, x0=None, key=None, matrix=None, tol=None):
+        """
+        Solve the linear system
+
+        Args:
+            A: the system as sparse matrix or LinearOperator, used for the matrix-vector products
+            b (numpy.ndarray): the right-hand side
+            x0 (numpy.ndarray): initial guess, if None the last solution for the same key is used for warm starts
+            key: hashable key identifying the system for caching, e.g. the factor, None to disable caching
+            matrix: function without arguments returning the assembled sparse matrix, if A is no sparse matrix and the
+                    method or the preconditioner needs it
+            tol (float): tolerance for this solve, overriding the parameter (e.g. set adaptively by the problem)
+
+        Returns:
+            numpy.ndarray: the solution, flattened
+        """
+        b = np.asarray(b).flatten()
+        tol = self.params.tol if tol is None else tol
+
+        if matrix is None:
+            if self.needs_matrix and not sp.issparse(A):
+                raise ParameterError(f'linear solver {self.params.method} with preconditioner '
+                                     f'{self.params.preconditioner} needs the assembled matrix')
+
+            def matrix():
+                return A
+
+        # solutions are only kept for callers relying on warm starts, so that keys used once do not pile up
+        remember = self.params.warm_start and key is not None and x0 is None
+        if not self.params.warm_start:
+            x0 = None
+        elif x0 is None:
+            x0 = self.__last_solutions.get(key)
+        x0 = None if x0 is None else np.asarray(x0).flatten()
+
+        class context:
+            num_iter = 0
+
+        def callback(xk):
+            context.num_iter += 1
+
+        info = 0
+        if self.params.method == 'direct':
+            x = self.__setup(matrix, key, self.__factorize).solve(b)
+        elif self.params.method == 'MG':
+            mg = self.__setup(matrix, key, self.__multigrid)
+            x = mg.solve(b, x0=x0, tol=self.__get_tol(A, b, x0, tol), maxiter=self.params.maxiter or 100)
+            context.num_iter = mg.niter
+        else:
+            kwargs = {'x0': x0, 'tol': self.__get_tol(A, b, x0, tol), 'maxiter': self.params.maxiter,
+                      'callback': callback}
+            if self.params.preconditioner is not None:
+                if isinstance(self.params.preconditioner, LinearOperator):
+                    kwargs['M'] = self.params.preconditioner
+                else:
+                    kwargs['M'] = self.__setup(matrix, key, self.__preconditioner)
+            if self.params.method == 'CG':
+                x, info = cg(A, b, **kwargs)
+            elif self.params.method == 'BiCGSTAB':
+                x, info = bicgstab(A, b, **kwargs)
+            else:
+                x, info = gmres(A, b, restart=self.params.restart, callback_type='legacy', **kwargs)
+
+        if remember:
+            self.__last_solutions[key] = x
+
+        self.ncalls += 1
+        self.niter += context.num_iter
+        self.last_niter = context.num_iter
+        self.last_info = info
+
+        return x
+
+    def __get_tol(self, A, b, x0, tol):
+        """
+        Get the relative tolerance for an iterative solve, relaxed if adaptive tolerances are used
+        """
+        if self.params.adaptive_tol is None or x0 is None:
+            return tol
+        norm_b = np.linalg.norm(b)
+        if norm_b == 0:
+            return tol
+        return max(tol, self.params.adaptive_tol * np.linalg.norm(b - A @ x0) / norm_b)
+
+    def reset(self):
+        """
+        Drop all cached factorizations, preconditioners and warm starts, e.g. because the step size changed
+        """
+        self.cache.clear()
+        self.__last_solutions = {}
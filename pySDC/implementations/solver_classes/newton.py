@@ -0,0 +1,178 @@
+import itertools
+from collections import OrderedDict
+
+import numpy as np
+
+from pySDC.core.Errors import ParameterError
+from pySDC.helpers.pysdc_helper import FrozenClass
+from pySDC.implementations.solver_classes.linear_solver import linear_solver
+
+
+# short helper class to add params as attributes
+class _Pars(FrozenClass):
+    def __init__(self, pars):
+
+        self.strategy = 'full'
+        self.refresh = None
+        self.max_rate = 0.5
+        self.maxiter = 100
+        self.tol = 1E-12
+
+        for k, v in pars.items():
+            setattr(self, k, v)
+
+        self._freeze()
+
+
+# versions of the frozen Jacobians, unique over all solvers so that copies sharing a cache do not mix factorizations
+_jacobian_versions = itertools.count(1)
+
+
+class newton_solver(object):
+    """
+    Newton's method for nonlinear systems g(u) = 0 in problem classes, with different strategies for the Jacobian
+
+    With the full strategy, the Jacobian is assembled and solved in each iteration. With the simplified strategy, it is
+    kept and reused across iterations and across calls with the same key, e.g. for all solves with the same factor
+    during a run. Then the factorization of the linear solver is reused as well. The frozen Jacobian is refreshed every
+    refresh iterations (if set) and whenever the residual is not reduced by at least max_rate. As many frozen Jacobians
+    are kept as the cache of the linear solver keeps factorizations, dropping the least recently used ones.
+
+    Parameters:
+        strategy (str): 'full' or 'simplified'
+        refresh (int): number of iterations after which a frozen Jacobian is assembled anew, None for never
+        max_rate (float): reduction of the residual per iteration, below which a frozen Jacobian is refreshed
+        maxiter (int): maximal number of iterations
+        tol (float): tolerance for the residual in the maximum norm
+
+    Attributes:
+        params (_Pars): the parameters
+        linear_solver (linear_solver): the solver for the linear systems with the Jacobian
+        ncalls (int): number of solves
+        niter (int): total number of iterations over all solves
+        njacobians (int): total number of Jacobians assembled
+    """
+
+    def __init__(self, params=None, solver=None):
+        """
+        Initialization routine
+
+        Args:
+            params (dict): parameters of Newton's method, see above
+            solver (linear_solver): solver for the linear systems, a direct solver is used if None
+        """
+        self.params = _Pars(params or {})
+
+        if self.params.strategy not in ['full', 'simplified']:
+            raise ParameterError(f'Newton strategy {self.params.strategy} not implemented, choose full or simplified')
+
+        self.linear_solver = linear_solver({'method': 'direct'}) if solver is None else solver
+        self.__jacobians = OrderedDict()
+
+        self.ncalls = 0
+        self.niter = 0
+        self.njacobians = 0
+
+    def __getstate__(self):
+        """
+        Frozen Jacobians are not copied, copies assemble their own
+        """
+        state = self.__dict__.copy()
+        state['_newton_solver__jacobians'] = OrderedDict()
+        return state
+
+    def __get_jacobian(self, dg, u, key, age_limit):
+        """
+        Get the frozen Jacobian for the key or assemble a new one
+
+        Args:
+            dg: function returning the Jacobian at u
+            u (numpy.ndarray): the current iterate
+            key: hashable key identifying the system
+            age_limit (int): maximal number of iterations the Jacobian may have been used for, or None
+
+        Returns:
+            the Jacobian and the key of its factorization for the linear solver
+        """
+        if key in self.__jacobians:
+            jacobian, version, age = self.__jacobians[key]
+            if age_limit is None or age < age_limit:
+                self.__jacobians[key] = (jacobian, version, age + 1)
+                self.__jacobians.move_to_end(key)
+                return jacobian, ('newton', key, version)
+
+        version = next(_jacobian_versions)
+        self.njacobians += 1
+        jacobian = dg(u)
+        self.__jacobians[key] = (jacobian, version, 1)
+        self.__jacobians.move_to_end(key)
+        while len(self.__jacobians) > self.linear_solver.cache.maxsize:
+            self.__jacobians.popitem(last=False)
+        return jacobian, ('newton', key, version)
+
+    def solve(self, g, dg, u0, key=None):
+        """
+        Solve g(u) = 0 with Newton's method
+
+        Args:
+            g: function returning the residual at u, flattened
+            dg: function returning the Jacobian at u as sparse matrix
+            u0 (numpy.ndarray): initial guess, flattened
+            key: hashable key identifying the system (e.g. the factor) to reuse a frozen Jacobian across calls, None to
+                 keep it only within this call
+
+        Returns:
+            numpy.ndarray: the solution
+            int: the number of iterations
+            float: the final residual
+        """
+        u = np.array(u0, dtype=float).flatten()
+
+        # without a key, a frozen Jacobian is only kept during this call
+        temporary = key is None
+        if temporary:
+            key = ('call', self.ncalls)
+
+        n = 0
+        res = 99
+        res_old = None
+        while n < self.params.maxiter:
+
+            # form the function g with g(u) = 0
+            gu = g(u)
+
+            # if g is close to 0, then we are done
+            res = np.linalg.norm(gu, np.inf)
+            if res < self.params.tol or np.isnan(res):
+                break
+
+            if self.params.strategy == 'full':
+                self.njacobians += 1
+                jacobian, solver_key = dg(u), None
+            else:
+                # refresh a frozen Jacobian if the convergence is too slow
+                if res_old is not None and res > self.params.max_rate * res_old:
+                    self.__jacobians.pop(key, None)
+                jacobian, solver_key = self.__get_jacobian(dg, u, key, self.params.refresh)
+            res_old = res
+
+            # newton update: u1 = u0 - g/dg
+            u -= self.linear_solver.solve(jacobian, gu, x0=np.zeros_like(u), key=solver_key)
+
+            # increase iteration count
+            n += 1
+
+        if temporary:
+            self.__jacobians.pop(key, None)
+
+        self.ncalls += 1
+        self.niter += n
+
+        return u, n, res
+
+    def reset(self):
+        """
+        Drop all frozen Jacobians and cached factorizations, e.g. because the step size changed
+        """
+        self.__jacobians = OrderedDict()
+        self.linear_solver.reset()
@@ -194,7 +194,7 @@ Please be aware that they are ignored since the quadrature matrix is entirely de
 
         for m in range(0, M):
             # build rhs, consisting of the known values from above and new values from previous nodes (at k+1)
-            rhs = L.u[0]
+            rhs = P.dtype_u(L.u[0])
             for j in range(1, m + 1):
                 rhs += L.dt * self.QI[m + 1, j] * L.f[j]
 
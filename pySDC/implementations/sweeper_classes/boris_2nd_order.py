@@ -16,6 +16,8 @@ class boris_2nd_order(sweeper):
         Sx: node-to-node Euler half-step for position update
     """
 
+    shared_operators = ['S', 'ST', 'SQ', 'Sx', 'QQ', 'QT', 'Qx', 'Q', 'qQ']
+
     def __init__(self, params):
         """
         Initialization routine for the custom sweeper
@@ -42,6 +44,9 @@ class boris_2nd_order(sweeper):
 
         self.qQ = np.dot(self.coll.weights, self.coll.Qmat[1:, 1:])
 
+        # assembled forces at the nodes, together with the values they were built from
+        self.__forces = [None] * (self.coll.num_nodes + 1)
+
     def __get_Qd(self):
         """
         Get integration matrices for 2nd-order SDC
@@ -83,6 +88,31 @@ class boris_2nd_order(sweeper):
 
         return [S, ST, SQ, Sx, QQ, QT, Qx, self.coll.Qmat]
 
+    def __get_force(self, m):
+        """
+        Get the force at a node, which is built from the fields and the particles only if these have changed
+
+        The data types of the particles and fields do not change in place outside of the sweep, but are replaced by new
+        objects. Hence, the force is cached together with the objects it was built from and is valid as long as the
+        level still holds these same objects, while the sweep invalidates the nodes it updates.
+
+        Args:
+            m (int): index of the node
+
+        Returns:
+            acceleration: the force at the node
+        """
+
+        L = self.level
+        t = L.time + L.dt * self.coll.nodes[m - 1]
+
+        cached = self.__forces[m]
+        if cached is None or cached[0] is not L.u[m] or cached[1] is not L.f[m] or cached[2] != t:
+            cached = (L.u[m], L.f[m], t, L.prob.build_f(L.f[m], L.u[m], t))
+            self.__forces[m] = cached
+
+        return cached[3]
+
     def update_nodes(self):
         """
         Update the u- and f-values at the collocation nodes -> corresponds to a single sweep over all nodes
@@ -108,8 +138,8 @@ class boris_2nd_order(sweeper):
         # this corresponds to SF(u^k) - SdF(u^k) + tau (note: have integrals in pos and vel!)
         for m in range(M):
             for j in range(M + 1):
-                # build RHS from f-terms (containing the E field) and the B field
-                f = P.build_f(L.f[j], L.u[j], L.time + L.dt * self.coll.nodes[j - 1])
+                # get RHS from f-terms (containing the E field) and the B field
+                f = self.__get_force(j)
                 # add SQF(u^k) - SxF(u^k) for the position
                 integral[m].pos += L.dt * (
                     L.dt * (self.SQ[m + 1, j] - self.Sx[m + 1, j]) * f
@@ -128,8 +158,8 @@ class boris_2nd_order(sweeper):
             # build rhs, consisting of the known values from above and new values from previous nodes (at k+1)
             tmp = P.dtype_u(integral[m])
             for j in range(m + 1):
-                # build RHS from f-terms (containing the E field) and the B field
-                f = P.build_f(L.f[j], L.u[j], L.time + L.dt * self.coll.nodes[j - 1])
+                # get RHS from f-terms (containing the E field) and the B field
+                f = self.__get_force(j)
                 # add SxF(u^{k+1})
                 tmp.pos += L.dt * (L.dt * self.Sx[m + 1, j] * f)
             # add pos at previous node + dt*v0
@@ -147,6 +177,9 @@ class boris_2nd_order(sweeper):
                 ck, L.dt * self.coll.delta_m[m], L.f[m], L.f[m + 1], L.u[m]
             )
 
+            # the particles at this node have been changed in place, so the force has to be built again
+            self.__forces[m + 1] = None
+
         # indicate presence of new values at this level
         L.status.updated = True
 
@@ -172,7 +205,7 @@ class boris_2nd_order(sweeper):
 
             # integrate RHS over all collocation nodes, RHS is here only f(x,v)!
             for j in range(1, self.coll.num_nodes + 1):
-                f = P.build_f(L.f[j], L.u[j], L.time + L.dt * self.coll.nodes[j - 1])
+                f = self.__get_force(j)
                 p[-1].pos += (
                     L.dt * (L.dt * self.QQ[m, j] * f) + L.dt * self.coll.Qmat[m, j] * L.u[0].vel
                 )
@@ -197,7 +230,7 @@ class boris_2nd_order(sweeper):
         # start with u0 and add integral over the full interval (using coll.weights)
         L.uend = P.dtype_u(L.u[0])
         for m in range(self.coll.num_nodes):
-            f = P.build_f(L.f[m + 1], L.u[m + 1], L.time + L.dt * self.coll.nodes[m])
+            f = self.__get_force(m + 1)
             L.uend.pos += (
                 L.dt * (L.dt * self.qQ[m] * f) + L.dt * self.coll.weights[m] * L.u[0].vel
             )
@@ -1,3 +1,5 @@
+import numpy as np
+
 from pySDC.core.Sweeper import sweeper
 
 
@@ -9,6 +11,8 @@ class explicit(sweeper):
         QE: explicit Euler integration matrix
     """
 
+    shared_operators = ['QE']
+
     def __init__(self, params):
         """
         Initialization routine for the custom sweeper
@@ -26,6 +30,9 @@ class explicit(sweeper):
         # integration matrix
         self.QE = self.get_Qdelta_explicit(coll=self.coll, qd_type=self.params.QE)
 
+        # for vanishing QE (Picard iterations) the nodes can be updated all at once
+        self.independent_nodes = not np.any(self.QE[1:, 1:])
+
     def integrate(self):
         """
         Integrates the right-hand side
@@ -38,6 +45,10 @@ class explicit(sweeper):
         L = self.level
         P = L.prob
 
+        if L.params.stack_nodes:
+            # all nodes at once: contract the collocation matrix with the stacked RHS values
+            return L.f.contract(L.dt * self.coll.Qmat[1:, 1:], start=1)
+
         me = []
 
         # integrate RHS over all collocation nodes
@@ -83,14 +94,18 @@ class explicit(sweeper):
                 integral[m] += L.tau[m]
 
         # do the sweep
-        for m in range(0, M):
-            # build new u, consisting of the known values from above and new values from previous nodes (at k+1)
-            L.u[m + 1] = P.dtype_u(integral[m])
-            for j in range(1, m + 1):
-                L.u[m + 1] += L.dt * self.QE[m + 1, j] * L.f[j]
-
-            # update function values
-            L.f[m + 1] = P.eval_f(L.u[m + 1], L.time + L.dt * self.coll.nodes[m])
+        if self.independent_nodes:
+            self.update_all_nodes(integral)
+
+        else:
+            for m in range(0, M):
+                # build new u, consisting of the known values from above and new values from previous nodes (at k+1)
+                L.u[m + 1] = P.dtype_u(integral[m])
+                for j in range(1, m + 1):
+                    L.u[m + 1] += L.dt * self.QE[m + 1, j] * L.f[j]
+
+                # update function values
+                L.f[m + 1] = P.eval_f(L.u[m + 1], L.time + L.dt * self.coll.nodes[m])
 
         # indicate presence of new values at this level
         L.status.updated = True
@@ -0,0 +1,225 @@
+import atexit
+import hashlib
+import pickle
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import numpy as np
+
+from pySDC.core.Errors import ParameterError
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+
+# thread pools can be shared by all sweepers, one per number of workers
+_thread_pools = {}
+
+# process pools are shared by all sweepers with the same number of workers and the same problem, since the problem is
+# sent to the worker processes only once when they start, and the number of sweepers using each of them
+_process_pools = {}
+_process_pool_users = {}
+
+# token and problem instance of a worker process
+_worker_problem = (None, None)
+
+
+def _shutdown_pools():
+    """
+    Shut down all pools at exit
+    """
+    for pool in list(_thread_pools.values()) + list(_process_pools.values()):
+        pool.shutdown(wait=True)
+    _thread_pools.clear()
+    _process_pools.clear()
+    _process_pool_users.clear()
+
+
+atexit.register(_shutdown_pools)
+
+
+def _init_worker(token, data):
+    """
+    Initializer of the worker processes, unpickling the problem once per worker
+
+    Args:
+        token (str): unique token of the problem
+        data (bytes): the pickled problem
+    """
+    global _worker_problem
+    _worker_problem = (token, pickle.loads(data))
+
+
+def _solve_and_eval(prob, rhs, factor, u0, t):
+    """
+    Task for a single node: implicit solve followed by the evaluation of the RHS
+
+    Args:
+        prob: the problem, or its token for worker processes
+        rhs (dtype_u): right-hand side for the linear system
+        factor (float): abbrev. for the node-to-node stepsize (or any other factor required)
+        u0 (dtype_u): initial guess for the iterative solver
+        t (float): current time
+
+    Returns:
+        dtype_u and dtype_f: new values and RHS at the node
+    """
+    if isinstance(prob, str):
+        assert _worker_problem[0] == prob, 'worker process has been started with a different problem'
+        P = _worker_problem[1]
+    else:
+        P = prob
+    u = P.solve_system(rhs, factor, u0, t)
+    return u, P.eval_f(u, t)
+
+
+class generic_implicit_pool(generic_implicit):
+    """
+    Generic implicit sweeper for diagonal QI, solving for all collocation nodes at once using a pool of workers
+
+    For diagonal preconditioners (e.g. IEpar, Qpar, PIC, MIN, MIN3) the implicit solves and the RHS evaluations at the
+    nodes are independent of each other. Here, they are dispatched to a thread pool (default) or to a process pool on
+    a single node, as a shared-memory alternative to generic_implicit_MPI. Threads pay off whenever solve_system and
+    eval_f spend most of their time in code releasing the GIL (e.g. sparse direct solves or FFTs) and require a
+    thread-safe problem class. Worker processes work on their own copy of the problem, so e.g. counters in the problem
+    are not updated on the main process. The copy is sent to each worker once when the pool starts, and only a token
+    identifying the problem is sent along with the tasks. Thread pools are shared by all sweepers with the same number
+    of workers, process pools by all sweepers which also have the same problem. If the problem of the level is
+    replaced, the sweeper switches to a new pool. Call reset_worker_problem after changing the problem in place.
+    Scratch buffers via use_workspace are not supported, since the nodes are updated by the workers.
+
+    Attributes:
+        QI: diagonal matrix
+        pool: the executor used for the node-parallel tasks
+    """
+
+    def __init__(self, params):
+        """
+        Initialization routine for the custom sweeper
+
+        Args:
+            params: parameters for the sweeper
+        """
+
+        if 'QI' not in params:
+            params['QI'] = 'IEpar'
+        if 'pool_type' not in params:
+            params['pool_type'] = 'threads'
+        if 'num_workers' not in params:
+            params['num_workers'] = params.get('num_nodes')
+
+        if params['pool_type'] not in ['threads', 'processes']:
+            raise ParameterError(f'pool_type {params["pool_type"]} not implemented, choose threads or processes')
+
+        # call parent's initialization routine
+        super(generic_implicit_pool, self).__init__(params)
+
+        if self.params.use_workspace:
+            raise ParameterError('use_workspace is not supported for node-parallel sweeps')
+
+        if not np.array_equal(self.QI, np.diag(np.diag(self.QI))):
+            raise ParameterError(f'need a diagonal QI for node-parallel sweeps, got {self.params.QI}')
+
+        # the pool is created at first use, since it cannot be copied along with the sweeper
+        self.__pool = None
+        self.__pool_key = None
+        self.__problem = None
+
+    @property
+    def pool(self):
+        """
+        Getter for the pool of workers
+
+        Returns:
+            concurrent.futures.Executor: the pool
+        """
+        if self.params.pool_type == 'processes' and self.__problem is not self.level.prob:
+            self.reset_worker_problem()
+        if self.__pool is None:
+            if self.params.pool_type == 'threads':
+                if self.params.num_workers not in _thread_pools:
+                    _thread_pools[self.params.num_workers] = ThreadPoolExecutor(max_workers=self.params.num_workers)
+                self.__pool = _thread_pools[self.params.num_workers]
+            else:
+                data = pickle.dumps(self.level.prob)
+                self.__pool_key = (self.params.num_workers, hashlib.sha256(data).hexdigest())
+                if self.__pool_key not in _process_pools:
+                    _process_pools[self.__pool_key] = ProcessPoolExecutor(max_workers=self.params.num_workers,
+                                                                          initializer=_init_worker,
+                                                                          initargs=(self.__pool_key[1], data))
+                    _process_pool_users[self.__pool_key] = 0
+                _process_pool_users[self.__pool_key] += 1
+                self.__pool = _process_pools[self.__pool_key]
+                self.__problem = self.level.prob
+        return self.__pool
+
+    @property
+    def worker_problem(self):
+        """
+        Getter for the problem as it is passed to the tasks
+
+        Returns:
+            the problem, or its token for worker processes
+        """
+        if self.params.pool_type == 'threads':
+            return self.level.prob
+        # make sure the current problem has been sent to the workers
+        self.pool
+        return self.__pool_key[1]
+
+    def reset_worker_problem(self):
+        """
+        Send the problem to new worker processes at the next sweep, e.g. after the problem has been changed in place
+
+        Returns:
+            None
+        """
+        if self.__pool_key is not None:
+            _process_pool_users[self.__pool_key] -= 1
+            if _process_pool_users[self.__pool_key] == 0:
+                _process_pools.pop(self.__pool_key).shutdown(wait=False)
+                del _process_pool_users[self.__pool_key]
+        self.__pool = None
+        self.__pool_key = None
+        self.__problem = None
+
+    def update_nodes(self):
+        """
+        Update the u- and f-values at the collocation nodes -> corresponds to a single sweep over all nodes
+
+        Returns:
+            None
+        """
+
+        # get current level
+        L = self.level
+
+        # only if the level has been touched before
+        assert L.status.unlocked
+
+        # get number of collocation nodes for easier access
+        M = self.coll.num_nodes
+
+        # gather all terms which are known already (e.g. from the previous iteration)
+        # this corresponds to u0 + QF(u^k) - QdF(u^k) + tau, with diagonal Qd this is the full rhs
+
+        # get QF(u^k)
+        integral = self.integrate()
+        for m in range(M):
+
+            # get -QdF(u^k)_m
+            integral[m] -= L.dt * self.QI[m + 1, m + 1] * L.f[m + 1]
+
+            # add initial value
+            integral[m] += L.u[0]
+            # add tau if associated
+            if L.tau[m] is not None:
+                integral[m] += L.tau[m]
+
+        # do the sweep: implicit solves with prefactor stemming from the diagonal of Qd and RHS evaluations in parallel
+        pool = self.pool
+        tasks = [pool.submit(_solve_and_eval, self.worker_problem, integral[m], L.dt * self.QI[m + 1, m + 1],
+                             L.u[m + 1], L.time + L.dt * self.coll.nodes[m]) for m in range(M)]
+        for m in range(M):
+            L.u[m + 1], L.f[m + 1] = tasks[m].result()
+
+        # indicate presence of new values at this level
+        L.status.updated = True
+
+        return None
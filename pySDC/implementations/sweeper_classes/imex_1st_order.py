@@ -12,8 +12,13 @@ class imex_1st_order(sweeper):
     Attributes:
         QI: implicit Euler integration matrix
         QE: explicit Euler integration matrix
+
+    If the sweeper parameter use_workspace is set, the sweep works on scratch buffers which are allocated once per
+    level and updated in place, instead of creating new temporaries for each node and each term.
     """
 
+    shared_operators = ['QI', 'QE']
+
     def __init__(self, params):
         """
         Initialization routine for the custom sweeper
@@ -26,6 +31,8 @@ class imex_1st_order(sweeper):
             params['QI'] = 'IE'
         if 'QE' not in params:
             params['QE'] = 'EE'
+        if 'use_workspace' not in params:
+            params['use_workspace'] = False
 
         # call parent's initialization routine
         super(imex_1st_order, self).__init__(params)
@@ -34,6 +41,25 @@ class imex_1st_order(sweeper):
         self.QI = self.get_Qdelta_implicit(coll=self.coll, qd_type=self.params.QI)
         self.QE = self.get_Qdelta_explicit(coll=self.coll, qd_type=self.params.QE)
 
+        # for diagonal QI and vanishing QE (e.g. Picard iterations) the nodes can be updated all at once
+        self.independent_nodes = not np.any(np.tril(self.QI[1:, 1:], k=-1)) and not np.any(self.QE[1:, 1:])
+
+        # scratch buffers for the sweep, will be allocated at first use
+        self.__workspace = None
+
+    @property
+    def workspace(self):
+        """
+        Getter for the scratch buffers of the sweep, allocated once per level
+
+        Returns:
+            list of dtype_u: one buffer per collocation node plus one for single terms
+        """
+        if self.__workspace is None:
+            P = self.level.prob
+            self.__workspace = [P.dtype_u(P.init, val=0.0) for _ in range(self.coll.num_nodes + 1)]
+        return self.__workspace
+
     def integrate(self):
         """
         Integrates the right-hand side (here impl + expl)
@@ -45,6 +71,10 @@ class imex_1st_order(sweeper):
         # get current level and problem description
         L = self.level
 
+        if L.params.stack_nodes:
+            # all nodes at once: contract the collocation matrix with the stacked RHS values
+            return L.f.contract(L.dt * self.coll.Qmat[1:, 1:], start=1)
+
         me = []
 
         # integrate RHS over all collocation nodes
@@ -71,6 +101,9 @@ class imex_1st_order(sweeper):
         # only if the level has been touched before
         assert L.status.unlocked
 
+        if self.params.use_workspace:
+            return self.__update_nodes_workspace()
+
         # get number of collocation nodes for easier access
         M = self.coll.num_nodes
 
@@ -90,18 +123,85 @@ class imex_1st_order(sweeper):
                 integral[m] += L.tau[m]
 
         # do the sweep
-        for m in range(0, M):
-            # build rhs, consisting of the known values from above and new values from previous nodes (at k+1)
-            rhs = P.dtype_u(integral[m])
-            for j in range(1, m + 1):
-                rhs += L.dt * (self.QI[m + 1, j] * L.f[j].impl + self.QE[m + 1, j] * L.f[j].expl)
-
-            # implicit solve with prefactor stemming from QI
-            L.u[m + 1] = P.solve_system(rhs, L.dt * self.QI[m + 1, m + 1], L.u[m + 1],
-                                        L.time + L.dt * self.coll.nodes[m])
-
-            # update function values
-            L.f[m + 1] = P.eval_f(L.u[m + 1], L.time + L.dt * self.coll.nodes[m])
+        if self.independent_nodes:
+            self.update_all_nodes(integral, [L.dt * self.QI[m + 1, m + 1] for m in range(M)])
+
+        else:
+            for m in range(0, M):
+                # build rhs, consisting of the known values from above and new values from previous nodes (at k+1)
+                rhs = P.dtype_u(integral[m])
+                for j in range(1, m + 1):
+                    rhs += L.dt * (self.QI[m + 1, j] * L.f[j].impl + self.QE[m + 1, j] * L.f[j].expl)
+
+                # implicit solve with prefactor stemming from QI
+                L.u[m + 1] = P.solve_system(rhs, L.dt * self.QI[m + 1, m + 1], L.u[m + 1],
+                                            L.time + L.dt * self.coll.nodes[m])
+
+                # update function values
+                L.f[m + 1] = P.eval_f(L.u[m + 1], L.time + L.dt * self.coll.nodes[m])
+
+        # indicate presence of new values at this level
+        L.status.updated = True
+
+        return None
+
+    def __update_nodes_workspace(self):
+        """
+        Allocation-free variant of update_nodes, using the preallocated workspace and in-place operations only
+
+        Returns:
+            None
+        """
+
+        # get current level and problem description
+        L = self.level
+        P = L.prob
+
+        # get number of collocation nodes for easier access
+        M = self.coll.num_nodes
+
+        # get the scratch buffers, integral[m] will become the rhs at node m
+        integral = self.workspace[:M]
+        tmp = self.workspace[M]
+
+        # gather all terms which are known already (e.g. from the previous iteration)
+        # this corresponds to u0 + (Q - QI)FI(u^k) + (Q - QE)FE(u^k) + tau
+        QmQI = L.dt * (self.coll.Qmat - self.QI)
+        QmQE = L.dt * (self.coll.Qmat - self.QE)
+        for m in range(M):
+            integral[m][:] = L.u[0]
+            for j in range(1, M + 1):
+                np.multiply(L.f[j].impl, QmQI[m + 1, j], out=tmp)
+                integral[m] += tmp
+                np.multiply(L.f[j].expl, QmQE[m + 1, j], out=tmp)
+                integral[m] += tmp
+            # add tau if associated
+            if L.tau[m] is not None:
+                integral[m] += L.tau[m]
+
+        # do the sweep
+        if self.independent_nodes:
+            self.update_all_nodes(integral, [L.dt * self.QI[m + 1, m + 1] for m in range(M)])
+
+        else:
+            for m in range(0, M):
+                # add new values from previous nodes (at k+1) to the rhs
+                rhs = integral[m]
+                for j in range(1, m + 1):
+                    np.multiply(L.f[j].impl, L.dt * self.QI[m + 1, j], out=tmp)
+                    rhs += tmp
+                    np.multiply(L.f[j].expl, L.dt * self.QE[m + 1, j], out=tmp)
+                    rhs += tmp
+
+                # implicit solve with prefactor stemming from QI
+                L.u[m + 1] = P.solve_system(rhs, L.dt * self.QI[m + 1, m + 1], L.u[m + 1],
+                                            L.time + L.dt * self.coll.nodes[m])
+                # never let the solution point to the workspace
+                if L.u[m + 1] is rhs:
+                    L.u[m + 1] = P.dtype_u(rhs)
+
+                # update function values
+                L.f[m + 1] = P.eval_f(L.u[m + 1], L.time + L.dt * self.coll.nodes[m])
 
         # indicate presence of new values at this level
         L.status.updated = True
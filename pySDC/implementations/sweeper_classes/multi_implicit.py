@@ -12,6 +12,8 @@ class multi_implicit(sweeper):
         Q2: implicit integration matrix for the second component
     """
 
+    shared_operators = ['Q1', 'Q2']
+
     def __init__(self, params):
         """
         Initialization routine for the custom sweeper
@@ -45,6 +47,10 @@ class multi_implicit(sweeper):
         L = self.level
         P = L.prob
 
+        if L.params.stack_nodes:
+            # all nodes at once: contract the collocation matrix with the stacked RHS values
+            return L.f.contract(L.dt * self.coll.Qmat[1:, 1:], start=1)
+
         me = []
 
         # integrate RHS over all collocation nodes
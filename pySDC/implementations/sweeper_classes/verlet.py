@@ -17,6 +17,8 @@ class verlet(sweeper):
         qQ: update rule for final value (if needed)
     """
 
+    shared_operators = ['QQ', 'QT', 'Qx', 'qQ']
+
     def __init__(self, params):
         """
         Initialization routine for the custom sweeper
@@ -20,6 +20,8 @@ class mesh_to_mesh(space_transfer):
         Pspace: spatial prolongation matrix, dim. Nc x Nf
     """
 
+    shared_operators = ['Rspace', 'Pspace']
+
     def __init__(self, fine_prob, coarse_prob, params):
         """
         Initialization routine
@@ -139,6 +141,60 @@ class mesh_to_mesh(space_transfer):
             for i in range(1, len(Rspace)):
                 self.Rspace = sp.kron(self.Rspace, Rspace[i], format='csc')
 
+    @staticmethod
+    def __apply_nodes(A, values, prob):
+        """
+        Helper routine to apply a spatial transfer matrix to the values at all nodes with a single sparse matrix-matrix
+        product
+
+        Args:
+            A: the transfer matrix
+            values (list of mesh): the values at the nodes
+            prob: the problem on the target level
+
+        Returns:
+            list of mesh: the transferred values
+        """
+        # components of the values (if any) are placed next to each other, like the nodes
+        stacked = np.concatenate([me.view(np.ndarray).reshape(A.shape[1], -1) for me in values], axis=1)
+        transferred = A.dot(stacked)
+
+        ncols = transferred.shape[1] // len(values)
+        result = []
+        for i in range(len(values)):
+            me = prob.dtype_u(prob.init)
+            me[:] = transferred[:, i * ncols: (i + 1) * ncols].reshape(me.shape)
+            result.append(me)
+        return result
+
+    def restrict_nodes(self, F):
+        """
+        Restriction of the values at multiple nodes, meshes are restricted at once
+
+        Args:
+            F (list): the fine level data at the nodes
+
+        Returns:
+            list: the coarse level data at the nodes
+        """
+        if len(F) > 0 and all(type(me) is mesh for me in F):
+            return self.__apply_nodes(self.Rspace, F, self.coarse_prob)
+        return super(mesh_to_mesh, self).restrict_nodes(F)
+
+    def prolong_nodes(self, G):
+        """
+        Prolongation of the values at multiple nodes, meshes are prolonged at once
+
+        Args:
+            G (list): the coarse level data at the nodes
+
+        Returns:
+            list: the fine level data at the nodes
+        """
+        if len(G) > 0 and all(type(me) is mesh for me in G):
+            return self.__apply_nodes(self.Pspace, G, self.fine_prob)
+        return super(mesh_to_mesh, self).prolong_nodes(G)
+
     def restrict(self, F):
         """
         Restriction implementation
@@ -81,3 +81,29 @@ class mesh_to_mesh_fft(space_transfer):
         else:
             raise TransferError('Unknown data type, got %s' % type(G))
         return F
+
+    def prolong_nodes(self, G):
+        """
+        Prolongation of the values at multiple nodes, meshes are prolonged with a single batched FFT
+
+        Args:
+            G (list): the coarse level data at the nodes
+
+        Returns:
+            list: the fine level data at the nodes
+        """
+        if len(G) == 0 or not all(type(me) is mesh for me in G):
+            return super(mesh_to_mesh_fft, self).prolong_nodes(G)
+
+        tmpG = np.fft.rfft(np.stack([me.view(np.ndarray) for me in G]), axis=-1)
+        tmpF = np.zeros((len(G), self.fine_prob.init[0] // 2 + 1), dtype=np.complex128)
+        halfG = int(self.coarse_prob.init[0] / 2)
+        tmpF[:, 0: halfG] = tmpG[:, 0: halfG]
+        tmpF[:, -1] = tmpG[:, -1]
+        tmpF = np.fft.irfft(tmpF, axis=-1) * self.ratio
+
+        F = []
+        for i in range(len(G)):
+            F.append(mesh(self.fine_prob.init, val=0.0))
+            F[-1][:] = tmpF[i]
+        return F
@@ -95,3 +95,32 @@ class mesh_to_mesh_fft2d(space_transfer):
         else:
             raise TransferError('Unknown data type, got %s' % type(G))
         return F
+
+    def prolong_nodes(self, G):
+        """
+        Prolongation of the values at multiple nodes, meshes are prolonged with a single batched FFT
+
+        Args:
+            G (list): the coarse level data at the nodes
+
+        Returns:
+            list: the fine level data at the nodes
+        """
+        if len(G) == 0 or not all(type(me) is mesh for me in G):
+            return super(mesh_to_mesh_fft2d, self).prolong_nodes(G)
+
+        tmpG = np.fft.fft2(np.stack([me.view(np.ndarray) for me in G]), axes=(-2, -1))
+        tmpF = np.zeros((len(G),) + tuple(self.fine_prob.init[0]), dtype=np.complex128)
+        halfG = int(self.coarse_prob.init[0][0] / 2)
+        nF = self.fine_prob.init[0][0]
+        tmpF[:, 0:halfG, 0:halfG] = tmpG[:, 0:halfG, 0:halfG]
+        tmpF[:, nF - halfG:, 0:halfG] = tmpG[:, halfG:, 0:halfG]
+        tmpF[:, 0:halfG, nF - halfG:] = tmpG[:, 0:halfG, halfG:]
+        tmpF[:, nF - halfG:, nF - halfG:] = tmpG[:, halfG:, halfG:]
+        tmpF = np.real(np.fft.ifft2(tmpF, axes=(-2, -1))) * self.ratio * 2
+
+        F = []
+        for i in range(len(G)):
+            F.append(mesh(self.fine_prob.init))
+            F[-1][:] = tmpF[i]
+        return F
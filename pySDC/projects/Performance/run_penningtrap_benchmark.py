@@ -0,0 +1,74 @@
+import time
+
+import numpy as np
+
+from pySDC.implementations.problem_classes.PenningTrap_3D import penningtrap
+
+
+def setup_problem(nparts, interactions='direct'):
+    """
+    Set up the Penning trap with the parameters of the tutorial
+
+    Args:
+        nparts (int): number of particles
+        interactions (str): method for the particle-particle interactions, 'direct' or 'barnes_hut'
+
+    Returns:
+        penningtrap: the problem
+    """
+    problem_params = dict()
+    problem_params['omega_E'] = 4.9
+    problem_params['omega_B'] = 25.0
+    problem_params['u0'] = np.array([[10, 0, 0], [100, 0, 100], [1], [1]], dtype=object)
+    problem_params['nparts'] = nparts
+    problem_params['sig'] = 0.1
+    problem_params['interactions'] = interactions
+
+    return penningtrap(problem_params)
+
+
+def measure(func, nrepeat):
+    """
+    Measure the wall clock time per call of a function, after one call to compile and warm up
+
+    Args:
+        func: the function, without arguments
+        nrepeat (int): number of calls to average over
+
+    Returns:
+        float: time per call
+    """
+    func()
+    t0 = time.perf_counter()
+    for _ in range(nrepeat):
+        func()
+    return (time.perf_counter() - t0) / nrepeat
+
+
+def main(nparts_list=(10, 100, 1000, 10000), nrepeat=3):
+    """
+    Measure how the particle kernels of the Penning trap scale with the number of particles, compared to the O(N^2)
+    particle-particle interaction, and the interactions with direct summation compared to the Barnes-Hut method
+    """
+    out = '%8s %16s %16s %12s %12s %14s' % ('nparts', 'interactions', 'barnes_hut', 'eval_f', 'build_f',
+                                             'boris_solver')
+    print(out)
+    for nparts in nparts_list:
+        P = setup_problem(nparts)
+        u = P.u_init()
+        f = P.eval_f(u, 0.0)
+        c = P.dtype_u(u).vel
+        P_tree = setup_problem(nparts, interactions='barnes_hut')
+
+        timings = [
+            measure(lambda: P.get_interactions(u), nrepeat),
+            measure(lambda: P_tree.get_interactions(u), nrepeat),
+            measure(lambda: P.eval_f(u, 0.0), nrepeat),
+            measure(lambda: P.build_f(f, u, 0.0), nrepeat),
+            measure(lambda: P.boris_solver(c, 0.01, f, f, u), nrepeat),
+        ]
+        print('%8i %14.4e s %14.4e s %10.4e s %10.4e s %12.4e s' % (nparts, *timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import time
+import tracemalloc
+
+import numpy as np
+
+from pySDC.implementations.collocation_classes.gauss_radau_right import CollGaussRadau_Right
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.datatype_classes.mesh import mesh
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD import heat1d
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD_forced import heat1d_forced
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+
+
+class allocation_counter(object):
+    """
+    Context manager counting the new meshes created, either by the constructor or as result of a numpy operation
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.__new = None
+        self.__ufunc = None
+
+    def __enter__(self):
+        self.__new = mesh.__new__
+        self.__ufunc = mesh.__array_ufunc__
+        counter = self
+
+        def new(cls, *args, **kwargs):
+            counter.count += 1
+            return counter.__new(cls, *args, **kwargs)
+
+        def ufunc(obj, ufunc, method, *inputs, out=None, **kwargs):
+            if out is None:
+                counter.count += 1
+            return counter.__ufunc(obj, ufunc, method, *inputs, out=out, **kwargs)
+
+        mesh.__new__ = new
+        mesh.__array_ufunc__ = ufunc
+        return self
+
+    def __exit__(self, *args):
+        mesh.__new__ = self.__new
+        mesh.__array_ufunc__ = self.__ufunc
+
+
+def setup_level(sweeper_class, use_workspace, nvars, num_nodes):
+    """
+    Set up a single level and run the predictor, so that sweeps can be done
+
+    Args:
+        sweeper_class: generic_implicit or imex_1st_order
+        use_workspace (bool): use the preallocated workspace in the sweeper
+        nvars: number of degrees of freedom
+        num_nodes (int): number of collocation nodes
+
+    Returns:
+        pySDC.Level.level: the level ready for sweeping
+    """
+    level_params = dict()
+    level_params['dt'] = 0.01
+
+    sweeper_params = dict()
+    sweeper_params['collocation_class'] = CollGaussRadau_Right
+    sweeper_params['num_nodes'] = num_nodes
+    sweeper_params['use_workspace'] = use_workspace
+
+    problem_params = dict()
+    problem_params['nu'] = 0.1
+    problem_params['freq'] = 2
+    problem_params['nvars'] = nvars
+
+    description = dict()
+    description['problem_class'] = heat1d_forced if sweeper_class is imex_1st_order else heat1d
+    description['problem_params'] = problem_params
+    description['sweeper_class'] = sweeper_class
+    description['sweeper_params'] = sweeper_params
+    description['level_params'] = level_params
+    description['step_params'] = {'maxiter': 1}
+
+    controller = controller_nonMPI(num_procs=1, controller_params={'logger_level': 30}, description=description)
+
+    S = controller.MS[0]
+    L = S.levels[0]
+    L.status.time = 0.0
+    S.init_step(L.prob.u_exact(0.0))
+    L.sweep.predict()
+    return L
+
+
+def measure(L, nsweeps):
+    """
+    Measure allocations, peak memory and time per sweep
+
+    Args:
+        L (pySDC.Level.level): the level to sweep on
+        nsweeps (int): number of sweeps to average over
+
+    Returns:
+        tuple: new meshes, peak memory increase (bytes) and wall clock time per sweep
+    """
+    # first sweep allocates the workspace (if any), do not count this
+    L.sweep.update_nodes()
+
+    with allocation_counter() as counter:
+        for _ in range(nsweeps):
+            L.sweep.update_nodes()
+    allocs = counter.count / nsweeps
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    peak = 0
+    for _ in range(nsweeps):
+        tracemalloc.reset_peak()
+        L.sweep.update_nodes()
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    for _ in range(nsweeps):
+        L.sweep.update_nodes()
+    t1 = time.perf_counter()
+
+    return allocs, peak, (t1 - t0) / nsweeps
+
+
+def main(nvars=2 ** 16 - 1, num_nodes=5, nsweeps=10):
+    """
+    Compare the allocations per sweep with and without the preallocated workspace in the sweepers
+    """
+    out = '%16s %10s %16s %20s %14s' % ('sweeper', 'workspace', 'meshes / sweep', 'peak MB / sweep', 'time / sweep')
+    print(out)
+    for sweeper_class in [generic_implicit, imex_1st_order]:
+        for use_workspace in [False, True]:
+            L = setup_level(sweeper_class, use_workspace, nvars, num_nodes)
+            allocs, peak, timing = measure(L, nsweeps)
+            print('%16s %10s %16.1f %20.2f %12.4f s' % (sweeper_class.__name__, use_workspace, allocs,
+                                                       peak / 2 ** 20, timing))
+
+    size = np.dtype(float).itemsize * nvars / 2 ** 20
+    print('(one mesh has %.2f MB, counting includes allocations in eval_f and solve_system)' % size)
+
+
+if __name__ == "__main__":
+    main()
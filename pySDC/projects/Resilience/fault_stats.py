@@ -1,8 +1,9 @@
 import numpy as np
-import pickle
 import matplotlib.pyplot as plt
 from matplotlib.colors import TABLEAU_COLORS
 from mpi4py import MPI
+from multiprocessing import Pool
+from functools import partial
 import sys
 
 import pySDC.helpers.plot_helper as plot_helper
@@ -11,6 +12,7 @@ from pySDC.helpers.stats_helper import get_sorted
 from fault_injection import FaultInjector
 from pySDC.implementations.convergence_controller_classes.hotrod import HotRod
 from pySDC.implementations.convergence_controller_classes.adaptivity import Adaptivity
+from pySDC.projects.Resilience.run_store import RunStore
 
 # these problems are available for testing
 from pySDC.projects.Resilience.advection import run_advection
@@ -352,6 +354,13 @@ class FaultStats:
         self.recovery_thresh = recovery_thresh
         self.num_procs = num_procs
         self.mode = mode
+        self.stores = {}
+
+    def __getstate__(self):
+        '''
+        The loaded stats are not needed when runs are performed by other processes, so they are not copied
+        '''
+        return {**self.__dict__, 'stores': {}}
 
     def get_Tend(self):
         '''
@@ -394,126 +403,153 @@ class FaultStats:
             }
         return custom_params
 
-    def run_stats_generation(self, runs=1000, step=None):
+    def run_stats_generation(self, runs=1000, step=None, comm=None, num_workers=None):
         '''
         Run the generation of stats for all strategies in the `self.strategies` variable
 
         Args:
             runs (int): Number of runs you want to do
             step (int): Number of runs you want to do between saving
+            comm (mpi4py.MPI.Intracomm): Communicator to distribute the runs over, MPI.COMM_WORLD if None
+            num_workers (int): Number of processes per rank to distribute the runs over, None to run them in-process
 
         Returns:
             None
         '''
         step = runs if step is None else step
-        reload = False
-
         max_runs = self.get_max_combinations() if self.mode == 'combination' else runs
 
-        for i in range(step, max_runs + step, step):
-            for j in range(len(self.strategies)):
-
-                if j % MPI.COMM_WORLD.size != MPI.COMM_WORLD.rank:
-                    continue
-
-                for f in self.faults:
-                    if f:
-                        runs_partial = min(i, max_runs)
-                    else:
-                        runs_partial = min([5, i])
-                    self.generate_stats(strategy=self.strategies[j], runs=runs_partial, faults=f,
-                                        reload=self.reload or reload)
-                self.get_recovered(self.strategies[j])
-            reload = True
+        for strategy in self.strategies:
+            for f in self.faults:
+                runs_partial = max_runs if f else min([5, max_runs])
+                self.generate_stats(strategy=strategy, runs=runs_partial, faults=f, reload=self.reload, step=step,
+                                    comm=comm, num_workers=num_workers)
 
         return None
 
-    def generate_stats(self, strategy=None, runs=1000, reload=True, faults=True):
+    def generate_stats(self, strategy=None, runs=1000, reload=True, faults=True, step=None, comm=None,
+                       num_workers=None):
         '''
         Generate statistics for recovery from bit flips
         -----------------------------------------------
 
-        Every run is given a different random seed such that we have different faults and the results are then stored
+        Every run is given a different random seed such that we have different faults and the results are then stored.
+        Since the seed is fixed by the index of the run, the runs can be distributed over the ranks of the communicator
+        and over a pool of processes on each rank. Each process stores its results every `step` runs, such that an
+        interrupted generation continues with the missing runs when called again.
 
         Args:
             strategy (Strategy): Resilience strategy
             runs (int): Number of runs you want to do
             reload (bool): Load previously computed statisitics and continue from there or start from scratch
             faults (bool): Whether to do stats with faults or without
+            step (int): Number of runs you want to do between saving, all at once if None
+            comm (mpi4py.MPI.Intracomm): Communicator to distribute the runs over, MPI.COMM_WORLD if None
+            num_workers (int): Number of processes per rank to distribute the runs over, None to run them in-process
 
         Returns:
             None
         '''
+        comm = MPI.COMM_WORLD if comm is None else comm
+        store = self.get_store(strategy, faults)
+
+        if not reload:
+            if comm.rank == 0:
+                store.clear()
+            comm.Barrier()
+
+        # distribute the runs which are not done yet, after everybody knows which ones these are
+        remaining = np.setdiff1d(np.arange(runs), store.get_completed_runs())
+        comm.Barrier()
+        local_runs = remaining[comm.rank::comm.size]
+
+        if len(local_runs) > 0:
+            print(f'Processor {comm.rank} doing {strategy.name}{" with faults" if faults else ""}: {len(local_runs)} \
+of the {len(remaining)} remaining runs up to {runs}')
+            sys.stdout.flush()
+
+        # perform the remaining experiments and store the results in chunks
+        step = max([len(local_runs), 1]) if step is None else step
+        run = partial(self.get_run_data, strategy, faults)
+        if num_workers is None:
+            self.store_runs(store, map(run, local_runs), step)
+        else:
+            with Pool(num_workers) as pool:
+                self.store_runs(store, pool.imap_unordered(run, local_runs), step)
 
-        # initialize dictionary to store the stats in
-        dat = {
-            'level': np.zeros(runs),
-            'iteration': np.zeros(runs),
-            'node': np.zeros(runs),
-            'problem_pos': [],
-            'bit': np.zeros(runs),
-            'error': np.zeros(runs),
-            'total_iteration': np.zeros(runs),
-            'restarts': np.zeros(runs),
-            'target': np.zeros(runs),
-        }
+        return None
 
-        # reload previously recorded stats and write them to dat
-        if reload:
-            already_completed = self.load(strategy, faults)
-            if already_completed['runs'] > 0 and already_completed['runs'] <= runs:
-                for k in dat.keys():
-                    dat[k][:min([already_completed['runs'], runs])] = already_completed.get(k, [])
-        else:
-            already_completed = {'runs': 0}
+    def get_run_data(self, strategy, faults, run):
+        '''
+        Perform a single experiment and extract the data that we store for the statistics
 
-        if already_completed['runs'] < runs:
-            if faults:
-                print(f'Processor {MPI.COMM_WORLD.rank} doing {strategy.name} with faults from \
-{already_completed["runs"]} to {runs}')
-                sys.stdout.flush()
-            else:
-                print(f'Processor {MPI.COMM_WORLD.rank} doing {strategy.name} from {already_completed["runs"]} to \
-{runs}')
-                sys.stdout.flush()
+        Args:
+            strategy (Strategy): Resilience strategy
+            faults (bool): Whether to put faults in or not
+            run (int): Index of the run, which determines the random seed
+
+        Returns:
+            dict: The data of the run
+        '''
 
-        # perform the remaining experiments
-        for i in range(already_completed['runs'], runs):
+        # perform a single experiment with the correct random seed
+        stats, controller, Tend = self.single_run(strategy=strategy, run=run, faults=faults)
 
-            # perform a single experiment with the correct random seed
-            stats, controller, Tend = self.single_run(strategy=strategy, run=i, faults=faults)
+        # get the data from the stats
+        faults_run = get_sorted(stats, type='bitflip')
+        t, u = get_sorted(stats, type='u', recomputed=False)[-1]
 
-            # get the data from the stats
-            faults_run = get_sorted(stats, type='bitflip')
-            t, u = get_sorted(stats, type='u', recomputed=False)[-1]
+        # check if we ran to the end
+        if t < Tend:
+            error = np.inf
+        else:
+            error = abs(u - controller.MS[0].levels[0].prob.u_exact(t=t))
 
-            # check if we ran to the end
-            if t < Tend:
-                error = np.inf
-            else:
-                error = abs(u - controller.MS[0].levels[0].prob.u_exact(t=t))
-            total_iteration = sum([k[1] for k in get_sorted(stats, type='k')])
-
-            # record the new data point
-            if faults:
-                assert len(faults_run) > 0, f'No faults where recorded in run {i} of strategy {strategy.name}!'
-                dat['level'][i] = faults_run[0][1][0]
-                dat['iteration'][i] = faults_run[0][1][1]
-                dat['node'][i] = faults_run[0][1][2]
-                dat['problem_pos'] += [faults_run[0][1][3]]
-                dat['bit'][i] = faults_run[0][1][4]
-                dat['target'][i] = faults_run[0][1][5]
-            dat['error'][i] = error
-            dat['total_iteration'][i] = total_iteration
-            dat['restarts'][i] = sum([me[1] for me in get_sorted(stats, type='restarts')])
-
-        # store the completed stats
-        dat['runs'] = runs
-        if already_completed['runs'] < runs:
-            self.store(strategy, faults, dat)
+        dat = {
+            'run': run,
+            'level': 0,
+            'iteration': 0,
+            'node': 0,
+            'problem_pos': np.zeros(len(controller.hooks.rnd_params['problem_pos']), dtype=int),
+            'bit': 0,
+            'target': 0,
+            'error': error,
+            'total_iteration': sum([k[1] for k in get_sorted(stats, type='k')]),
+            'restarts': sum([me[1] for me in get_sorted(stats, type='restarts')]),
+        }
 
+        # record the fault
         if faults:
-            self.get_recovered(strategy)
+            assert len(faults_run) > 0, f'No faults where recorded in run {run} of strategy {strategy.name}!'
+            dat['level'] = faults_run[0][1][0]
+            dat['iteration'] = faults_run[0][1][1]
+            dat['node'] = faults_run[0][1][2]
+            dat['problem_pos'][:] = faults_run[0][1][3]
+            dat['bit'] = faults_run[0][1][4]
+            dat['target'] = faults_run[0][1][5]
+
+        return dat
+
+    def store_runs(self, store, results, step):
+        '''
+        Store the data of runs in chunks as soon as they are available
+
+        Args:
+            store (RunStore): The store to append to
+            results (iterable): The data of the runs, as returned by `get_run_data`
+            step (int): Number of runs per chunk
+
+        Returns:
+            None
+        '''
+        chunk = []
+        for dat in results:
+            chunk += [dat]
+            if len(chunk) >= step:
+                store.append({k: np.array([me[k] for me in chunk]) for k in dat.keys()})
+                chunk = []
+        if len(chunk) > 0:
+            store.append({k: np.array([me[k] for me in chunk]) for k in chunk[0].keys()})
 
         return None
 
@@ -738,7 +774,23 @@ class FaultStats:
         Returns:
             str: The path to what you are looking for
         '''
-        return f'data/stats/{self.get_name(strategy, faults)}.pickle'
+        return f'data/stats/{self.get_name(strategy, faults)}'
+
+    def get_store(self, strategy, faults):
+        '''
+        Get the store for the stats belonging to a specific strategy and whether or not faults where inserted
+
+        Args:
+            strategy (Strategy): Resilience strategy
+            faults (bool): Whether or not faults where inserted
+
+        Returns:
+            RunStore: The store
+        '''
+        path = self.get_path(strategy, faults)
+        if path not in self.stores:
+            self.stores[path] = RunStore(path)
+        return self.stores[path]
 
     def get_name(self, strategy=None, faults=False):
         '''
@@ -772,27 +824,12 @@ class FaultStats:
 
         return f'{prob_name}{strategy_name}{fault_name}-{self.num_procs}procs'
 
-    def store(self, strategy, faults, dat):
-        '''
-        Stores the data for a run at a predefined path
-
-        Args:
-            strategy (Strategy): Resilience strategy
-            faults (bool): Whether or not faults where inserted
-            dat (dict): The data of the recorded statistics
-
-        Returns:
-            None
-        '''
-        with open(self.get_path(strategy, faults), 'wb') as f:
-            pickle.dump(dat, f)
-        return None
-
     def load(self, strategy=None, faults=True):
         '''
         Loads the stats belonging to a specific strategy and whether or not faults where inserted.
         When no data has been generated yet, a dictionary is returned which only contains the number of completed runs,
-        which is 0 of course.
+        which is 0 of course. For runs with faults, whether they recovered is added as 'recovered', if the fault-free
+        stats are available.
 
         Args:
             strategy (Strategy): Resilience strategy
@@ -804,35 +841,29 @@ class FaultStats:
         if strategy is None:
             strategy = self.strategies[MPI.COMM_WORLD.rank % len(self.strategies)]
 
-        try:
-            with open(self.get_path(strategy, faults), 'rb') as f:
-                dat = pickle.load(f)
-        except FileNotFoundError:
-            return {'runs': 0}
+        dat = self.get_store(strategy, faults).load()
+
+        if faults and dat['runs'] > 0:
+            fault_free = self.get_store(strategy, False).load()
+            if fault_free['runs'] > 0:
+                dat['recovered'] = self.get_recovered(dat, fault_free)
+
         return dat
 
-    def get_recovered(self, strategy=None):
+    def get_recovered(self, with_faults, fault_free):
         '''
-        Determine the recovery rate for a specific strategy and store it to disk.
+        Determine which runs with faults recovered, i.e. have an error close to the error of the fault-free runs
 
         Args:
-            strategy (Strategy): The resilience strategy you want to get the recovery rate for. If left at None, it will
-                                 be computed for all available strategies
+            with_faults (dict): The data of the recorded statistics with faults
+            fault_free (dict): The data of the corresponding fault-free stats
 
         Returns:
-            None
+            Numpy.ndarray: Boolean entries whether the runs recovered
         '''
-        if strategy is None:
-            [self.get_recovered(strat) for strat in self.strategies]
-        fault_free = self.load(strategy, False)
-        with_faults = self.load(strategy, True)
-
         assert fault_free['error'].std() / fault_free['error'].mean() < 1e-5
 
-        with_faults['recovered'] = with_faults['error'] < self.recovery_thresh * fault_free['error'].mean()
-        self.store(strategy, True, with_faults)
-
-        return None
+        return with_faults['error'] < self.recovery_thresh * fault_free['error'].mean()
 
     def crash_rate(self, dat, no_faults, thingA, mask):
         '''
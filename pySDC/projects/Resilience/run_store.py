@@ -0,0 +1,102 @@
+import glob
+import os
+import uuid
+
+import numpy as np
+
+
+class RunStore:
+    '''
+    Columnar storage for the results of many independent runs, which can be appended to incrementally.
+
+    Each call to `append` writes a chunk with one array per column (and one entry per run) into a new file of the
+    directory, so that several processes can append at the same time and an interrupted campaign only loses the runs
+    which have not been appended yet. Loading concatenates all chunks and orders them by the index of the run, which is
+    stored in the column 'run'.
+    '''
+
+    def __init__(self, path):
+        '''
+        Initialization routine
+
+        Args:
+            path (str): Directory in which the chunks are stored
+        '''
+        self.path = path
+        self.__cache = (None, None)
+
+    def get_chunks(self):
+        '''
+        Get the files of all chunks that have been written so far
+
+        Returns:
+            list: Paths to the chunks
+        '''
+        return sorted(glob.glob(f'{self.path}/*.npz'))
+
+    def append(self, dat):
+        '''
+        Append the data of some runs as a new chunk
+
+        Args:
+            dat (dict): Arrays with one entry per run for each column, including the index of the run in 'run'
+
+        Returns:
+            None
+        '''
+        if len(dat['run']) == 0:
+            return None
+
+        os.makedirs(self.path, exist_ok=True)
+
+        # write to a temporary file first, such that no incomplete chunks are left if we are interrupted
+        name = f'{self.path}/{min(dat["run"]):06d}-{max(dat["run"]):06d}-{uuid.uuid4().hex[:8]}'
+        with open(f'{name}.tmp', 'wb') as f:
+            np.savez(f, **{k: np.asarray(v) for k, v in dat.items()})
+        os.replace(f'{name}.tmp', f'{name}.npz')
+
+        return None
+
+    def load(self):
+        '''
+        Load the data of all runs, ordered by the index of the run. Runs which have been stored more than once only
+        appear once.
+
+        Returns:
+            dict: Arrays with one entry per run for each column and the number of runs in 'runs'
+        '''
+        chunks = self.get_chunks()
+
+        # the chunks are never changed once written, so we only need to load again if there are new ones
+        if self.__cache[0] != chunks:
+            data = [dict(np.load(chunk)) for chunk in chunks]
+            dat = {k: np.concatenate([me[k] for me in data]) for k in data[0].keys()} if len(data) > 0 else {}
+
+            if len(dat) > 0:
+                _, index = np.unique(dat['run'], return_index=True)
+                dat = {k: v[index] for k, v in dat.items()}
+
+            self.__cache = (chunks, dat)
+
+        return {**self.__cache[1], 'runs': len(self.__cache[1].get('run', []))}
+
+    def get_completed_runs(self):
+        '''
+        Get the indices of all runs that have been stored
+
+        Returns:
+            Numpy.ndarray: Indices of the completed runs
+        '''
+        return self.load().get('run', np.zeros(0, dtype=int))
+
+    def clear(self):
+        '''
+        Remove all stored chunks
+
+        Returns:
+            None
+        '''
+        for chunk in self.get_chunks():
+            os.remove(chunk)
+        self.__cache = (None, None)
+        return None
@@ -0,0 +1,70 @@
+import pytest
+import numpy as np
+
+import pySDC.core.Sweeper as sweeper_module
+from pySDC.implementations.collocation_classes.gauss_radau_right import CollGaussRadau_Right
+from pySDC.implementations.collocation_classes.gauss_lobatto import CollGaussLobatto
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+
+
+@pytest.fixture
+def count_optimizations(monkeypatch):
+    """
+    Start with an empty cache and count the calls of the optimizer
+    """
+    monkeypatch.setattr(sweeper_module, '_Qdelta_implicit_cache', {})
+
+    calls = []
+    minimize = sweeper_module.opt.minimize
+
+    def counting_minimize(*args, **kwargs):
+        calls.append(args)
+        return minimize(*args, **kwargs)
+
+    monkeypatch.setattr(sweeper_module.opt, 'minimize', counting_minimize)
+    return calls
+
+
+def get_sweeper(collocation_class=CollGaussRadau_Right, num_nodes=3, QI='MIN', cache_dir=None):
+    params = {'collocation_class': collocation_class, 'num_nodes': num_nodes, 'QI': QI, 'Qdelta_cache_dir': cache_dir}
+    return generic_implicit(params)
+
+
+def test_Qdelta_cache_in_process(count_optimizations):
+    """
+    Check that the optimization is done once per collocation
+    """
+    sweepers = [get_sweeper() for _ in range(4)]
+    assert len(count_optimizations) == 1, f'ERROR: ran the optimizer {len(count_optimizations)} times instead of once'
+    assert all(np.array_equal(sweepers[0].QI, me.QI) for me in sweepers)
+    assert all(me.parallelizable for me in sweepers)
+
+    # the preconditioners must not be the same object, in case someone modifies them
+    assert sweepers[0].QI is not sweepers[1].QI
+
+    get_sweeper(collocation_class=CollGaussLobatto)
+    get_sweeper(num_nodes=4)
+    assert len(count_optimizations) == 3, 'ERROR: different collocations need new optimizations'
+
+    sweeper = get_sweeper(QI='LU')
+    assert not sweeper.parallelizable, 'ERROR: cached preconditioners change whether the sweeper is parallelizable'
+
+
+def test_Qdelta_cache_on_disk(count_optimizations, tmp_path, monkeypatch):
+    """
+    Check that optimized preconditioners are read from the cache directory in a new process
+    """
+    QI = get_sweeper(cache_dir=str(tmp_path)).QI
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # forget everything computed in this process
+    monkeypatch.setattr(sweeper_module, '_Qdelta_implicit_cache', {})
+    sweeper = get_sweeper(cache_dir=str(tmp_path))
+
+    assert len(count_optimizations) == 1, 'ERROR: the cached preconditioner has not been read from disk'
+    assert np.array_equal(QI, sweeper.QI)
+    assert sweeper.parallelizable
+
+    # preconditioners which are cheap to compute are not stored on disk
+    get_sweeper(QI='LU', cache_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
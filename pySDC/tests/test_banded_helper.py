@@ -0,0 +1,74 @@
+import pytest
+import numpy as np
+import scipy.sparse as sp
+
+from pySDC.helpers.banded_helper import BandedSolver, factorize, get_bandwidth
+from pySDC.implementations.problem_classes.AdvectionEquation_1D_FD import advection1d
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD import heat1d
+
+
+def get_matrix(stencil, periodic, N=64, dtype=float):
+    """
+    Assemble I - 0.1 * A for a stencil centered at the diagonal, with or without periodic corners
+    """
+    steps = np.arange(len(stencil)) - (len(stencil) - 1) // 2
+    A = sp.diags(stencil, steps, shape=(N, N), format='lil', dtype=dtype)
+    if periodic:
+        for coeff, step in zip(stencil, steps):
+            for i in range(N):
+                if not 0 <= i + step < N:
+                    A[i, (i + step) % N] = coeff
+    return sp.csc_matrix(sp.eye(N, dtype=dtype) - 0.1 * A)
+
+
+@pytest.mark.parametrize("periodic", [False, True])
+@pytest.mark.parametrize("stencil", [[1.0, -2.0, 1.0], [-1.0, 1.0], [-1.0, 16.0, -30.0, 16.0, -1.0],
+                                     [1.0, -6.0, 3.0, 2.0]])
+def test_banded_solver(stencil, periodic):
+    """
+    Check the banded solver for one and several right-hand sides against the sparse matrix
+    """
+    rng = np.random.default_rng(0)
+    for dtype in [float, complex]:
+        M = get_matrix(stencil, periodic, dtype=dtype)
+        solver = factorize(M)
+        assert isinstance(solver, BandedSolver) and solver.periodic == periodic
+        assert sum(get_bandwidth(M, periodic=True)) == len(stencil) - 1
+
+        b = rng.random(M.shape[0]) + 1j * rng.random(M.shape[0])
+        B = rng.random((M.shape[0], 3))
+        assert np.allclose(M @ solver.solve(b), b, rtol=0, atol=1e-12)
+        assert np.allclose(M @ solver.solve(B), B, rtol=0, atol=1e-12)
+
+
+def test_fallback():
+    """
+    Check that matrices with wide bands are factorized by SuperLU
+    """
+    A = sp.kronsum(sp.diags([1, -2, 1], [-1, 0, 1], shape=(16, 16)), sp.diags([1, -2, 1], [-1, 0, 1], shape=(16, 16)))
+    M = sp.csc_matrix(sp.eye(256) - 0.1 * A)
+    solver = factorize(M)
+    assert not isinstance(solver, BandedSolver)
+
+    b = np.random.default_rng(0).random(256)
+    assert np.allclose(M @ solver.solve(b), b, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("problem_class", [heat1d, advection1d])
+def test_solve_system_batch(problem_class):
+    """
+    Check that the batched solve gives the same results as the single ones, reusing the factorizations
+    """
+    if problem_class is heat1d:
+        P = problem_class({'nvars': 63, 'nu': 0.1, 'freq': 2})
+    else:
+        P = problem_class({'nvars': 64, 'c': 1.0, 'freq': 2, 'order': 2, 'type': 'upwind'})
+
+    factors = [0.1, 0.2, 0.1, 0.3]
+    rhs = [P.u_exact(0.0) * (i + 1) for i in range(len(factors))]
+    sol = P.solve_system_batch(rhs, factors, rhs, [0.0] * len(factors))
+
+    for me, b, factor in zip(sol, rhs, factors):
+        assert type(me) is type(b)
+        assert np.allclose(me, P.solve_system(b, factor, b, 0.0), rtol=0, atol=1e-14)
+    assert P.factorization_cache.misses == 3
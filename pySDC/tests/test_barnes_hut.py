@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+
+from pySDC.core.Errors import ParameterError
+from pySDC.implementations.problem_classes.PenningTrap_3D import penningtrap
+
+
+def get_problem(nparts, **kwargs):
+    problem_params = {'omega_E': 4.9, 'omega_B': 25.0, 'nparts': nparts, 'sig': 0.1,
+                      'u0': np.array([[10, 0, 0], [100, 0, 100], [1], [1]], dtype=object)}
+    problem_params.update(kwargs)
+    return penningtrap(problem_params)
+
+
+@pytest.mark.parametrize("leaf_size", [1, 8])
+@pytest.mark.parametrize("theta", [0.0, 0.3, 0.5])
+def test_barnes_hut(theta, leaf_size):
+    """
+    Check the field of the Barnes-Hut method against direct summation, which it has to reproduce for theta = 0
+    """
+    P_direct = get_problem(500)
+    P_tree = get_problem(500, interactions='barnes_hut', theta=theta, leaf_size=leaf_size)
+    u = P_direct.u_init()
+
+    E_direct = P_direct.get_interactions(u)
+    E_tree = P_tree.get_interactions(u)
+    assert E_tree.shape == E_direct.shape
+
+    err = np.max(np.abs(E_tree - E_direct)) / np.max(np.abs(E_direct))
+    assert err < (1E-12 if theta == 0 else theta * 2E-2), f'ERROR: Barnes-Hut deviates too much, got {err:.2e}'
+
+    # the rest of the right-hand side does not depend on the method
+    assert np.allclose(P_tree.eval_f(u, 0.0).magn, P_direct.eval_f(u, 0.0).magn)
+
+
+def test_unknown_interactions():
+    with pytest.raises(ParameterError):
+        get_problem(10, interactions='fmm')
+
+
+@pytest.mark.parametrize("theta", [0.8, 0.9, 1.0])
+def test_barnes_hut_self_interaction(theta):
+    """
+    Check that cells containing a particle are opened for large theta, even if their center of charge is far enough
+    away from it, so that the particle does not interact with itself
+    """
+    from pySDC.helpers.barnes_hut_helper import barnes_hut_interactions
+
+    # the center of charge of the root cell is closer to the second particle, so the first one sees it from afar
+    pos = np.array([[0.0, 1.0], [0.0, 1.0], [0.0, 1.0]])
+    q = np.array([1.0, 3.0])
+    sig = 0.1
+
+    dist = pos[:, :1] - pos[:, 1:]
+    E_direct = np.hstack([q[1] * dist, -q[0] * dist]) / (np.sum(dist ** 2) + sig ** 2) ** 1.5
+    E_tree = barnes_hut_interactions(pos, sig, q, theta, 1)
+    assert np.allclose(E_tree, E_direct, rtol=1E-12, atol=0), 'ERROR: a particle interacts with itself'
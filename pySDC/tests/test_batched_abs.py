@@ -0,0 +1,74 @@
+import pytest
+import numpy as np
+
+from pySDC.implementations.collocation_classes.gauss_radau_right import CollGaussRadau_Right
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.datatype_classes.mesh import mesh
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD import heat1d
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+
+
+@pytest.mark.parametrize("init", [10, (10, 10), (4, 5, 6)])
+@pytest.mark.parametrize("dtype", [np.dtype('float64'), np.dtype('complex128')])
+def test_mesh_batched_abs(init, dtype):
+    """
+    Check that the norms of many meshes at once agree with the norms of each mesh
+    """
+    np.random.seed(0)
+    values = []
+    for i in range(5):
+        me = mesh((init, None, dtype))
+        me[:] = np.random.randn(*me.shape) * 10 ** i
+        if dtype.kind == 'c':
+            me[:] += 1j * np.random.randn(*me.shape)
+        values.append(me)
+    values.append(mesh((init, None, dtype), val=0.0))
+
+    assert mesh.batched_abs(values) == [abs(me) for me in values]
+    assert mesh.batched_abs([]) == []
+
+
+@pytest.mark.parametrize("residual_type", ['full_abs', 'last_abs', 'full_rel', 'last_rel'])
+def test_residual_batched_abs(residual_type, monkeypatch):
+    """
+    Check that computing the residual with all norms at once gives the same result as with one norm per node
+    """
+    level_params = dict()
+    level_params['restol'] = 1E-10
+    level_params['dt'] = 0.1
+    level_params['residual_type'] = residual_type
+
+    sweeper_params = dict()
+    sweeper_params['collocation_class'] = CollGaussRadau_Right
+    sweeper_params['num_nodes'] = 3
+    sweeper_params['QI'] = 'LU'
+
+    problem_params = dict()
+    problem_params['nu'] = 0.1
+    problem_params['freq'] = 4
+    problem_params['nvars'] = 63
+
+    description = dict()
+    description['problem_class'] = heat1d
+    description['problem_params'] = problem_params
+    description['sweeper_class'] = generic_implicit
+    description['sweeper_params'] = sweeper_params
+    description['level_params'] = level_params
+    description['step_params'] = {'maxiter': 50}
+
+    controller = controller_nonMPI(num_procs=1, controller_params={'logger_level': 30}, description=description)
+    S = controller.MS[0]
+    L = S.levels[0]
+
+    S.init_step(L.prob.u_exact(0.0))
+    L.status.time = 0.0
+    L.sweep.predict()
+    L.sweep.update_nodes()
+
+    L.sweep.compute_residual()
+    residual = L.status.residual
+
+    monkeypatch.delattr(mesh, 'batched_abs')
+    L.sweep.compute_residual()
+    assert L.status.residual == residual
+    assert residual > 0
@@ -0,0 +1,106 @@
+import pytest
+
+from pySDC.core.Problem import ptype
+from pySDC.implementations.collocation_classes.gauss_radau_right import CollGaussRadau_Right
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.problem_classes.AdvectionDiffusionEquation_1D_FFT import advectiondiffusion1d_imex, \
+    advectiondiffusion1d_implicit
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+
+
+@pytest.mark.parametrize("problem_class", [advectiondiffusion1d_imex, advectiondiffusion1d_implicit])
+def test_batched_problems(problem_class):
+    """
+    Check that the batched evaluations and solves of the FFT problems agree with separate calls
+    """
+    P = problem_class({'nvars': 64, 'c': 1.0, 'freq': 2, 'nu': 0.1})
+    U = [P.u_exact(0.0) * (k + 1) for k in range(3)]
+    times = [0.0] * len(U)
+    factors = [0.0, 0.1, 0.3]
+
+    for batched, looped in zip(P.eval_f_batch(U, times), ptype.eval_f_batch(P, U, times)):
+        assert type(batched) == type(looped)
+        for part in ['impl', 'expl'] if hasattr(looped, 'impl') else [None]:
+            diff = getattr(batched, part) - getattr(looped, part) if part else batched - looped
+            assert abs(diff) < 1E-13, 'ERROR: batched evaluation of the RHS differs'
+
+    for batched, looped in zip(P.solve_system_batch(U, factors, U, times),
+                               ptype.solve_system_batch(P, U, factors, U, times)):
+        assert type(batched) == type(looped)
+        assert abs(batched - looped) < 1E-13, 'ERROR: batched solve differs'
+
+
+class counting_advectiondiffusion1d_imex(advectiondiffusion1d_imex):
+    """
+    Advection-diffusion problem counting the single and batched calls
+    """
+
+    calls = {'eval_f': 0, 'eval_f_batch': 0}
+
+    def eval_f(self, u, t):
+        self.calls['eval_f'] += 1
+        return super(counting_advectiondiffusion1d_imex, self).eval_f(u, t)
+
+    def eval_f_batch(self, U, times):
+        self.calls['eval_f_batch'] += 1
+        return super(counting_advectiondiffusion1d_imex, self).eval_f_batch(U, times)
+
+
+class looped_advectiondiffusion1d_imex(advectiondiffusion1d_imex):
+    """
+    Advection-diffusion problem without batched evaluations and solves, as reference
+    """
+
+    eval_f_batch = ptype.eval_f_batch
+    solve_system_batch = ptype.solve_system_batch
+
+
+def run(problem_class, sweeper_class, sweeper_params, batched=True):
+    description = {
+        'problem_class': problem_class,
+        'problem_params': {'nvars': 64, 'c': 1.0, 'freq': 2, 'nu': 0.1},
+        'sweeper_class': sweeper_class,
+        'sweeper_params': {'collocation_class': CollGaussRadau_Right, 'num_nodes': 3, **sweeper_params},
+        'level_params': {'restol': 1E-10, 'dt': 0.05},
+        'step_params': {'maxiter': 50},
+    }
+    controller = controller_nonMPI(num_procs=1, controller_params={'logger_level': 30}, description=description)
+    if not batched:
+        controller.MS[0].levels[0].sweep.independent_nodes = False
+    P = controller.MS[0].levels[0].prob
+    uend, _ = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.2)
+    return uend, controller.MS[0].levels[0].sweep
+
+
+@pytest.mark.parametrize("sweeper_class, sweeper_params", [
+    (imex_1st_order, {'QI': 'IEpar', 'QE': 'PIC'}),
+    (imex_1st_order, {'QI': 'IEpar', 'QE': 'PIC', 'use_workspace': True}),
+    (imex_1st_order, {'QI': 'LU', 'QE': 'EE'}),
+])
+def test_batched_sweeps(sweeper_class, sweeper_params):
+    """
+    Check that predictor and sweeps with independent nodes only use batched evaluations, with the same results
+    """
+    calls = counting_advectiondiffusion1d_imex.calls
+    for key in calls:
+        calls[key] = 0
+
+    uend, sweep = run(counting_advectiondiffusion1d_imex, sweeper_class, sweeper_params)
+    uend_ref, _ = run(looped_advectiondiffusion1d_imex, sweeper_class, sweeper_params, batched=False)
+    assert abs(uend - uend_ref) < 1E-13, 'ERROR: batched sweeps give different results'
+
+    assert calls['eval_f_batch'] > 0
+    if sweep.independent_nodes:
+        assert calls['eval_f'] == 0, 'ERROR: sweep with independent nodes evaluates the RHS node by node'
+    else:
+        assert calls['eval_f'] > 0
+
+
+def test_generic_implicit_independent_nodes():
+    """
+    Check which preconditioners of the generic implicit sweeper allow to update all nodes at once
+    """
+    for QI, independent in [('IE', False), ('LU', False), ('IEpar', True), ('Qpar', True), ('PIC', True)]:
+        sweeper = generic_implicit({'collocation_class': CollGaussRadau_Right, 'num_nodes': 3, 'QI': QI})
+        assert sweeper.independent_nodes == independent
@@ -0,0 +1,58 @@
+import numpy as np
+
+from pySDC.implementations.collocation_classes.gauss_lobatto import CollGaussLobatto
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.problem_classes.PenningTrap_3D import penningtrap
+from pySDC.implementations.sweeper_classes.boris_2nd_order import boris_2nd_order
+
+
+class counting_penningtrap(penningtrap):
+    """
+    Penning trap which counts how often the forces are built from fields and particles
+    """
+
+    calls = 0
+
+    def build_f(self, f, part, t):
+        counting_penningtrap.calls += 1
+        return super(counting_penningtrap, self).build_f(f, part, t)
+
+
+def test_boris_force_cache():
+    """
+    Check that the sweeper builds the force only once per updated node and that the cached forces are up to date
+    """
+    num_nodes = 5
+    description = {
+        'problem_class': counting_penningtrap,
+        'problem_params': {'omega_E': 4.9, 'omega_B': 25.0, 'nparts': 10, 'sig': 0.1,
+                           'u0': np.array([[10, 0, 0], [100, 0, 100], [1], [1]], dtype=object)},
+        'sweeper_class': boris_2nd_order,
+        'sweeper_params': {'collocation_class': CollGaussLobatto, 'num_nodes': num_nodes},
+        'level_params': {'restol': -1, 'dt': 0.015625},
+        'step_params': {'maxiter': 1},
+    }
+    controller = controller_nonMPI(num_procs=1, controller_params={'logger_level': 30}, description=description)
+    L = controller.MS[0].levels[0]
+    P = L.prob
+
+    controller.run(u0=P.u_init(), t0=0.0, Tend=0.015625)
+
+    # the forces are built at all nodes with the old values and again at the nodes updated by the sweep
+    L.sweep.predict()
+    counting_penningtrap.calls = 0
+    L.sweep.update_nodes()
+    integral = L.sweep.integrate()
+    L.sweep.compute_end_point()
+    assert counting_penningtrap.calls == 2 * num_nodes + 1
+
+    # nothing has changed, so the forces are not built again
+    L.sweep.integrate()
+    assert counting_penningtrap.calls == 2 * num_nodes + 1
+
+    for m in range(num_nodes):
+        ref = P.dtype_u(P.init, val=0.0)
+        for j in range(1, num_nodes + 1):
+            f = P.build_f(L.f[j], L.u[j], L.time + L.dt * L.sweep.coll.nodes[j - 1])
+            ref.vel += L.dt * L.sweep.coll.Qmat[m + 1, j] * f
+        assert np.allclose(integral[m].vel, ref.vel, rtol=1E-14, atol=1E-14)
@@ -124,3 +124,22 @@ def test_partialquadraturewithS(collclass):
             int_ex = np.polyval(poly_int_coeff, coll.nodes[i]) - np.polyval(poly_int_coeff, coll.nodes[i-1])
             int_coll = np.dot(poly_vals, S[i,:])
             assert abs(int_ex - int_coll) < tolQuad, "For node type " + coll.__class__.__name__ + ", partial quadrature rule from Smat failed to integrate polynomial of degree M-1 exactly for M = " + str(M)
+
+
+@pytest.mark.parametrize("collclass", classes)
+def test_shared_matrices(collclass):
+    import pySDC.core.Collocation as collocation_module
+
+    coll = collclass(4, t_start, t_end)
+    coll_shared = collclass(4, t_start, t_end)
+
+    # compute the matrices again without the cache
+    cache = collocation_module._collocation_cache
+    collocation_module._collocation_cache = {}
+    coll_new = collclass(4, t_start, t_end)
+    collocation_module._collocation_cache = cache
+
+    for attr in ['nodes', 'weights', 'Qmat', 'Smat', 'delta_m']:
+        assert getattr(coll, attr) is getattr(coll_shared, attr), "For node type " + coll.__class__.__name__ + ", " + attr + " is not shared"
+        assert not getattr(coll, attr).flags.writeable, "For node type " + coll.__class__.__name__ + ", shared " + attr + " can be changed"
+        assert np.array_equal(getattr(coll, attr), getattr(coll_new, attr)), "For node type " + coll.__class__.__name__ + ", cached " + attr + " differs"
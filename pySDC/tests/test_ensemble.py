@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+
+from pySDC.helpers.stats_helper import get_sorted
+from pySDC.implementations.collocation_classes.gauss_radau_right import CollGaussRadau_Right
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.convergence_controller_classes.check_ensemble_convergence import \
+    CheckEnsembleConvergence
+from pySDC.implementations.problem_classes.Piline import piline
+from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+from pySDC.implementations.problem_classes.Van_der_Pol_implicit import vanderpol
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+
+
+def get_problem_params(problem_class, values, ensemble_size=None):
+    """
+    Get the parameters for a single run or an ensemble, where values are the parameters varying across the members
+    """
+    if problem_class is vanderpol:
+        problem_params = {'mu': values, 'u0': np.array([2.0, 0.0]), 'newton_maxiter': 50, 'newton_tol': 1E-14}
+    elif problem_class is testequation0d:
+        problem_params = {'lambdas': np.stack([-values, 1j * values], axis=-1), 'u0': 1.0}
+    else:
+        problem_params = {'Vs': 100.0, 'Rs': 1.0, 'C1': values, 'Rpi': 0.2, 'Lpi': 1.0, 'C2': 1.0, 'Rl': 5.0}
+    if ensemble_size is not None:
+        problem_params['ensemble_size'] = ensemble_size
+    return problem_params
+
+
+def run(problem_class, problem_params, num_procs, ensemble):
+    description = {
+        'problem_class': problem_class,
+        'problem_params': problem_params,
+        'sweeper_class': imex_1st_order if problem_class is piline else generic_implicit,
+        'sweeper_params': {'collocation_class': CollGaussRadau_Right, 'num_nodes': 3, 'QI': 'LU'},
+        'level_params': {'restol': 1E-10, 'dt': 0.1},
+        'step_params': {'maxiter': 50},
+    }
+    if ensemble:
+        description['convergence_controllers'] = {CheckEnsembleConvergence: {}}
+
+    controller = controller_nonMPI(num_procs=num_procs, controller_params={'logger_level': 30},
+                                   description=description)
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.6)
+
+    niter = np.array([me[1] for me in get_sorted(stats, type='niter_members' if ensemble else 'niter')])
+    return uend, niter
+
+
+@pytest.mark.parametrize("num_procs", [1, 3])
+@pytest.mark.parametrize("problem_class", [vanderpol, testequation0d, piline])
+def test_ensemble(problem_class, num_procs):
+    """
+    Check that an ensemble gives the same solutions and iteration counts for each member as individual runs
+    """
+    values = np.array([0.1, 1.0, 5.0])
+    uend, niter = run(problem_class, get_problem_params(problem_class, values, len(values)), num_procs, True)
+    assert uend.shape[0] == len(values)
+
+    for i in range(len(values)):
+        uend_single, niter_single = run(problem_class, get_problem_params(problem_class, values[i]), num_procs, False)
+        assert np.allclose(uend[i], uend_single, rtol=1E-14, atol=1E-14), 'ERROR: member differs from single run'
+        assert np.array_equal(niter[:, i], niter_single), 'ERROR: member needs different number of iterations'
+
+    # the members need different numbers of iterations, so the masking does have an effect here
+    assert not all(np.array_equal(niter[:, 0], niter[:, i]) for i in range(len(values)))
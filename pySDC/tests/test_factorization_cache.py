@@ -0,0 +1,84 @@
+import pytest
+import numpy as np
+
+from pySDC.core.Problem import FactorizationCache
+from pySDC.helpers.stats_helper import get_sorted
+from pySDC.implementations.collocation_classes.gauss_radau_right import CollGaussRadau_Right
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD import heat1d
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+
+
+def run_heat(cache_size):
+    """
+    Run the heat equation with the given size of the factorization cache
+    """
+    level_params = dict()
+    level_params['restol'] = 1E-10
+    level_params['dt'] = 0.1
+
+    sweeper_params = dict()
+    sweeper_params['collocation_class'] = CollGaussRadau_Right
+    sweeper_params['num_nodes'] = 3
+    sweeper_params['QI'] = 'LU'
+
+    problem_params = dict()
+    problem_params['nu'] = 0.1
+    problem_params['freq'] = 4
+    problem_params['nvars'] = 127
+    problem_params['factorization_cache_size'] = cache_size
+
+    description = dict()
+    description['problem_class'] = heat1d
+    description['problem_params'] = problem_params
+    description['sweeper_class'] = generic_implicit
+    description['sweeper_params'] = sweeper_params
+    description['level_params'] = level_params
+    description['step_params'] = {'maxiter': 50}
+
+    controller = controller_nonMPI(num_procs=1, controller_params={'logger_level': 30}, description=description)
+
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.5)
+
+    return uend, [me[1] for me in get_sorted(stats, type='niter', sortby='time')], P
+
+
+def test_factorization_cache_lru():
+    """
+    Check hits, misses and eviction of the least recently used factorization
+    """
+    cache = FactorizationCache(2)
+
+    assert cache.get(1, lambda: 'a') == 'a'
+    assert cache.get(2, lambda: 'b') == 'b'
+    assert cache.get(1, lambda: 'x') == 'a'
+    assert cache.get(3, lambda: 'c') == 'c'
+    assert cache.get(2, lambda: 'd') == 'd', 'ERROR: least recently used entry was not evicted'
+
+    assert len(cache) == 2
+    assert cache.hits == 1 and cache.misses == 4, f'ERROR: got {cache.hits} hits and {cache.misses} misses'
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get(1, lambda: 'e') == 'e'
+
+
+@pytest.mark.parametrize("cache_size", [1, 16])
+def test_factorization_cache_heat(cache_size):
+    """
+    Check that caching factorizations does not change the solution and that only one factorization per node is made
+    """
+    uend, niter, _ = run_heat(0)
+    uend_cache, niter_cache, P = run_heat(cache_size)
+
+    assert niter == niter_cache, 'ERROR: got different iteration counts, %s vs. %s' % (niter, niter_cache)
+    assert np.allclose(uend, uend_cache, rtol=0, atol=1E-12), 'ERROR: caching factorizations changes the solution'
+
+    # with a too small cache, the factorizations for the three nodes keep evicting each other
+    if cache_size >= 3:
+        assert P.factorization_cache.misses == 3, f'ERROR: expected 3 factorizations, got ' \
+                                                  f'{P.factorization_cache.misses}'
+        assert P.factorization_cache.hits > 0, 'ERROR: cached factorizations have not been used'
+    else:
+        assert P.factorization_cache.hits == 0, 'ERROR: cache should have been too small to be hit'
@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+
+
+def get_problems(ndim, solver_type):
+    """
+    Set up the periodic FD problems with the given solver
+    """
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD_forced_periodic import heatNd_periodic
+    from pySDC.implementations.problem_classes.AdvectionEquation_ND_FD_periodic import advectionNd_periodic
+
+    heat_params = {'nu': 1.0, 'freq': tuple([2] * ndim), 'nvars': tuple([16] * ndim), 'ndim': ndim, 'order': 4,
+                   'solver_type': solver_type}
+    advection_params = {'c': 1.0, 'freq': tuple([2] * ndim), 'nvars': tuple([16] * ndim), 'ndim': ndim, 'order': 3,
+                        'type': 'upwind', 'solver_type': solver_type}
+
+    return [heatNd_periodic(heat_params), advectionNd_periodic(advection_params)]
+
+
+@pytest.mark.parametrize("ndim", [1, 2, 3])
+def test_fft_solver(ndim):
+    """
+    Check that the FFT-based solver gives the same results as the sparse direct solver
+    """
+    np.random.seed(0)
+    for prob_fft, prob_direct in zip(get_problems(ndim, 'fft'), get_problems(ndim, 'direct')):
+        rhs = prob_fft.dtype_u(prob_fft.init)
+        rhs[:] = np.random.rand(*rhs.shape)
+
+        for factor in [1E-3, 0.1]:
+            u_fft = prob_fft.solve_system(rhs, factor, rhs, 0.0)
+            u_direct = prob_direct.solve_system(rhs, factor, rhs, 0.0)
+            assert np.allclose(u_fft, u_direct, rtol=0, atol=1E-12), \
+                f'ERROR: FFT solver differs from direct solver for {type(prob_fft).__name__} in {ndim}D'
+
+
+def test_fft_solver_heat2d():
+    """
+    Check that the FFT-based solver solves the 2D heat equation system to the CG tolerance
+    """
+    from pySDC.implementations.problem_classes.HeatEquation_2D_FD_periodic import heat2d_periodic
+
+    prob = heat2d_periodic({'nu': 1.0, 'freq': 2, 'nvars': (32, 32), 'order': 4, 'solver_type': 'fft'})
+
+    np.random.seed(0)
+    rhs = prob.dtype_u(prob.init)
+    rhs[:] = np.random.rand(*rhs.shape)
+
+    u = prob.solve_system(rhs, 0.1, rhs, 0.0)
+    res = u - 0.1 * prob.eval_f(u, 0.0) - rhs
+    assert abs(res) < 1E-12, f'ERROR: FFT solver does not solve the system, residual is {abs(res)}'
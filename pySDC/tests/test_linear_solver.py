@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator
+
+from pySDC.core.Errors import ParameterError
+from pySDC.core.Problem import StencilOperator
+from pySDC.implementations.problem_classes.HeatEquation_ND_FD_forced_periodic import heatNd_periodic
+from pySDC.implementations.solver_classes.linear_solver import linear_solver
+
+
+def get_system(nvars=(32, 32), factor=1e-2):
+    """
+    Set up the system I - factor * A for the periodic laplacian, matrix-free and assembled
+    """
+    operator = StencilOperator.from_derivative(nvars, derivative=2, order=2, factor=nvars[0] ** 2)
+    return operator.get_system_operator(factor), sp.eye(np.prod(nvars), format='csc') - factor * operator.matrix
+
+
+@pytest.mark.parametrize("method, preconditioner", [('direct', None), ('CG', None), ('CG', 'jacobi'), ('CG', 'MG'),
+                                                    ('BiCGSTAB', 'ilu'), ('GMRES', 'ilu'), ('BiCGSTAB', 'MG'),
+                                                    ('MG', None)])
+def test_methods(method, preconditioner):
+    """
+    Check that all combinations of methods and preconditioners solve the system
+    """
+    nvars = (32, 32)
+    A, M = get_system(nvars)
+    solver = linear_solver({'method': method, 'preconditioner': preconditioner, 'tol': 1e-10, 'maxiter': 500},
+                           nvars=nvars, periodic=True)
+
+    b = np.random.default_rng(0).random(M.shape[0])
+    for _ in range(2):
+        x = solver.solve(A, b, key=0.1, matrix=lambda: M)
+        assert np.linalg.norm(M @ x - b) < 1e-8 * np.linalg.norm(b)
+        assert solver.last_info == 0
+
+    assert solver.ncalls == 2
+    if method == 'direct' or preconditioner is not None:
+        assert solver.cache.misses == 1 and solver.cache.hits == 1, 'ERROR: setup has not been reused'
+
+
+def test_preconditioner_and_warm_start():
+    """
+    Check that preconditioners, warm starts and adaptive tolerances reduce the number of iterations
+    """
+    A, M = get_system()
+    b = np.random.default_rng(0).random(M.shape[0])
+
+    niter = {}
+    for name, params in {'CG': {}, 'PCG': {'preconditioner': 'MG'}, 'adaptive': {'adaptive_tol': 1e-2}}.items():
+        solver = linear_solver({'tol': 1e-10, **params}, nvars=(32, 32), periodic=True)
+        x = solver.solve(A, b, key=0.1, matrix=lambda: M)
+        first = solver.last_niter
+        solver.solve(A, b + 1e-6 * x, key=0.1, matrix=lambda: M)
+        niter[name] = (first, solver.last_niter)
+        assert solver.niter == sum(niter[name])
+
+    assert niter['PCG'][0] < niter['CG'][0] / 2
+    assert niter['CG'][1] < niter['CG'][0], 'ERROR: warm start did not help'
+    assert niter['adaptive'][1] < niter['CG'][1], 'ERROR: adaptive tolerance did not reduce the work'
+
+    # user-defined preconditioner
+    inv_diag = 1.0 / M.diagonal()
+    P = LinearOperator(M.shape, matvec=lambda x: inv_diag * x.flatten())
+    solver = linear_solver({'preconditioner': P, 'tol': 1e-10})
+    x = solver.solve(A, b)
+    assert np.linalg.norm(M @ x - b) < 1e-8 * np.linalg.norm(b)
+
+
+def test_errors():
+    A, M = get_system()
+    with pytest.raises(ParameterError):
+        linear_solver({'method': 'SOR'})
+    with pytest.raises(ParameterError):
+        linear_solver({'method': 'MG'})
+    with pytest.raises(ParameterError):
+        linear_solver({'method': 'direct'}).solve(A, np.ones(M.shape[0]))
+
+
+def test_heat():
+    """
+    Check that the linear solver can be switched via the problem parameters
+    """
+    problem_params = {'nvars': (32, 32), 'ndim': 2, 'nu': 1.0, 'freq': (2, 2), 'lintol': 1e-12, 'liniter': 500}
+    prob_cg = heatNd_periodic({**problem_params, 'solver_type': 'CG'})
+    prob_mg = heatNd_periodic({**problem_params, 'solver_type': 'CG',
+                               'linear_solver': {'preconditioner': 'MG', 'warm_start': False}})
+
+    u0 = prob_cg.u_exact(0.0)
+    rhs = prob_cg.dtype_u(u0)
+    rhs[:] += 0.1 * np.random.default_rng(0).random(problem_params['nvars'])
+    assert np.allclose(prob_cg.solve_system(rhs, 0.1, u0, 0.0), prob_mg.solve_system(rhs, 0.1, u0, 0.0), rtol=0,
+                       atol=1e-9)
+    assert prob_mg.linear_solver.last_niter < prob_cg.linear_solver.last_niter
@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+import scipy.sparse as sp
+
+from pySDC.core.Problem import StencilOperator
+from pySDC.helpers.multigrid_helper import MultigridSolver, get_prolongation_matrices
+from pySDC.implementations.problem_classes.AllenCahn_2D_FD import allencahn_semiimplicit
+from pySDC.implementations.problem_classes.HeatEquation_ND_FD_forced_periodic import heatNd_periodic
+
+
+def get_system(shape, periodic, factor=1e-2):
+    """
+    Set up the matrix I - factor * A for the laplacian with second-order FD
+    """
+    if periodic:
+        A = StencilOperator.from_derivative(shape, derivative=2, order=2, factor=shape[0] ** 2).matrix
+    else:
+        A1 = sp.diags([1, -2, 1], [-1, 0, 1], shape=(shape[0], shape[0])) * (shape[0] + 1) ** 2
+        A = A1 if len(shape) == 1 else sp.kron(A1, sp.eye(shape[1])) + sp.kron(sp.eye(shape[0]), A1)
+    return sp.eye(A.shape[0], format='csc') - factor * A
+
+
+@pytest.mark.parametrize("periodic", [True, False])
+@pytest.mark.parametrize("ndim", [1, 2])
+def test_grid_independent_convergence(periodic, ndim):
+    """
+    Check that the number of V-cycles does not grow when refining the grid
+    """
+    rng = np.random.default_rng(0)
+    niter = []
+    for n in [32, 64, 128]:
+        shape = tuple([n if periodic else n - 1] * ndim)
+        M = get_system(shape, periodic)
+        mg = MultigridSolver.from_grid(M, shape, periodic)
+        assert mg.num_levels > 2
+
+        b = rng.random(M.shape[0])
+        x = mg.solve(b, tol=1e-10, maxiter=50)
+        assert np.linalg.norm(M @ x - b) < 1e-10 * np.linalg.norm(b)
+        niter.append(mg.niter)
+
+    assert max(niter) <= min(niter) + 1, f'ERROR: number of V-cycles depends on the grid: {niter}'
+    assert max(niter) < 20
+
+
+def test_prolongation_matrices():
+    """
+    Check the sizes of the hierarchy and that constants are interpolated exactly
+    """
+    prolongations = get_prolongation_matrices((16, 16), periodic=True)
+    assert [P.shape for P in prolongations] == [(256, 64), (64, 16)]
+    for P in prolongations:
+        assert np.allclose(P @ np.ones(P.shape[1]), 1.0)
+
+    assert len(get_prolongation_matrices((16, 16), periodic=True, max_levels=2)) == 1
+    assert [P.shape for P in get_prolongation_matrices(31, periodic=False)] == [(31, 15), (15, 7)]
+
+
+@pytest.mark.parametrize("solver_type", ['MG', 'PCG'])
+def test_heat(solver_type):
+    """
+    Check that multigrid gives the same solution as the direct solver in the heat equation
+    """
+    problem_params = {'nvars': (64, 64), 'ndim': 2, 'nu': 1.0, 'freq': (2, 2), 'lintol': 1e-12, 'liniter': 100}
+    prob_mg = heatNd_periodic({**problem_params, 'solver_type': solver_type})
+    prob_direct = heatNd_periodic({**problem_params, 'solver_type': 'direct'})
+
+    u0 = prob_mg.u_exact(0.0)
+    rhs = prob_mg.dtype_u(u0)
+    rhs[:] += 0.1 * np.random.default_rng(0).random(problem_params['nvars'])
+    for factor in [0.1, 0.01, 0.1]:
+        u_mg = prob_mg.solve_system(rhs, factor, u0, 0.0)
+        u_direct = prob_direct.solve_system(rhs, factor, u0, 0.0)
+        assert np.allclose(u_mg, u_direct, rtol=0, atol=1e-9)
+
+    assert prob_mg.factorization_cache.misses == 2, 'ERROR: multigrid hierarchies have not been reused'
+
+
+def test_allencahn():
+    """
+    Check that multigrid and preconditioned CG need fewer iterations than CG in Allen-Cahn
+    """
+    problem_params = {'nvars': (128, 128), 'nu': 2, 'eps': 0.04, 'newton_maxiter': 100, 'newton_tol': 1e-12,
+                      'lin_tol': 1e-10, 'lin_maxiter': 1000, 'radius': 0.25}
+
+    solutions = {}
+    itercounts = {}
+    for lin_solver in ['CG', 'MG', 'PCG']:
+        prob = allencahn_semiimplicit({**problem_params, 'lin_solver': lin_solver})
+        u0 = prob.u_exact(0.0)
+        solutions[lin_solver] = prob.solve_system(u0, 1e-3, u0, 0.0)
+        itercounts[lin_solver] = prob.lin_itercount
+
+    assert np.allclose(solutions['MG'], solutions['CG'], rtol=0, atol=1e-7)
+    assert np.allclose(solutions['PCG'], solutions['CG'], rtol=0, atol=1e-7)
+    assert itercounts['MG'] < itercounts['CG'] and itercounts['PCG'] < itercounts['CG'], itercounts
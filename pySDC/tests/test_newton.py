@@ -0,0 +1,129 @@
+import pytest
+import numpy as np
+import scipy.sparse as sp
+
+from pySDC.core.Errors import ParameterError
+from pySDC.implementations.problem_classes.AllenCahn_1D_FD import allencahn_front_fullyimplicit
+from pySDC.implementations.problem_classes.GeneralizedFisher_1D_FD_implicit import generalized_fisher
+from pySDC.implementations.solver_classes.newton import newton_solver
+
+
+def get_problem(problem_class, strategy, refresh=None):
+    if problem_class is generalized_fisher:
+        problem_params = {'nu': 1, 'lambda0': 2.0, 'interval': (-5, 5), 'nvars': 127}
+    else:
+        problem_params = {'dw': -0.04, 'eps': 0.04, 'interval': (-0.5, 0.5), 'nvars': 127}
+    problem_params.update({'newton_maxiter': 100, 'newton_tol': 1E-12, 'newton_strategy': strategy,
+                           'newton_refresh': refresh})
+    return problem_class(problem_params)
+
+
+@pytest.mark.parametrize("problem_class", [generalized_fisher, allencahn_front_fullyimplicit])
+def test_simplified_newton(problem_class):
+    """
+    Check that the simplified strategy gives the same solutions with fewer Jacobians by reusing them for each factor
+    """
+    results = {}
+    for strategy in ['full', 'simplified']:
+        P = get_problem(problem_class, strategy)
+        u0 = P.u_exact(0.0)
+        sol = [P.solve_system(u0, factor, u0, 0.0) for factor in [0.01, 0.02, 0.01, 0.02]]
+        results[strategy] = (sol, P.newton_solver.njacobians)
+
+    for u_full, u_simplified in zip(results['full'][0], results['simplified'][0]):
+        assert np.allclose(u_full, u_simplified, rtol=0, atol=1E-10), 'ERROR: strategies give different solutions'
+    assert results['simplified'][1] == 2, 'ERROR: expected one Jacobian per factor'
+    assert results['full'][1] > 4 * results['simplified'][1]
+
+
+def test_refresh():
+    """
+    Check that frozen Jacobians are assembled anew after the given number of iterations or if convergence is too slow
+    """
+    def g(u):
+        return u ** 3 - 8.0
+
+    def dg(u):
+        return sp.diags(3.0 * u ** 2, format='csc')
+
+    u0 = np.array([1.0, 3.0, 5.0])
+    results = {}
+    for name, params in {'full': {'strategy': 'full'}, 'refresh': {'strategy': 'simplified', 'refresh': 1},
+                         'simplified': {'strategy': 'simplified'}}.items():
+        solver = newton_solver({'maxiter': 100, **params})
+        u, n, res = solver.solve(g, dg, u0)
+        assert res < 1E-12 and np.allclose(u, 2.0)
+        assert solver.niter == n and solver.ncalls == 1
+        results[name] = (u, n, solver.njacobians)
+
+    # refreshing in every iteration is the full Newton method
+    assert np.array_equal(results['full'][0], results['refresh'][0])
+    assert results['full'][1] == results['full'][2] == results['refresh'][2]
+    # slow convergence leads to new Jacobians, but not in every iteration
+    assert 1 < results['simplified'][2] < results['simplified'][1]
+
+    with pytest.raises(ParameterError):
+        newton_solver({'strategy': 'quasi'})
+
+
+def test_shared_linear_solver():
+    """
+    Check that frozen Jacobians of different Newton solvers sharing a linear solver are not mixed up
+    """
+    from pySDC.implementations.solver_classes.linear_solver import linear_solver
+
+    shared = linear_solver({'method': 'direct'})
+    u0 = np.array([1.0, 3.0, 5.0])
+    njacobians = 0
+    for power, root in [(3, 2.0), (2, 3.0)]:
+        solver = newton_solver({'strategy': 'simplified', 'maxiter': 100}, solver=shared)
+        u, n, res = solver.solve(lambda u: u ** power - root ** power,
+                                 lambda u: sp.diags(power * u ** (power - 1), format='csc'), u0, key=0.1)
+        assert res < 1E-12 and np.allclose(u, root)
+        njacobians += solver.njacobians
+
+    assert shared.cache.misses == njacobians, 'ERROR: a factorization of another Jacobian has been reused'
+
+
+def test_jacobian_cache_size():
+    """
+    Check that only as many frozen Jacobians are kept as the linear solver keeps factorizations
+    """
+    from pySDC.implementations.solver_classes.linear_solver import linear_solver
+
+    def solve(solver, factor):
+        u, n, res = solver.solve(lambda u: u + factor * u ** 3 - 1.0,
+                                 lambda u: sp.diags(1.0 + 3.0 * factor * u ** 2, format='csc'), np.ones(3), key=factor)
+        assert res < 1E-12
+
+    njacobians = {}
+    for cache_size in [2, 3]:
+        solver = newton_solver({'strategy': 'simplified', 'maxiter': 100},
+                               solver=linear_solver({'method': 'direct', 'cache_size': cache_size}))
+        for factor in [0.1, 0.2, 0.3, 0.1]:
+            solve(solver, factor)
+        njacobians[cache_size] = solver.njacobians
+
+    # the Jacobian for the first factor has been dropped with the smaller cache
+    assert njacobians[2] > njacobians[3]
+
+    # resetting drops all Jacobians
+    solver.reset()
+    solve(solver, 0.1)
+    assert solver.njacobians > njacobians[3]
+
+
+def test_reset_factorization_cache():
+    """
+    Check that resetting the factorizations of a problem also drops the frozen Jacobians of Newton's method
+    """
+    P = get_problem(allencahn_front_fullyimplicit, 'simplified')
+    u0 = P.u_exact(0.0)
+
+    P.solve_system(u0, 0.01, u0, 0.0)
+    njacobians = P.newton_solver.njacobians
+    P.solve_system(u0, 0.01, u0, 0.0)
+    assert P.newton_solver.njacobians == njacobians
+    P.reset_factorization_cache()
+    P.solve_system(u0, 0.01, u0, 0.0)
+    assert P.newton_solver.njacobians == 2 * njacobians
@@ -0,0 +1,122 @@
+import pytest
+import numpy as np
+
+from pySDC.core.Errors import ParameterError
+from pySDC.helpers.stats_helper import get_sorted
+from pySDC.implementations.collocation_classes.gauss_radau_right import CollGaussRadau_Right
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD import heat1d
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+from pySDC.implementations.sweeper_classes.generic_implicit_pool import generic_implicit_pool
+
+
+def run_heat(sweeper_class, sweeper_params):
+    """
+    Run the heat equation with the given sweeper
+    """
+    level_params = dict()
+    level_params['restol'] = 1E-10
+    level_params['dt'] = 0.1
+
+    sweeper_params['collocation_class'] = CollGaussRadau_Right
+    sweeper_params['num_nodes'] = 3
+
+    problem_params = dict()
+    problem_params['nu'] = 0.1
+    problem_params['freq'] = 4
+    problem_params['nvars'] = 127
+
+    description = dict()
+    description['problem_class'] = heat1d
+    description['problem_params'] = problem_params
+    description['sweeper_class'] = sweeper_class
+    description['sweeper_params'] = sweeper_params
+    description['level_params'] = level_params
+    description['step_params'] = {'maxiter': 50}
+
+    controller = controller_nonMPI(num_procs=2, controller_params={'logger_level': 30}, description=description)
+
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.4)
+
+    if sweeper_class is generic_implicit_pool:
+        assert controller.MS[0].levels[0].sweep.pool is controller.MS[1].levels[0].sweep.pool, \
+            'ERROR: sweepers with the same number of workers do not share the pool'
+
+    return uend, [me[1] for me in get_sorted(stats, type='niter', sortby='time')]
+
+
+@pytest.mark.parametrize("QI", ['IEpar', 'Qpar'])
+@pytest.mark.parametrize("pool_type", ['threads', 'processes'])
+def test_node_parallel_sweeper(QI, pool_type):
+    """
+    Check that the node-parallel sweeper reproduces the serial sweeps with the same diagonal preconditioner
+    """
+    uend, niter = run_heat(generic_implicit, {'QI': QI})
+    uend_pool, niter_pool = run_heat(generic_implicit_pool, {'QI': QI, 'pool_type': pool_type})
+
+    assert niter == niter_pool, 'ERROR: got different iteration counts, %s vs. %s' % (niter, niter_pool)
+    assert np.allclose(uend, uend_pool, rtol=0, atol=1E-12), 'ERROR: node-parallel sweeps change the solution'
+
+
+def test_node_parallel_sweeper_needs_diagonal_QI():
+    """
+    Check that non-diagonal preconditioners are rejected
+    """
+    with pytest.raises(ParameterError):
+        run_heat(generic_implicit_pool, {'QI': 'LU'})
+
+
+def test_node_parallel_sweeper_workspace():
+    """
+    Check that scratch buffers are rejected, since the nodes are updated by the workers
+    """
+    with pytest.raises(ParameterError):
+        run_heat(generic_implicit_pool, {'QI': 'IEpar', 'use_workspace': True})
+
+
+def test_node_parallel_sweeper_worker_problem():
+    """
+    Check that worker processes get the problem once and a new one after it has been replaced or reset
+    """
+    level_params = {'restol': 1E-10, 'dt': 0.1}
+    sweeper_params = {'collocation_class': CollGaussRadau_Right, 'num_nodes': 3, 'QI': 'IEpar',
+                      'pool_type': 'processes'}
+    problem_params = {'nu': 0.1, 'freq': 4, 'nvars': 127}
+
+    description = dict()
+    description['problem_class'] = heat1d
+    description['problem_params'] = problem_params
+    description['sweeper_class'] = generic_implicit_pool
+    description['sweeper_params'] = sweeper_params
+    description['level_params'] = level_params
+    description['step_params'] = {'maxiter': 50}
+
+    controller = controller_nonMPI(num_procs=1, controller_params={'logger_level': 30}, description=description)
+    L = controller.MS[0].levels[0]
+
+    # only a token is sent along with the tasks
+    token = L.sweep.worker_problem
+    assert isinstance(token, str)
+    pool = L.sweep.pool
+    assert L.sweep.worker_problem == token and L.sweep.pool is pool
+
+    # a problem with other parameters needs new workers
+    L.prob.params.nu = 0.2
+    assert L.sweep.worker_problem == token
+    L.sweep.reset_worker_problem()
+    assert L.sweep.worker_problem != token
+    assert L.sweep.pool is not pool
+
+    # replacing the problem is detected
+    pool = L.sweep.pool
+    L._level__prob = heat1d(problem_params)
+    assert L.sweep.pool is not pool
+    assert L.sweep.worker_problem == token
+
+    uend, _ = controller.run(u0=L.prob.u_exact(0.0), t0=0.0, Tend=0.2)
+
+    description['sweeper_class'] = generic_implicit
+    controller = controller_nonMPI(num_procs=1, controller_params={'logger_level': 30}, description=description)
+    uend_serial, _ = controller.run(u0=L.prob.u_exact(0.0), t0=0.0, Tend=0.2)
+    assert np.allclose(uend, uend_serial, rtol=0, atol=1E-12), 'ERROR: worker processes use the wrong problem'
@@ -0,0 +1,27 @@
+import numpy as np
+
+from pySDC.projects.Resilience.run_store import RunStore
+
+
+def test_run_store(tmp_path):
+    """
+    Check that chunks appended in any order are loaded ordered by run, without duplicates, and can be resumed
+    """
+    store = RunStore(f'{tmp_path}/stats')
+    assert store.load()['runs'] == 0
+
+    for runs in [[4, 5], [0, 1, 2], [2, 3]]:
+        store.append({'run': np.array(runs), 'error': np.array(runs) * 0.5,
+                      'problem_pos': np.array([[run, -run] for run in runs])})
+
+    dat = RunStore(f'{tmp_path}/stats').load()
+    assert dat['runs'] == 6
+    assert np.array_equal(dat['run'], np.arange(6))
+    assert np.array_equal(dat['error'], np.arange(6) * 0.5)
+    assert dat['problem_pos'].shape == (6, 2)
+
+    # runs which are done can be skipped when resuming
+    assert np.array_equal(np.setdiff1d(np.arange(8), store.get_completed_runs()), [6, 7])
+
+    store.clear()
+    assert store.load()['runs'] == 0
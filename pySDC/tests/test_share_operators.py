@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+
+from pySDC.helpers.stats_helper import get_sorted
+from pySDC.implementations.collocation_classes.gauss_radau_right import CollGaussRadau_Right
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD import heat1d
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+
+
+def get_controller(share_operators, num_procs=4):
+    """
+    Set up PFASST for the heat equation with or without sharing the operators between the steps
+    """
+    level_params = dict()
+    level_params['restol'] = 1E-10
+    level_params['dt'] = 0.1
+
+    sweeper_params = dict()
+    sweeper_params['collocation_class'] = CollGaussRadau_Right
+    sweeper_params['num_nodes'] = [3, 2]
+    sweeper_params['QI'] = 'LU'
+
+    problem_params = dict()
+    problem_params['nu'] = 0.1
+    problem_params['freq'] = 4
+    problem_params['nvars'] = [63, 31]
+
+    description = dict()
+    description['problem_class'] = heat1d
+    description['problem_params'] = problem_params
+    description['sweeper_class'] = generic_implicit
+    description['sweeper_params'] = sweeper_params
+    description['level_params'] = level_params
+    description['step_params'] = {'maxiter': 50}
+    description['space_transfer_class'] = mesh_to_mesh
+
+    controller_params = {'logger_level': 30, 'share_operators': share_operators}
+    return controller_nonMPI(num_procs=num_procs, controller_params=controller_params, description=description)
+
+
+@pytest.mark.parametrize("share_operators", [False, True])
+def test_shared_operators(share_operators):
+    """
+    Check that the operators are shared by reference if requested, while the state of the steps is independent
+    """
+    controller = get_controller(share_operators)
+    S0, S1 = controller.MS[:2]
+
+    for L0, L1 in zip(S0.levels, S1.levels):
+        assert (L0.sweep.coll is L1.sweep.coll) == share_operators
+        assert (L0.sweep.QI is L1.sweep.QI) == share_operators
+        assert (L0.prob.A is L1.prob.A) == share_operators
+        assert L0.prob is not L1.prob
+        assert L0.u is not L1.u
+        assert L0.status is not L1.status
+    assert (S0.base_transfer.space_transfer.Rspace is S1.base_transfer.space_transfer.Rspace) == share_operators
+    assert S0.base_transfer.fine is S0.levels[0] and S1.base_transfer.fine is S1.levels[0]
+
+    # shared matrices cannot be changed by one of the steps
+    assert S0.levels[0].sweep.QI.flags.writeable != share_operators
+    if share_operators:
+        with pytest.raises(ValueError):
+            S0.levels[0].sweep.QI[1, 1] = 0.0
+
+
+def test_shared_operators_opt_in():
+    """
+    Check that only the arrays listed in shared_operators are shared, other arrays of the sweepers are copied
+    """
+    controller = get_controller(True, num_procs=1)
+    S0 = controller.MS[0]
+    for L in S0.levels:
+        L.sweep.scratch = np.zeros(3)
+
+    S1 = controller._controller_nonMPI__copy_step(S0)
+    for L0, L1 in zip(S0.levels, S1.levels):
+        assert L0.sweep.QI is L1.sweep.QI
+        assert L0.sweep.scratch is not L1.sweep.scratch
+        assert L0.sweep.scratch.flags.writeable
+
+
+def test_shared_operators_run():
+    """
+    Check that sharing the operators does not change the results of PFASST
+    """
+    results = []
+    for share_operators in [False, True]:
+        controller = get_controller(share_operators)
+        P = controller.MS[0].levels[0].prob
+        uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.8)
+        results.append((uend, get_sorted(stats, type='niter', sortby='time')))
+
+    assert np.allclose(results[0][0], results[1][0], rtol=0, atol=1E-14), 'ERROR: sharing operators changes the result'
+    assert results[0][1] == results[1][1], 'ERROR: sharing operators changes the iteration counts'
@@ -0,0 +1,39 @@
+import pytest
+import numpy as np
+
+from pySDC.implementations.problem_classes.FullSolarSystem import full_solar_system
+from pySDC.implementations.problem_classes.OuterSolarSystem import outer_solar_system
+
+
+def get_reference(P, u):
+    """
+    Sum up the accelerations pair by pair
+    """
+    acc = np.zeros(u.pos.shape)
+    for i in range(u.pos.shape[1]):
+        for j in range(u.pos.shape[1] if not P.params.sun_only else 1):
+            if i != j:
+                dx = u.pos[:, i] - u.pos[:, j]
+                acc[:, i] -= P.G * u.m[j] * dx / np.linalg.norm(dx) ** 3
+    return acc
+
+
+@pytest.mark.parametrize("kernel", ['numpy', 'numba'])
+@pytest.mark.parametrize("sun_only", [False, True])
+@pytest.mark.parametrize("problem_class", [outer_solar_system, full_solar_system])
+def test_accelerations(problem_class, sun_only, kernel):
+    """
+    Check the accelerations, for single and batched evaluation, against summation over all pairs
+    """
+    P = problem_class({'sun_only': sun_only, 'kernel': kernel})
+    U = [P.u_exact(0.0) for _ in range(3)]
+    np.random.seed(0)
+    for k in range(1, len(U)):
+        U[k].pos[:] += np.random.rand(*U[k].pos.shape)
+
+    F = P.eval_f_batch(U, [0.0] * len(U))
+    for u, f_batch in zip(U, F):
+        ref = get_reference(P, u)
+        f = P.eval_f(u, 0.0)
+        assert np.max(np.abs(f - ref)) < 1E-13 * np.max(np.abs(ref)), 'ERROR: accelerations are wrong'
+        assert np.max(np.abs(f_batch - f)) < 1E-13 * np.max(np.abs(ref)), 'ERROR: batched accelerations are wrong'
@@ -239,6 +239,46 @@ def test_mesh_to_mesh_2d_periodic():
         assert abs(orders[p][1] - orders[p][2]) / orders[p][
             1] < 0.115, 'ERROR: did not get expected orders for interpolation, got %s' % str(orders[p])
 
+
+def test_transfer_nodes():
+    """
+    Check that transferring the values at multiple nodes at once gives the same results as one node at a time
+    """
+    from pySDC.core.BaseTransfer import base_transfer
+    from pySDC.implementations.transfer_classes.TransferMesh_FFT import mesh_to_mesh_fft
+    from pySDC.implementations.transfer_classes.TransferMesh_FFT2D import mesh_to_mesh_fft2d
+
+    setups = [(heat1d, {'nu': 0.1, 'freq': 3}, [63, 31], mesh_to_mesh, False),
+              (heat2d_periodic, {'nu': 0.1, 'freq': 2}, [(32, 32), (16, 16)], mesh_to_mesh, True),
+              (advection1d, {'c': 0.1, 'freq': 2}, [64, 32], mesh_to_mesh_fft, True),
+              (heat2d_periodic, {'nu': 0.1, 'freq': 2}, [(32, 32), (16, 16)], mesh_to_mesh_fft2d, True)]
+
+    np.random.seed(0)
+    for problem_class, problem_params, nvars, transfer_class, periodic in setups:
+        fine = problem_class({**problem_params, 'nvars': nvars[0]})
+        coarse = problem_class({**problem_params, 'nvars': nvars[1]})
+        transfer = transfer_class(fine_prob=fine, coarse_prob=coarse, params={'periodic': periodic})
+
+        for source, method, method_nodes in [(fine, transfer.restrict, transfer.restrict_nodes),
+                                             (coarse, transfer.prolong, transfer.prolong_nodes)]:
+            values = []
+            for _ in range(3):
+                values.append(source.dtype_u(source.init))
+                values[-1][:] = np.random.rand(*values[-1].shape)
+
+            transferred = method_nodes(values)
+            assert all(type(me) is mesh for me in transferred)
+            for me, value in zip(transferred, values):
+                assert np.allclose(me, method(value), rtol=0, atol=1E-14), \
+                    f'ERROR: transfer of multiple nodes at once differs for {transfer_class.__name__}'
+
+            # combine nodes with a collocation transfer matrix
+            matrix = np.random.rand(2, 3)
+            combined = base_transfer.combine_nodes(matrix, values, source.dtype_u, source.init)
+            for n in range(2):
+                assert np.allclose(combined[n], sum(matrix[n, m] * values[m] for m in range(3)), rtol=0, atol=1E-14)
+
+
 if __name__ == "__main__":
     test_mesh_to_mesh_1d_dirichlet()
     pass
@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+
+from pySDC.helpers.stats_helper import get_sorted
+from pySDC.implementations.collocation_classes.gauss_radau_right import CollGaussRadau_Right
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD import heat1d
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD_forced import heat1d_forced
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+
+
+def run_heat(stack_nodes, imex, num_procs, nvars, use_workspace=False):
+    """
+    Run the heat equation with either list-based or stacked storage at the nodes
+    """
+    level_params = dict()
+    level_params['restol'] = 1E-10
+    level_params['dt'] = 0.125
+    level_params['stack_nodes'] = stack_nodes
+
+    sweeper_params = dict()
+    sweeper_params['collocation_class'] = CollGaussRadau_Right
+    sweeper_params['num_nodes'] = 3
+    sweeper_params['use_workspace'] = use_workspace
+
+    problem_params = dict()
+    problem_params['nu'] = 0.1
+    problem_params['freq'] = 4
+    problem_params['nvars'] = nvars
+
+    space_transfer_params = dict()
+    space_transfer_params['rorder'] = 2
+    space_transfer_params['iorder'] = 2
+
+    description = dict()
+    description['problem_class'] = heat1d_forced if imex else heat1d
+    description['problem_params'] = problem_params
+    description['sweeper_class'] = imex_1st_order if imex else generic_implicit
+    description['sweeper_params'] = sweeper_params
+    description['level_params'] = level_params
+    description['step_params'] = {'maxiter': 20}
+    description['space_transfer_class'] = mesh_to_mesh
+    description['space_transfer_params'] = space_transfer_params
+
+    controller = controller_nonMPI(num_procs=num_procs, controller_params={'logger_level': 30},
+                                   description=description)
+
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.5)
+
+    return uend, [me[1] for me in get_sorted(stats, type='niter', sortby='time')]
+
+
+@pytest.mark.parametrize("imex", [True, False])
+@pytest.mark.parametrize("num_procs, nvars", [(1, 63), (4, [63, 31])])
+def test_stacked_nodes(imex, num_procs, nvars):
+    """
+    Check that stacking the values at the nodes gives the same results as the list-based storage
+    """
+    uend_list, niter_list = run_heat(False, imex, num_procs, nvars)
+    uend_stack, niter_stack = run_heat(True, imex, num_procs, nvars)
+
+    assert niter_list == niter_stack, 'ERROR: got different iteration counts, %s vs. %s' % (niter_list, niter_stack)
+    assert np.allclose(uend_list, uend_stack, rtol=0, atol=1E-12), 'ERROR: stacked nodes change the solution'
+
+
+@pytest.mark.parametrize("imex", [True, False])
+@pytest.mark.parametrize("stack_nodes", [True, False])
+def test_sweeper_workspace(imex, stack_nodes):
+    """
+    Check that sweeping with the preallocated workspace gives the same results as the standard sweep
+    """
+    uend, niter = run_heat(stack_nodes, imex, 4, [63, 31])
+    uend_work, niter_work = run_heat(stack_nodes, imex, 4, [63, 31], use_workspace=True)
+
+    assert niter == niter_work, 'ERROR: got different iteration counts, %s vs. %s' % (niter, niter_work)
+    assert np.allclose(uend, uend_work, rtol=0, atol=1E-12), 'ERROR: workspace changes the solution'
@@ -0,0 +1,89 @@
+import pytest
+import numpy as np
+
+from pySDC.helpers.stats_helper import StatsStore, Entry, filter_stats, sort_stats, get_sorted, get_list_of_types
+
+
+def get_stats():
+    """
+    Fill a store with some entries, including restarted steps and overwritten values
+    """
+    np.random.seed(0)
+    stats = StatsStore()
+    for time in np.linspace(0, 1, 11):
+        for process in range(2):
+            for level in range(2):
+                for iter in range(3):
+                    stats.append(process=process, time=time, level=level, iter=iter, sweep=1, type='residual',
+                                 value=np.random.rand())
+            stats.append(process=process, time=time, level=-1, iter=-1, sweep=-1, type='niter',
+                         value=np.random.randint(10))
+        stats.append(process=0, time=time, level=-1, iter=-1, sweep=-1, type='recomputed',
+                     value=bool(np.random.randint(2)))
+
+    # overwrite a value
+    stats.append(process=0, time=0.0, level=-1, iter=-1, sweep=-1, type='niter', value=42)
+    return stats
+
+
+def test_stats_store_dict_api():
+    """
+    Check that the store can still be used like the dictionary of statistics
+    """
+    stats = get_stats()
+    stats_dict = dict(stats)
+
+    assert len(stats) == len(stats_dict) == 11 * (2 * (2 * 3 + 1) + 1)
+    assert stats[Entry(process=0, time=0.0, level=-1, iter=-1, sweep=-1, type='niter')] == 42
+    assert all(isinstance(k, Entry) for k in stats.keys())
+    assert list(stats.values()) == list(stats_dict.values())
+
+    key = Entry(process=1, time=1.0, level=-1, iter=-1, sweep=-1, type='niter')
+    stats[key] += 1
+    assert stats[key] == stats_dict[key] + 1
+
+    del stats[key]
+    assert key not in stats
+    assert len(stats) == len(stats_dict) - 1
+
+
+@pytest.mark.parametrize("recomputed", [None, True, False])
+def test_stats_store_queries(recomputed):
+    """
+    Check that the vectorized queries give the same results as the ones for dictionaries
+    """
+    stats = get_stats()
+    stats_dict = dict(stats)
+
+    assert get_list_of_types(stats) == get_list_of_types(stats_dict) == ['residual', 'niter', 'recomputed']
+
+    queries = [{'type': 'niter'}, {'type': 'residual', 'level': 1}, {'type': 'residual', 'process': 1, 'iter': 2},
+               {'time': 0.5}, {}]
+    for query in queries:
+        for sortby in ['time', 'process', 'iter']:
+            res = get_sorted(stats, recomputed=recomputed, sortby=sortby, **query)
+            res_dict = get_sorted(stats_dict, recomputed=recomputed, sortby=sortby, **query)
+            assert res == res_dict, f'ERROR: got different results for {query} sorted by {sortby}'
+
+        filtered = filter_stats(stats, recomputed=recomputed, **query)
+        assert isinstance(filtered, StatsStore)
+        assert dict(filtered) == filter_stats(stats_dict, recomputed=recomputed, **query)
+
+    assert sort_stats(stats, sortby='level') == sort_stats(stats_dict, sortby='level')
+
+
+def test_stats_store_columns():
+    """
+    Check that the columns are typed arrays, which are widened if needed and stay up to date after changes
+    """
+    stats = get_stats()
+    assert stats.column('time').dtype == np.float64
+    assert stats.column('iter').dtype == np.int64
+
+    key = Entry(process=0, time=0.0, level=0, iter=0, sweep=1, type='residual')
+    del stats[key]
+    stats.append(process=None, time=None, level=0, iter=7, sweep=1, type='residual', value=1.0)
+    assert key not in stats
+    assert stats.column('time').dtype == object
+    assert len(stats.column('time')) == len(stats)
+    assert get_sorted(stats, type='residual', iter=7, sortby='process') == [(None, 1.0)]
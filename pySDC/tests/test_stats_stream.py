@@ -0,0 +1,147 @@
+import pytest
+import numpy as np
+
+from pySDC.helpers.stats_helper import StatsStore, get_sorted, get_list_of_types
+from pySDC.helpers.stats_stream import StatsWriter, StatsFile
+from pySDC.implementations.collocation_classes.gauss_radau_right import CollGaussRadau_Right
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.problem_classes.HeatEquation_1D_FD import heat1d
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+
+
+def run_heat(stats_file=None, background=False):
+    """
+    Run the heat equation with statistics in memory or streamed to a file
+    """
+    level_params = dict()
+    level_params['restol'] = 1E-10
+    level_params['dt'] = 0.1
+
+    sweeper_params = dict()
+    sweeper_params['collocation_class'] = CollGaussRadau_Right
+    sweeper_params['num_nodes'] = 3
+    sweeper_params['QI'] = 'LU'
+
+    problem_params = dict()
+    problem_params['nu'] = 0.1
+    problem_params['freq'] = 4
+    problem_params['nvars'] = 63
+
+    description = dict()
+    description['problem_class'] = heat1d
+    description['problem_params'] = problem_params
+    description['sweeper_class'] = generic_implicit
+    description['sweeper_params'] = sweeper_params
+    description['level_params'] = level_params
+    description['step_params'] = {'maxiter': 50}
+
+    controller_params = {'logger_level': 30, 'stats_file': stats_file, 'stats_chunk_size': 7,
+                         'stats_background_writer': background}
+    controller = controller_nonMPI(num_procs=2, controller_params=controller_params, description=description)
+
+    P = controller.MS[0].levels[0].prob
+    _, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.6)
+
+    return stats
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_streamed_run(tmp_path, background):
+    """
+    Check that streaming the statistics of a run to a file gives the same results as keeping them in memory
+    """
+    stats = run_heat()
+    stats_file = run_heat(stats_file=str(tmp_path / 'stats.npy'), background=background)
+
+    assert isinstance(stats_file, StatsFile)
+    assert len(stats) == len(stats_file)
+    assert get_list_of_types(stats) == get_list_of_types(stats_file)
+
+    # timings differ between the runs
+    for type in [me for me in get_list_of_types(stats) if not me.startswith('timing')]:
+        for sortby in ['time', 'iter']:
+            assert get_sorted(stats, type=type, sortby=sortby) == get_sorted(stats_file, type=type, sortby=sortby), \
+                f'ERROR: got different {type} from the file'
+    assert get_sorted(stats, type='residual_post_iteration', process=1, iter=2) == \
+        get_sorted(stats_file, type='residual_post_iteration', process=1, iter=2)
+
+
+def test_stats_writer(tmp_path):
+    """
+    Check that values of all kinds and entries written multiple times are read back correctly
+    """
+    fname = str(tmp_path / 'stats.npy')
+    writer = StatsWriter(fname, chunk_size=3)
+    reference = StatsStore()
+
+    values = [1, 2.5, True, None, np.arange(3), 'text', 3.0, 7]
+    for i, value in enumerate(values):
+        for store in [writer, reference]:
+            store.append(process=i % 2, time=0.1 * i, level=0, iter=i, sweep=1, type=f'type{i % 3}', value=value)
+
+    # overwrite an entry which has already been written
+    for store in [writer, reference]:
+        store.append(process=0, time=0.0, level=0, iter=0, sweep=1, type='type0', value=42)
+
+    # single keys give the latest value without removing duplicates
+    stats = writer.read()
+    assert len(stats) == len(reference) + 1
+    assert stats[(0, 0.0, 0, 0, 1, 'type0')] == 42
+    assert np.all(stats[(0, 0.4, 0, 4, 1, 'type1')] == np.arange(3))
+    assert stats[(1, 0.5, 0, 5, 1, 'type2')] == 'text'
+    assert (1, 0.5, 0, 5, 1, 'type0') not in stats
+    assert (0, None, 0, 0, 1, 'type0') not in stats
+
+    stats = writer.read(unique=True)
+    assert np.all(np.load(fname, mmap_mode='r')['iter'] == [0, 1, 2, 3, 4, 5, 6, 7, 0])
+    assert len(stats) == len(reference)
+    for (key, value), (key_ref, value_ref) in zip(sorted(stats.items()), sorted(reference.items())):
+        assert key == key_ref
+        assert type(value) == type(value_ref)
+        assert np.all(value == value_ref), f'ERROR: got {value} instead of {value_ref} for {key}'
+
+    with pytest.raises(TypeError):
+        stats.append(process=0, time=0.0, level=0, iter=0, sweep=1, type='type0', value=1)
+
+    writer.close()
+
+
+def test_stats_writer_increment(tmp_path):
+    """
+    Check that counters are correct if other entries are written in between and after reading the file
+    """
+    fname = str(tmp_path / 'stats.npy')
+    writer = StatsWriter(fname, chunk_size=2)
+
+    for i in range(5):
+        writer.increment(process=0, time=None, level=0, iter=0, sweep=0, type='counter', value=1)
+        writer.append(process=0, time=0.1 * i, level=0, iter=i, sweep=0, type='other', value=i)
+
+    assert get_sorted(writer.read(unique=True), type='counter') == [(None, 5)]
+    assert writer.read()[(0, None, 0, 0, 0, 'counter')] == 5
+
+    writer.increment(process=0, time=None, level=0, iter=0, sweep=0, type='counter', value=2)
+    writer.close()
+
+    stats = writer.read(unique=True)
+    assert get_sorted(stats, type='counter') == [(None, 7)]
+    assert get_sorted(stats, type='other', sortby='iter') == [(i, i) for i in range(5)]
+
+
+def test_stats_file_objects(tmp_path):
+    """
+    Check that values which are no scalars are read from their offsets without unpickling the other objects
+    """
+    fname = str(tmp_path / 'stats.npy')
+    writer = StatsWriter(fname, chunk_size=2)
+    for i in range(5):
+        writer.append(process=0, time=0.1 * i, level=0, iter=i, sweep=0, type='object', value=np.arange(i + 1))
+    writer.close()
+
+    # corrupt the first object, which must not be read when asking for the others
+    with open(StatsWriter.objects_fname(fname), 'r+b') as fh:
+        fh.write(b'\x00')
+
+    stats = writer.read()
+    assert np.all(stats[(0, 0.1 * 3, 0, 3, 0, 'object')] == np.arange(4))
+    assert [len(me) for me in stats.get_values(stats.rows('object')[1:])] == [2, 3, 4, 5]
@@ -0,0 +1,93 @@
+import pytest
+import numpy as np
+import scipy.sparse as sp
+
+from pySDC.core.Problem import StencilOperator
+from pySDC.implementations.problem_classes.AdvectionEquation_ND_FD_periodic import advectionNd_periodic
+from pySDC.implementations.problem_classes.AllenCahn_2D_FD import allencahn_semiimplicit
+from pySDC.implementations.problem_classes.HeatEquation_ND_FD_forced_periodic import heatNd_periodic
+
+
+def get_periodic_matrix(stencil, offsets, n, ndim):
+    """
+    Assemble the periodic FD matrix for a 1D stencil on an n^ndim grid independently of StencilOperator
+    """
+    A1 = sp.csc_matrix((n, n))
+    for coeff, offset in zip(stencil, offsets):
+        A1 += coeff * sp.eye(n, k=offset)
+        if offset != 0:
+            # wrap around for periodic boundaries
+            A1 += coeff * sp.eye(n, k=offset - np.sign(offset) * n)
+
+    A = sp.csc_matrix((n ** ndim, n ** ndim))
+    for axis in range(ndim):
+        A += sp.kron(sp.kron(sp.eye(n ** axis), A1), sp.eye(n ** (ndim - axis - 1)))
+    return A
+
+
+@pytest.mark.parametrize("shape", [(16,), (8, 6), (4, 6, 5)])
+@pytest.mark.parametrize("derivative, order, type", [(1, 2, 'center'), (1, 5, 'backward'), (2, 4, 'center')])
+def test_apply(shape, derivative, order, type):
+    """
+    Check that applying the operator matrix-free and the assembled matrix agree with shifting the data by np.roll
+    """
+    operator = StencilOperator.from_derivative(shape, derivative=derivative, order=order, type=type, factor=0.3)
+
+    u = np.random.default_rng(0).random(shape)
+    reference = sum(coeff * np.roll(u, -step, axis=axis) for axis in range(len(shape))
+                    for coeff, step in zip(operator.coeff, operator.steps))
+    assert sp.issparse(operator.matrix)
+    assert np.allclose(operator.apply(u), reference, rtol=0, atol=1e-12)
+    assert np.allclose(operator.dot(u.flatten()), reference.flatten(), rtol=0, atol=1e-12)
+    assert np.allclose(operator.matrix.dot(u.flatten()), reference.flatten(), rtol=0, atol=1e-12)
+
+    # the eigenvalues are used by the FFT-based solvers, they have to match the eigenvalues of the matrix
+    eigenvalues = np.fft.rfftn(operator.apply(u)) / np.fft.rfftn(u)
+    assert np.allclose(operator.symbol, eigenvalues, rtol=0, atol=1e-10)
+
+
+@pytest.mark.parametrize("ndim", [1, 2, 3])
+def test_heat_and_advection(ndim):
+    """
+    Check that the problem classes with the matrix-free operators give the same right-hand side and solutions as the
+    sparse matrices assembled from the hard-coded stencils used before
+    """
+    nvars = tuple([16] * ndim)
+    problems = [heatNd_periodic({'nvars': nvars, 'ndim': ndim, 'nu': 1.0, 'freq': tuple([2] * ndim), 'order': 4,
+                                 'solver_type': 'CG', 'lintol': 1e-12, 'liniter': 100}),
+                advectionNd_periodic({'nvars': nvars, 'ndim': ndim, 'c': 1.0, 'freq': tuple([2] * ndim), 'order': 2,
+                                      'type': 'center', 'solver_type': 'GMRES', 'lintol': 1e-12,
+                                      'liniter': 100})]
+    dx = 1.0 / nvars[0]
+    laplace = get_periodic_matrix([-1 / 12, 4 / 3, -5 / 2, 4 / 3, -1 / 12], [-2, -1, 0, 1, 2], nvars[0], ndim)
+    grad = get_periodic_matrix([-1.0, 1.0], [-1, 1], nvars[0], ndim)
+    matrices = [laplace / dx ** 2, -grad / (2 * dx)]
+
+    for prob, A in zip(problems, matrices):
+        assert abs(prob.A - A).max() < 1e-8
+
+        u = prob.u_exact(0.0)
+        f = prob.eval_f(u, 0.0)
+        fu = f.impl if hasattr(f, 'impl') else f
+        assert np.allclose(fu, A.dot(u.flatten()).reshape(nvars), rtol=0, atol=1e-10)
+
+        rhs = u.copy()
+        v = prob.solve_system(rhs, 0.1, u, 0.0)
+        residual = (v.flatten() - 0.1 * A.dot(v.flatten())) - rhs.flatten()
+        assert np.linalg.norm(residual, np.inf) < 1e-8, 'ERROR: the matrix-free linear solve did not converge'
+
+
+def test_allencahn():
+    """
+    Check the matrix-free operator of Allen-Cahn against the assembled FD matrix used before
+    """
+    nvars = (32, 32)
+    prob = allencahn_semiimplicit({'nvars': nvars, 'nu': 2, 'eps': 0.04, 'newton_maxiter': 100,
+                                   'newton_tol': 1e-12, 'lin_tol': 1e-12, 'lin_maxiter': 100, 'radius': 0.25})
+
+    A1 = sp.diags([1, 1, -2, 1, 1], [-nvars[0] + 1, -1, 0, 1, nvars[0] - 1], shape=(nvars[0], nvars[0]))
+    A = (sp.kron(A1, sp.eye(nvars[1])) + sp.kron(sp.eye(nvars[0]), A1)) / prob.dx ** 2
+    assert abs(prob.A - A).max() < 1e-10
+
+    u = prob.u_exact(0.0)
+    assert np.allclose(prob.eval_f(u, 0.0).impl, A.dot(u.flatten()).reshape(nvars), rtol=0, atol=1e-8)